@@ -7,6 +7,7 @@ import webbrowser
 import pygame as pg
 
 from base import Button, Alert, Label, Anchor, WidgetsGroup
+from base.fonts import get_font
 from database.field_types import Resolution
 from utils import load_image
 
@@ -40,7 +41,7 @@ class MemberWidget(WidgetsGroup):
             y=0,
             text=name,
             color=(pg.Color("#f0ce69") if site else pg.Color("white")),
-            font=pg.font.Font(font, font_size),
+            font=get_font(font, font_size),
             callback=lambda event: (webbrowser.open_new_tab(site) if site else ...),
         )
 
@@ -50,7 +51,7 @@ class MemberWidget(WidgetsGroup):
             x=self.name_button.rect.right,
             y=0,
             text=f" - {role}",
-            font=pg.font.Font(font, font_size),
+            font=get_font(font, font_size),
         )
 
 
@@ -82,7 +83,7 @@ class AppInfoAlert(Alert):
             y=0,
             width=self.rect.width,
             text="Об игре",
-            font=pg.font.Font(font, font_size),
+            font=get_font(font, font_size),
             anchor=Anchor.center,
         )
 
@@ -103,7 +104,7 @@ class AppInfoAlert(Alert):
             y=lambda obj: 0,
             text="Dungeon of Masters",
             color=pg.Color("#b9a66d"),
-            font=pg.font.Font(font, font_size),
+            font=get_font(font, font_size),
         )
         self.version_label = Label(
             self,
@@ -111,7 +112,7 @@ class AppInfoAlert(Alert):
             x=self.icon_label.rect.right + 20,
             y=lambda obj: 0,
             text=f"Версия: {os.environ['VERSION']}",
-            font=pg.font.Font(font, font_size),
+            font=get_font(font, font_size),
         )
         block_height = self.name_label.rect.h + self.version_label.rect.h + 5
         self.name_label.y = lambda obj: self.icon_label.rect.y + round(
@@ -162,7 +163,7 @@ class AppInfoAlert(Alert):
             y=self.wyvverna.rect.bottom + 30,
             text="Страница проекта",
             color=pg.Color("#f0ce69"),
-            font=pg.font.Font(font, font_size),
+            font=get_font(font, font_size),
             callback=lambda event: webbrowser.open_new_tab(
                 "https://github.com/AlexDev-py/DOM"
             ),
@@ -178,7 +179,7 @@ class AppInfoAlert(Alert):
             text="Закрыть",
             padding=5,
             active_background=pg.Color(222, 222, 222, 100),
-            font=pg.font.Font(font, font_size),
+            font=get_font(font, font_size),
             border_width=2,
             callback=lambda event: self.hide(),
         )
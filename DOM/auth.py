@@ -11,7 +11,8 @@ import typing as ty
 
 import pygame as pg
 
-from base import Group, Button, Label, WidgetsGroup, InputBox
+from base import Group, Button, Label, WidgetsGroup, InputBox, FrameClock
+from base.fonts import get_font
 from utils import (
     FinishStatus,
     check_password,
@@ -50,7 +51,7 @@ class Login(WidgetsGroup):
             text="Авторизация",
             padding=7,
             border_width=3,
-            font=pg.font.Font(font, 30),
+            font=get_font(font, 30),
         )
 
         self.login = InputBox(
@@ -61,7 +62,7 @@ class Login(WidgetsGroup):
             description="Имя пользователя",
             width=self.rect.width * 0.9,
             padding=5,
-            font=pg.font.Font(font, 25),
+            font=get_font(font, 25),
             inactive_border_color=pg.Color("#b9a66d"),
             active_border_color=pg.Color("#f0ce69"),
             border_width=2,
@@ -76,7 +77,7 @@ class Login(WidgetsGroup):
             description="Пароль",
             width=self.rect.width * 0.9,
             padding=5,
-            font=pg.font.Font(font, 20),
+            font=get_font(font, 20),
             inactive_border_color=pg.Color("#b9a66d"),
             active_border_color=pg.Color("#f0ce69"),
             border_width=2,
@@ -92,7 +93,7 @@ class Login(WidgetsGroup):
             text="Войти",
             padding=5,
             active_background=pg.Color(222, 222, 222, 100),
-            font=pg.font.Font(font, 17),
+            font=get_font(font, 17),
             border_width=2,
             callback=lambda event: self.auth(parent),
         )
@@ -105,7 +106,7 @@ class Login(WidgetsGroup):
             text="зарегистрироваться",
             padding=5,
             color=pg.Color("#f0ce69"),
-            font=pg.font.Font(font, 13),
+            font=get_font(font, 13),
             callback=lambda event: parent.show_signup_group(),
         )
 
@@ -159,7 +160,7 @@ class Signup(WidgetsGroup):
             text="Регистрация",
             border_width=3,
             padding=7,
-            font=pg.font.Font(font, 30),
+            font=get_font(font, 30),
         )
 
         self.login = InputBox(
@@ -170,7 +171,7 @@ class Signup(WidgetsGroup):
             description="Имя пользователя",
             width=self.rect.width * 0.9,
             padding=5,
-            font=pg.font.Font(font, 20),
+            font=get_font(font, 20),
             inactive_border_color=pg.Color("#b9a66d"),
             active_border_color=pg.Color("#f0ce69"),
             border_width=2,
@@ -185,7 +186,7 @@ class Signup(WidgetsGroup):
             description="Пароль",
             width=self.rect.width * 0.9,
             padding=5,
-            font=pg.font.Font(font, 20),
+            font=get_font(font, 20),
             inactive_border_color=pg.Color("#b9a66d"),
             active_border_color=pg.Color("#f0ce69"),
             border_width=2,
@@ -201,7 +202,7 @@ class Signup(WidgetsGroup):
             description="Повторите пароль",
             width=self.rect.width * 0.9,
             padding=5,
-            font=pg.font.Font(font, 20),
+            font=get_font(font, 20),
             inactive_border_color=pg.Color("#b9a66d"),
             active_border_color=pg.Color("#f0ce69"),
             border_width=2,
@@ -217,7 +218,7 @@ class Signup(WidgetsGroup):
             text="Создать аккаунт",
             padding=5,
             active_background=pg.Color(222, 222, 222, 100),
-            font=pg.font.Font(font, 17),
+            font=get_font(font, 17),
             border_width=2,
             callback=lambda event: self.auth(parent),
         )
@@ -230,7 +231,7 @@ class Signup(WidgetsGroup):
             text="авторизоваться",
             padding=5,
             color=pg.Color("#f0ce69"),
-            font=pg.font.Font(font, 13),
+            font=get_font(font, 13),
             callback=lambda event: parent.show_login_group(),
         )
 
@@ -278,6 +279,16 @@ class AuthScreen(Group):
         self.screen = pg.display.set_mode(self.SIZE)
         pg.display.set_caption("DOM Auth")
 
+        # Фон окна
+        self._background = pg.Surface(self.SIZE)
+        self._background.fill("#152622")
+        pg.draw.rect(
+            self._background,
+            "#b9a66d",
+            pg.Rect(5, 5, self.SIZE[0] - 10, self.SIZE[1] - 10),
+            width=3,
+        )
+
         self.login_group = Login(self)
         self.signup_group = Signup(self)
         self.show_login_group()
@@ -292,6 +303,7 @@ class AuthScreen(Group):
             self.error_alert.show_message(error)
 
         self.running = True
+        self.clock = FrameClock()
         self.finish_status: str = FinishStatus.close
 
     def show_login_group(self) -> None:
@@ -332,26 +344,21 @@ class AuthScreen(Group):
         :return: FinishStatus.
         """
         while self.running:  # Цикл окна
-            for event in pg.event.get():
+            for event in self.clock.events():
                 if event.type == pg.QUIT:
                     self.terminate()
                 self.handle_event(event)
-            self.render()
+            self.clock.tick(self.render())
         return self.finish_status
 
-    def render(self) -> None:
+    def render(self) -> list[pg.Rect]:
         """
         Отрисовка интерфейса.
+        :return: Перерисованные области экрана.
         """
-        self.screen.fill("#152622")
-        pg.draw.rect(
-            self.screen,
-            "#b9a66d",
-            pg.Rect(5, 5, self.SIZE[0] - 10, self.SIZE[1] - 10),
-            width=3,
-        )
-        self.draw(self.screen)
-        pg.display.flip()
+        rects = self.draw(self.screen, self._background)
+        pg.display.update(rects)
+        return rects
 
     def terminate(self) -> None:
         """
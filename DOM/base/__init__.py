@@ -1,5 +1,6 @@
 from .anchor import Anchor
 from .group import Group
+from .loop import FrameClock
 from .thread import Thread
 
 from .widgets import (
@@ -11,5 +12,6 @@ from .widgets import (
     WidgetsGroup,
     Label,
     Line,
+    ListView,
     Text,
 )
@@ -0,0 +1,75 @@
+"""
+
+Атлас текстур.
+
+Мелкие изображения (плитки локации, иконки) копируются в одну поверхность
+вместо того, чтобы храниться отдельными поверхностями.
+Изображения сортируются по высоте и раскладываются по полкам - строкам
+ограниченной ширины. Вместо исходных изображений используются
+подповерхности атласа, которые не копируют пиксели.
+
+"""
+
+from __future__ import annotations
+
+import typing as ty
+
+import pygame as pg
+
+K = ty.TypeVar("K")
+
+
+class TextureAtlas(ty.Generic[K]):
+    def __init__(
+        self,
+        images: ty.Mapping[K, pg.Surface],
+        max_width: int = 2048,
+        padding: int = 1,
+    ):
+        """
+        Атлас текстур.
+        :param images: Изображения: {<ключ>: <изображение>}.
+        :param max_width: Максимальная ширина атласа.
+            Изображение шире этого значения занимает отдельную полку.
+        :param padding: Расстояние между изображениями.
+        """
+        # {<ключ>: <область в атласе>}
+        self._rects: dict[K, pg.Rect] = {}
+        x = y = shelf_height = width = 0
+        for key, image in sorted(
+            images.items(), key=lambda item: -item[1].get_height()
+        ):
+            if x and x + image.get_width() > max_width:
+                # Новая полка
+                x, y, shelf_height = 0, y + shelf_height + padding, 0
+            self._rects[key] = pg.Rect((x, y), image.get_size())
+            x += image.get_width() + padding
+            shelf_height = max(shelf_height, image.get_height())
+            width = max(width, x - padding)
+
+        self.surface = pg.Surface(
+            (max(width, 1), max(y + shelf_height, 1)), pg.SRCALPHA
+        ).convert_alpha()
+        self.surface.fill((0, 0, 0, 0))
+        self._images: dict[K, pg.Surface] = {}
+        for key, rect in self._rects.items():
+            # Атлас прозрачный, поэтому максимум копирует пиксели без смешивания
+            self.surface.blit(images[key], rect, special_flags=pg.BLEND_RGBA_MAX)
+            self._images[key] = self.surface.subsurface(rect)
+
+    def __getitem__(self, key: K) -> pg.Surface:
+        """
+        :param key: Ключ изображения.
+        :return: Подповерхность атласа с изображением.
+        """
+        return self._images[key]
+
+    def __contains__(self, key: K) -> True | False:
+        return key in self._images
+
+    def get_rect(self, key: K) -> pg.Rect:
+        """
+        :param key: Ключ изображения.
+        :return: Область изображения в атласе.
+        """
+        return self._rects[key].copy()
@@ -0,0 +1,61 @@
+"""
+
+Реестр шрифтов.
+
+Создание pg.font.Font каждый раз заново читает файл шрифта.
+Реестр загружает каждую пару (путь, размер) один раз
+и возвращает общий экземпляр шрифта.
+
+"""
+
+from __future__ import annotations
+
+import threading
+import typing as ty
+
+import pygame as pg
+from loguru import logger
+
+from .tracing import TRACE
+
+_fonts: dict[tuple[str | None, int], pg.font.Font] = {}  # Загруженные шрифты
+_lock = threading.Lock()
+
+
+def get_font(path: str | None, size: int | float) -> pg.font.Font:
+    """
+    Возвращает шрифт из реестра или загружает его.
+    :param path: Путь к файлу шрифта. None - шрифт pygame по умолчанию.
+    :param size: Размер шрифта.
+    :return: Общий экземпляр шрифта.
+    """
+    key = (path, int(size))
+    if (font := _fonts.get(key)) is None:
+        with _lock:
+            if (font := _fonts.get(key)) is None:
+                if TRACE:
+                    logger.opt(colors=True).trace(
+                        "Загрузка шрифта <y>{path}</y> <c>{size}</c>",
+                        path=path,
+                        size=key[1],
+                    )
+                _fonts[key] = font = pg.font.Font(*key)
+    return font
+
+
+def preload(path: str | None, sizes: ty.Iterable[int | float]) -> None:
+    """
+    Заранее загружает шрифт нужных размеров.
+    :param path: Путь к файлу шрифта.
+    :param sizes: Размеры шрифта.
+    """
+    for size in sizes:
+        get_font(path, size)
+
+
+def clear() -> None:
+    """
+    Очищает реестр.
+    """
+    with _lock:
+        _fonts.clear()
@@ -11,11 +11,19 @@ from abc import ABC
 import pygame as pg
 from loguru import logger
 
+from . import layout
+from .router import EventRouter
 from .object import Object
+from .tracing import TRACE
 from .widget import BaseWidget
 
 
 class Group(Object, ABC):
+    event_types = frozenset()
+    # Получатели событий. Собираются заново при изменении состава группы
+    _router: EventRouter | None = None
+    _router_version: int = 0
+
     def __init__(
         self,
         parent: Group | None = None,
@@ -32,26 +40,43 @@ class Group(Object, ABC):
         Object.__init__(self, parent, name, hidden=hidden)
 
         self._objects: list[Object] = []
+        # Области экрана, которые занимали удаленные объекты
+        self._dirty_rects: list[pg.Rect] = []
 
     def add(self, *objects: Object) -> None:
         """
         Добавляет объекты в группу.
         :param objects: Объекты.
         """
+        # Сначала присоединяем все объекты, затем обновляем каждый по одному разу
+        added: list[Object] = []
+        present = set(map(id, self._objects))
         for obj in objects:
             if isinstance(obj, Object):
-                if obj not in self._objects:
-                    logger.opt(colors=True).trace(f"adding {obj} to {self}")
+                if id(obj) not in present:
+                    if TRACE:
+                        logger.opt(colors=True).trace(f"adding {obj} to {self}")
+                    present.add(id(obj))
                     obj.parent = self
                     self._objects.append(obj)
-                    obj.update()
-        parent = self
-        while parent:
-            if isinstance(parent, BaseWidget):
-                BaseWidget.update(parent)
-            else:
-                parent.update()
-            parent = parent.parent
+                    added.append(obj)
+        if added:
+            self._reset_router()
+            layout.forget(self)
+        if layout.held(self):
+            return
+        with layout.layout_pass():
+            for obj in added:
+                obj.update()
+
+            # Каждый из родителей перерисовывается один раз
+            parent = self
+            while parent:
+                if isinstance(parent, BaseWidget):
+                    BaseWidget.update(parent)
+                else:
+                    parent.update()
+                parent = parent.parent
 
     def remove(self, *objects: Object) -> None:
         """
@@ -60,37 +85,116 @@ class Group(Object, ABC):
         """
         for obj in objects:
             if obj in self._objects:
-                logger.opt(colors=True).trace(f"removing {obj} from {self}")
+                if TRACE:
+                    logger.opt(colors=True).trace(f"removing {obj} from {self}")
                 self._objects.remove(obj)
-        self.update()
+                self._dirty_rects.extend(obj.get_dirty_rects(hidden=True))
+        self._reset_router()
+        layout.forget(self)
+        layout.invalidate(self)
 
     def update(self, *args, **kwargs) -> None:
         """
         Обновляет все объекты в группе.
         """
-        logger.opt(colors=True).trace(f"update {self}")
-        for widget in self._objects:
-            if not isinstance(widget, Group):
-                widget.update(*args, **kwargs)
+        if TRACE:
+            logger.opt(colors=True).trace(f"update {self}")
+        with layout.layout_pass():
+            for widget in self._objects:
+                if not isinstance(widget, Group):
+                    widget.update(*args, **kwargs)
 
-    def draw(self, surface: pg.Surface) -> None:
+    def draw(
+        self, surface: pg.Surface, background: pg.Surface | None = None
+    ) -> list[pg.Rect]:
         """
         Отображает все виджеты, входящие в группу.
+        Если передан фон, то перерисовываются только изменившиеся области.
         :param surface: Поверхность.
+        :param background: Фон, которым закрашиваются изменившиеся области.
+        :return: Список перерисованных областей поверхности.
         """
-        if not self.hidden:
-            for widget in self._objects:
-                widget.draw(surface)
+        if background is None:
+            if not self.hidden:
+                for widget in self._objects:
+                    widget.draw(surface)
+            return [surface.get_clip()]
+
+        full_redraw = self._dirty
+        self._dirty = False
+        rects = self.get_dirty_rects()
+        if full_redraw:
+            rects = [surface.get_rect()]
+
+        rects = _merge_rects(rects)
+        for rect in rects:
+            surface.set_clip(rect)
+            surface.blit(background, rect, rect)
+            self.draw(surface)
+        surface.set_clip(None)
+        return rects
+
+    def get_dirty_rects(self, hidden: True | False = False) -> list[pg.Rect]:
+        rects, self._dirty_rects = self._dirty_rects, []
+        hidden = hidden or self.hidden
+        for obj in self._objects.copy():
+            rects.extend(obj.get_dirty_rects(hidden))
+        return rects
 
     def handle_event(self, event: pg.event.Event) -> None:
         """
-        Отправляет событие всем виджетам в группе.
+        Отправляет событие виджетам в группе, которые обрабатывают события этого типа.
         :param event: Событие.
         """
         if self.enabled:
-            for obj in self._objects:
+            for obj in self._get_router().get(event.type):
                 obj.handle_event(event)
 
+    def get_event_types(self) -> frozenset[int] | None:
+        if self.event_types is None:
+            return None
+        if (event_types := self._get_router().get_event_types()) is None:
+            return None
+        return self.event_types | event_types
+
+    def _get_router(self) -> EventRouter:
+        """
+        :return: Таблица получателей событий.
+        """
+        if (router := self._router) is None:
+            version = self._router_version
+            # Группа может быть еще не инициализирована до конца
+            router = EventRouter(list(getattr(self, "_objects", ())))
+            # Состав группы мог измениться в другом потоке, пока таблица собиралась
+            if version == self._router_version:
+                self._router = router
+        return router
+
+    def _reset_router(self) -> None:
+        """
+        Сбрасывает таблицы получателей событий группы и ее родителей.
+        """
+        group = self
+        while group is not None:
+            group._router = None
+            group._router_version += 1
+            group = group.parent
+
     @property
     def objects(self) -> list[Object]:
         return self._objects
+
+
+def _merge_rects(rects: list[pg.Rect]) -> list[pg.Rect]:
+    """
+    Объединяет пересекающиеся области.
+    :param rects: Список областей.
+    :return: Список непересекающихся областей.
+    """
+    merged: list[pg.Rect] = []
+    for rect in rects:
+        rect = rect.copy()
+        while (index := rect.collidelist(merged)) != -1:
+            rect.union_ip(merged.pop(index))
+        merged.append(rect)
+    return merged
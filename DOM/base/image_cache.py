@@ -0,0 +1,95 @@
+"""
+
+Кэш масштабированных изображений.
+
+Иконки врагов, персонажей и предметов масштабируются заново
+при каждом обновлении виджета, хотя размер зависит только от разрешения.
+Кэш хранит готовые поверхности и вытесняет давно неиспользуемые,
+когда их объем превышает заданный.
+
+"""
+
+from __future__ import annotations
+
+import threading
+import typing as ty
+from collections import OrderedDict
+
+import pygame as pg
+
+from .surfaces import get_bytes
+
+if ty.TYPE_CHECKING:
+    # Ключ кэша: (путь к файлу, запрошенный размер, сохранение пропорций)
+    CacheKey = tuple[str, tuple[int | None, int | None], True | False]
+
+
+class ImageCache:
+    def __init__(self, max_bytes: int = 32 * 1024 * 1024):
+        """
+        LRU-кэш масштабированных изображений.
+        :param max_bytes: Максимальный объем хранимых поверхностей в байтах.
+        """
+        self.max_bytes = max_bytes
+        self.hits = 0  # Количество попаданий
+        self.misses = 0  # Количество промахов
+        self.evictions = 0  # Количество вытесненных поверхностей
+
+        self._images: OrderedDict[CacheKey, pg.Surface] = OrderedDict()
+        self._bytes = 0  # Объем хранимых поверхностей
+        self._lock = threading.Lock()
+
+    def get(self, key: CacheKey, loader: ty.Callable[[], pg.Surface]) -> pg.Surface:
+        """
+        Возвращает поверхность из кэша или создает новую.
+        :param key: Параметры загрузки изображения.
+        :param loader: Функция, создающая поверхность при промахе.
+        :return: Поверхность.
+        """
+        with self._lock:
+            if (image := self._images.get(key)) is not None:
+                self._images.move_to_end(key)
+                self.hits += 1
+                return image
+            self.misses += 1
+
+        image = loader()
+        nbytes = get_bytes(image)
+        if nbytes > self.max_bytes:
+            return image
+
+        with self._lock:
+            if (old := self._images.pop(key, None)) is not None:
+                self._bytes -= get_bytes(old)
+            self._images[key] = image
+            self._bytes += nbytes
+            while self._bytes > self.max_bytes:
+                _, evicted = self._images.popitem(last=False)
+                self._bytes -= get_bytes(evicted)
+                self.evictions += 1
+        return image
+
+    def clear(self) -> None:
+        """
+        Очищает кэш и счетчики.
+        """
+        with self._lock:
+            self._images.clear()
+            self._bytes = 0
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> dict[str, int]:
+        """
+        :return: Статистика использования кэша.
+        """
+        return dict(
+            size=len(self._images),
+            bytes=self._bytes,
+            max_bytes=self.max_bytes,
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+        )
+
+
+image_cache = ImageCache()
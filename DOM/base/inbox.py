@@ -0,0 +1,144 @@
+"""
+
+Передача изменений интерфейса в основной поток.
+
+Обработчики событий сервера выполняются в потоке socketio и не должны
+перерисовывать виджеты, пока основной цикл их рисует. Вместо этого они
+кладут вызов во входящую очередь, а основной цикл (FrameClock) выполняет
+накопившиеся вызовы в начале кадра, не дольше заданного времени.
+Оставшиеся вызовы переносятся на следующий кадр.
+
+Вызовы с одинаковым ключом объединяются: в очереди остается один вызов
+с последними аргументами на месте первого, поэтому несколько обновлений
+одного виджета за кадр отрисовываются один раз.
+
+"""
+
+from __future__ import annotations
+
+import itertools
+import threading
+import time
+import typing as ty
+from collections import OrderedDict
+
+from loguru import logger
+
+from . import loop
+
+DEFAULT_BUDGET = 0.008  # Время на выполнение вызовов за кадр (в секундах)
+
+if ty.TYPE_CHECKING:
+    # Вызов: (<функция>, <позиционные аргументы>)
+    Call = tuple[ty.Callable[[...], ty.Any], tuple[...]]
+
+
+class Inbox:
+    def __init__(self, budget: float = DEFAULT_BUDGET):
+        """
+        Очередь вызовов для основного потока.
+        Вызовы можно добавлять из любого потока.
+        :param budget: Время на выполнение вызовов за один кадр в секундах.
+            Хотя бы один вызов выполняется всегда.
+        """
+        self.budget = budget
+        self.posted = 0  # Количество добавленных вызовов
+        self.coalesced = 0  # Количество вызовов, объединенных с ожидающими
+        self.applied = 0  # Количество выполненных вызовов
+        self.deferred = 0  # Количество кадров, не успевших выполнить все вызовы
+
+        # {<ключ>: <вызов>} в порядке добавления
+        self._calls: OrderedDict[ty.Hashable, Call] = OrderedDict()
+        self._counter = itertools.count()  # Ключи вызовов, которые не объединяются
+        self._lock = threading.Lock()
+
+    def post(
+        self,
+        callback: ty.Callable[[...], ty.Any],
+        *args,
+        key: ty.Hashable = None,
+    ) -> None:
+        """
+        Добавляет вызов в очередь.
+        :param callback: Функция.
+        :param args: Позиционные аргументы функции.
+        :param key: Ключ объединения. None - вызов не объединяется с другими.
+        """
+        with self._lock:
+            self.posted += 1
+            if key is None:
+                key = (Inbox, next(self._counter))
+            elif key in self._calls:
+                self.coalesced += 1
+            self._calls[key] = (callback, args)
+        loop.wake()
+
+    def wrap(
+        self,
+        callback: ty.Callable[[...], ty.Any],
+        key: ty.Callable[[...], ty.Hashable] | None = None,
+    ) -> ty.Callable[[...], None]:
+        """
+        Оборачивает обработчик, чтобы он выполнялся в основном потоке.
+        :param callback: Обработчик.
+        :param key: Функция, вычисляющая ключ объединения по аргументам вызова.
+            None - вызовы не объединяются.
+        :return: Функция, добавляющая вызов обработчика в очередь.
+        """
+
+        def post(*args) -> None:
+            self.post(callback, *args, key=None if key is None else key(*args))
+
+        return post
+
+    def run(self, budget: float | None = None) -> int:
+        """
+        Выполняет вызовы, добавленные до начала выполнения.
+        Вызывается в основном потоке.
+        :param budget: Время на выполнение в секундах. По умолчанию - self.budget.
+        :return: Количество выполненных вызовов.
+        """
+        if not self._calls:
+            return 0
+
+        budget = self.budget if budget is None else budget
+        deadline = time.perf_counter() + budget
+        with self._lock:
+            count = len(self._calls)
+
+        applied = 0
+        while applied < count:
+            if applied and time.perf_counter() >= deadline:
+                self.deferred += 1
+                break
+            with self._lock:
+                if not self._calls:
+                    break
+                _, (callback, args) = self._calls.popitem(last=False)
+            try:
+                callback(*args)
+            except Exception:
+                logger.exception(f"Ошибка при выполнении {callback}")
+            applied += 1
+
+        self.applied += applied
+        return applied
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    def stats(self) -> dict[str, int | float]:
+        """
+        :return: Статистика очереди.
+        """
+        return dict(
+            pending=len(self._calls),
+            budget=self.budget,
+            posted=self.posted,
+            coalesced=self.coalesced,
+            applied=self.applied,
+            deferred=self.deferred,
+        )
+
+
+inbox = Inbox()
@@ -0,0 +1,196 @@
+"""
+
+Пакетное обновление виджетов.
+
+Изменение атрибута виджета перерисовывает всю группу, в которой он находится.
+Внутри блока deferred() такие обновления откладываются и выполняются
+по одному разу для каждой группы при выходе из блока.
+
+Объект может задержать обновление всех вложенных в него объектов
+(скрытое диалоговое окно обновляется один раз при показе).
+
+Функции вычисления координат (CordFunction) внутри прохода раскладки
+(layout_pass()) вычисляются повторно, только если изменилось одно из
+положений виджетов, которые функция прочитала. Сохраненные значения
+используются и в следующих проходах. Изменения атрибутов виджета и состава
+группы не отслеживаются по положениям, поэтому сбрасывают сохраненные
+значения объекта и вложенных в него объектов (forget()).
+
+"""
+
+from __future__ import annotations
+
+import threading
+import typing as ty
+from contextlib import contextmanager
+
+if ty.TYPE_CHECKING:
+    import pygame as pg
+
+    from .object import Object
+    from .widget import BaseWidget
+
+    # Прочитанные положения виджетов: {<виджет>: (x, y, ширина, высота), ...}
+    Reads = dict[BaseWidget, tuple[int, int, int, int]]
+
+
+class _State(threading.local):
+    depth: int = 0  # Уровень вложенности блоков deferred
+    pending: dict[int, Object]  # Объекты, ожидающие обновления
+    pass_depth: int = 0  # Уровень вложенности проходов раскладки
+    reads: list[Reads]  # Положения, прочитанные вычисляемыми функциями
+
+    def __init__(self):
+        self.pending = {}
+        self.reads = []
+
+
+_state = _State()
+
+
+@contextmanager
+def deferred() -> ty.Iterator[None]:
+    """
+    Откладывает обновление виджетов до выхода из блока.
+    Действует только в текущем потоке.
+    """
+    _state.depth += 1
+    try:
+        yield
+    finally:
+        _state.depth -= 1
+        if not _state.depth:
+            flush()
+
+
+def invalidate(obj: Object) -> None:
+    """
+    Обновляет объект или откладывает его обновление,
+    если выполнение находится внутри блока deferred().
+    :param obj: Объект.
+    """
+    if _state.depth:
+        _state.pending.setdefault(id(obj), obj)
+    elif not held(obj):
+        obj.update()
+
+
+def flush() -> None:
+    """
+    Выполняет отложенные обновления.
+    """
+    pending = list(_state.pending.values())
+    _state.pending.clear()
+    targets = {id(obj) for obj in pending}
+    with layout_pass():
+        for obj in pending:
+            if not _covered(obj, targets) and not held(obj):
+                obj.update()
+
+
+def held(obj: Object) -> True | False:
+    """
+    :param obj: Объект.
+    :return: Задержал ли обновление объекта он сам или один из его родителей.
+    """
+    while obj is not None:
+        if obj.holds_updates():
+            return True
+        obj = obj.parent
+    return False
+
+
+@contextmanager
+def layout_pass() -> ty.Iterator[None]:
+    """
+    Проход раскладки. Вложенные блоки относятся к внешнему проходу.
+    """
+    _state.pass_depth += 1
+    try:
+        yield
+    finally:
+        _state.pass_depth -= 1
+
+
+def evaluate(obj: BaseWidget, name: str, func: ty.Callable[[BaseWidget], ...]) -> ...:
+    """
+    Вычисляет функцию координаты или размера виджета.
+    Внутри прохода раскладки возвращает сохраненное значение,
+    если не изменились положения виджетов, которые функция прочитала
+    при последнем вычислении.
+    :param obj: Виджет.
+    :param name: Название вычисляемого атрибута.
+    :param func: Функция.
+    :return: Значение функции.
+    """
+    if not _state.pass_depth:
+        return func(obj)
+
+    values = obj.__dict__.setdefault("_layout_values", {})
+    if (entry := values.get(name)) is not None:
+        value, entry_func, reads = entry
+        if entry_func is func and all(
+            tuple(widget._rect) == rect for widget, rect in reads.items()
+        ):
+            _extend_reads(reads)
+            return value
+
+    _state.reads.append({})
+    try:
+        value = func(obj)
+    finally:
+        reads = _state.reads.pop()
+    values[name] = (value, func, reads)
+    _extend_reads(reads)
+    return value
+
+
+def forget(obj: Object) -> None:
+    """
+    Сбрасывает сохраненные значения функций объекта и вложенных в него объектов.
+    Функции виджетов группы могут читать атрибуты группы и ее состав.
+    :param obj: Объект, атрибуты или состав которого изменились.
+    """
+    obj.__dict__.pop("_layout_values", None)
+    for child in obj.__dict__.get("_objects", ()):
+        child.__dict__.pop("_layout_values", None)
+
+
+def track(widget: BaseWidget, rect: pg.Rect) -> None:
+    """
+    Запоминает, что вычисляемая функция прочитала положение виджета.
+    :param widget: Виджет.
+    :param rect: Положение виджета.
+    """
+    if _state.reads:
+        _state.reads[-1].setdefault(widget, tuple(rect))
+
+
+def _extend_reads(reads: Reads) -> None:
+    """
+    Передает прочитанные положения внешней вычисляемой функции.
+    :param reads: Положения, прочитанные вложенной функцией.
+    """
+    if _state.reads:
+        outer = _state.reads[-1]
+        for widget, rect in reads.items():
+            outer.setdefault(widget, rect)
+
+
+def _covered(obj: Object, targets: set[int]) -> True | False:
+    """
+    :param obj: Объект.
+    :param targets: id объектов, которые будут обновлены.
+    :return: True - объект обновится вместе с одним из родителей.
+    """
+    from .group import Group
+    from .widget import BaseWidget
+
+    while (parent := obj.parent) is not None:
+        # Group.update не обновляет вложенные группы, а WidgetsGroup - обновляет
+        if isinstance(obj, Group) and not isinstance(parent, BaseWidget):
+            return False
+        if id(parent) in targets:
+            return True
+        obj = parent
+    return False
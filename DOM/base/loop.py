@@ -0,0 +1,110 @@
+"""
+
+Ограничение частоты кадров основного цикла окна.
+
+Пока на экране что-то меняется или приходят события, цикл работает
+с частотой из конфигурации. Если кадр ничего не перерисовал и событий не было,
+цикл засыпает в pg.event.wait до следующего события, таймера или таймаута.
+Изменение виджета или вызов из другого потока (например, ответ сервера)
+будит цикл.
+
+"""
+
+from __future__ import annotations
+
+import math
+import os
+import threading
+from dataclasses import dataclass
+
+import pygame as pg
+
+from .events import BaseEvent
+from .inbox import inbox
+from .timers import timers
+
+DEFAULT_FPS = 60
+IDLE_FPS = 10  # Частота кадров в простое
+
+
+@dataclass(eq=False)
+class WakeEvent(BaseEvent):
+    """
+    Событие, которым другие потоки будят основной цикл.
+    """
+
+
+_waiting = False  # Ожидает ли основной цикл событий
+
+
+def wake() -> None:
+    """
+    Будит основной цикл, если он ожидает событий.
+    Вызывается при изменении виджета, в основном потоке ничего не делает.
+    """
+    global _waiting
+    if _waiting and threading.current_thread() is not threading.main_thread():
+        _waiting = False
+        WakeEvent().post()
+
+
+class FrameClock:
+    def __init__(self, fps: int | None = None, idle_fps: int = IDLE_FPS):
+        """
+        Часы основного цикла окна.
+        :param fps: Максимальная частота кадров. По умолчанию берется из конфигурации.
+        :param idle_fps: Частота кадров в простое.
+        """
+        self.fps = fps if fps is not None else int(os.environ.get("fps", DEFAULT_FPS))
+        self.idle_fps = idle_fps
+        self.idle = False  # Был ли прошлый кадр пустым
+
+        self._clock = pg.time.Clock()
+        self._has_events = False
+
+    def events(self) -> list[pg.event.Event]:
+        """
+        Выполняет вызовы из других потоков, наступившие таймеры
+        и возвращает накопившиеся события.
+        В простое ждет первого события не дольше одного кадра с частотой idle_fps
+        и не дольше, чем до ближайшего таймера.
+        :return: Список событий.
+        """
+        global _waiting
+        timeout = 1000 // self.idle_fps
+        if (delay := timers.get_delay()) is not None:
+            timeout = min(timeout, math.ceil(delay * 1000))
+
+        # Вызовы, не успевшие выполниться в прошлом кадре, не ждут событий
+        if self.idle and timeout > 0 and not len(inbox):
+            _waiting = True
+            events = [pg.event.wait(timeout)]
+            _waiting = False
+            events += pg.event.get()
+        else:
+            events = pg.event.get()
+
+        events = [e for e in events if e.type not in (pg.NOEVENT, WakeEvent.type)]
+        # Выполненные вызовы и таймеры не дают циклу заснуть до отрисовки изменений
+        applied = inbox.run()
+        fired = timers.run()
+        self._has_events = bool(events) or applied > 0 or fired > 0
+        return events
+
+    def tick(self, rects: list[pg.Rect] | None = None) -> int:
+        """
+        Завершает кадр.
+        :param rects: Области экрана, перерисованные в этом кадре.
+        :return: Время с прошлого кадра в миллисекундах.
+        """
+        self.idle = not (self._has_events or rects)
+        if self.idle:
+            # Ожидание в events() само ограничивает частоту
+            return self._clock.tick()
+        return self._clock.tick(self.fps)
+
+    def get_fps(self) -> float:
+        """
+        :return: Фактическая частота кадров.
+        """
+        return self._clock.get_fps()
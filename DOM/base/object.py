@@ -11,6 +11,9 @@ from abc import ABC, abstractmethod
 
 from loguru import logger
 
+from . import layout, loop
+from .tracing import TRACE
+
 if ty.TYPE_CHECKING:
     import pygame as pg
     from .group import Group
@@ -36,6 +39,18 @@ FIELDS = [
 
 
 class Object(ABC):
+    # Типы событий, которые обрабатывает объект. None - события любого типа
+    event_types: ty.ClassVar[frozenset[int] | None] = None
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        """
+        Если класс переопределяет handle_event, но не объявляет event_types,
+        то объект получает события любого типа.
+        """
+        super().__init_subclass__(**kwargs)
+        if "handle_event" in cls.__dict__ and "event_types" not in cls.__dict__:
+            cls.event_types = None
+
     def __init__(
         self,
         parent: Group | None,
@@ -54,8 +69,10 @@ class Object(ABC):
         self.__parent = parent
         self._hidden = hidden
         self._enabled = True  # Активен ли объект
+        self._dirty = True  # Нужно ли перерисовать объект на экране
 
-        logger.opt(colors=True).trace(f"Инициализация {self}")
+        if TRACE:
+            logger.opt(colors=True).trace(f"Инициализация {self}")
 
         # Добавляем этот объект в группу.
         if parent is not None:
@@ -66,14 +83,20 @@ class Object(ABC):
         Снимает скрытие с объекта.
         """
         self._hidden = False
-        logger.opt(colors=True).trace(f"show {self}")
+        self._dirty = True
+        loop.wake()
+        if TRACE:
+            logger.opt(colors=True).trace(f"show {self}")
 
     def hide(self) -> None:
         """
         Скрывает объект.
         """
         self._hidden = True
-        logger.opt(colors=True).trace(f"hide {self}")
+        self._dirty = True
+        loop.wake()
+        if TRACE:
+            logger.opt(colors=True).trace(f"hide {self}")
 
     @property
     def hidden(self) -> True | False:
@@ -84,14 +107,16 @@ class Object(ABC):
         Включает объект.
         """
         self._enabled = True
-        logger.opt(colors=True).trace(f"enable {self}")
+        if TRACE:
+            logger.opt(colors=True).trace(f"enable {self}")
 
     def disable(self) -> None:
         """
         Выключает объект.
         """
         self._enabled = False
-        logger.opt(colors=True).trace(f"disable {self}")
+        if TRACE:
+            logger.opt(colors=True).trace(f"disable {self}")
 
     @property
     def enabled(self) -> True | False:
@@ -103,7 +128,8 @@ class Object(ABC):
 
     @name.setter
     def name(self, value: str | None):
-        logger.opt(colors=True).trace(f"{self} -> <c>{value}</c>")
+        if TRACE:
+            logger.opt(colors=True).trace(f"{self} -> <c>{value}</c>")
         self._name = value
 
     @property
@@ -129,6 +155,20 @@ class Object(ABC):
         :param event: Событие.
         """
 
+    def holds_updates(self) -> True | False:
+        """
+        Метод может быть определен в классе-наследнике.
+        :return: Нужно ли пропускать обновление объекта и вложенных в него объектов.
+        """
+        return False
+
+    def get_event_types(self) -> frozenset[int] | None:
+        """
+        :return: Типы событий, которые нужно передавать объекту.
+         None - события любого типа.
+        """
+        return self.event_types
+
     @abstractmethod
     def draw(self, surface: pg.Surface) -> None:
         """
@@ -137,6 +177,20 @@ class Object(ABC):
         :param surface: Поверхность.
         """
 
+    @abstractmethod
+    def get_dirty_rects(self, hidden: True | False = False) -> list[pg.Rect]:
+        """
+        Метод должен быть определен в классе-наследнике.
+        Собирает области экрана, которые изменились с прошлой отрисовки,
+        и запоминает текущее положение объекта.
+        :param hidden: Скрыт ли один из родителей объекта.
+        :return: Список областей экрана.
+        """
+
+    @property
+    def dirty(self) -> True | False:
+        return self._dirty
+
     def __setattr__(self, key: str, value: ...) -> None:
         """
         Изменение атрибута объекта.
@@ -145,11 +199,16 @@ class Object(ABC):
         """
         # Если это 1 из атрибутов объекта
         if key in self.__dict__ and key in FIELDS:
-            logger.opt(colors=True).trace(
-                "{self} <le>{key}</le>=<y>{value}</y>", self=self, key=key, value=value
-            )
+            if TRACE:
+                logger.opt(colors=True).trace(
+                    "{self} <le>{key}</le>=<y>{value}</y>",
+                    self=self,
+                    key=key,
+                    value=value,
+                )
             super(Object, self).__setattr__(key, value)
-            (self.parent or self).update()
+            layout.forget(self)
+            layout.invalidate(self.parent or self)
             return
         super(Object, self).__setattr__(key, value)
 
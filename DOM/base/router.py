@@ -0,0 +1,59 @@
+"""
+
+Маршрутизация событий по их типу.
+
+Каждый объект объявляет типы событий, которые он обрабатывает (Object.event_types).
+Группа раскладывает свои объекты по типам событий и передает событие
+только тем объектам, которые его обрабатывают сами или через вложенные объекты.
+Например, движение мыши не обходит дерево виджетов, если его никто не обрабатывает.
+
+"""
+
+from __future__ import annotations
+
+import typing as ty
+
+if ty.TYPE_CHECKING:
+    from .object import Object
+
+
+class EventRouter:
+    def __init__(self, objects: ty.Iterable[Object]):
+        """
+        Таблица получателей событий для объектов одной группы.
+        Порядок получателей совпадает с порядком объектов в группе.
+        :param objects: Объекты группы.
+        """
+        subscriptions = [(obj, obj.get_event_types()) for obj in objects]
+
+        # Объекты, которые получают события любого типа
+        self._any: list[Object] = [
+            obj for obj, event_types in subscriptions if event_types is None
+        ]
+        # {<тип события>: [<объект>, ...], ...}
+        self._routes: dict[int, list[Object]] = {}
+        for obj, event_types in subscriptions:
+            for event_type in event_types or ():
+                self._routes.setdefault(event_type, [])
+        for event_type, route in self._routes.items():
+            route.extend(
+                obj
+                for obj, event_types in subscriptions
+                if event_types is None or event_type in event_types
+            )
+
+    def get(self, event_type: int) -> list[Object]:
+        """
+        :param event_type: Тип события.
+        :return: Объекты, которым нужно передать событие.
+        """
+        return self._routes.get(event_type, self._any)
+
+    def get_event_types(self) -> frozenset[int] | None:
+        """
+        :return: Типы событий, которые обрабатывает хотя бы один объект.
+         None - есть объект, обрабатывающий события любого типа.
+        """
+        if self._any:
+            return None
+        return frozenset(self._routes)
@@ -0,0 +1,68 @@
+"""
+
+Пространственный индекс для поиска объектов под курсором.
+
+Прямоугольники раскладываются по ячейкам равномерной сетки,
+поэтому при клике проверяются только объекты из одной ячейки,
+а не все объекты на экране.
+
+"""
+
+from __future__ import annotations
+
+import math
+import typing as ty
+
+import pygame as pg
+
+T = ty.TypeVar("T")
+
+
+class GridIndex(ty.Generic[T]):
+    def __init__(self, cell_width: int | float, cell_height: int | float):
+        """
+        Равномерная сетка прямоугольников.
+        :param cell_width: Ширина ячейки сетки.
+        :param cell_height: Высота ячейки сетки.
+        """
+        self.cell_width = cell_width
+        self.cell_height = cell_height
+
+        # {(<столбец>, <строка>): [(<прямоугольник>, <объект>), ...]}
+        self._cells: dict[tuple[int, int], list[tuple[pg.Rect, T]]] = {}
+
+    def insert(self, rect: pg.Rect, item: T) -> None:
+        """
+        Добавляет объект в индекс.
+        :param rect: Область, которую занимает объект.
+        :param item: Объект.
+        """
+        entry = (rect, item)
+        for column in range(
+            math.floor(rect.left / self.cell_width),
+            math.floor((rect.right - 1) / self.cell_width) + 1,
+        ):
+            for row in range(
+                math.floor(rect.top / self.cell_height),
+                math.floor((rect.bottom - 1) / self.cell_height) + 1,
+            ):
+                self._cells.setdefault((column, row), []).append(entry)
+
+    def query(self, pos: tuple[int, int]) -> list[T]:
+        """
+        :param pos: Точка.
+        :return: Объекты, содержащие точку, в порядке добавления.
+        """
+        cell = (
+            math.floor(pos[0] / self.cell_width),
+            math.floor(pos[1] / self.cell_height),
+        )
+        return [
+            item for rect, item in self._cells.get(cell, ()) if rect.collidepoint(pos)
+        ]
+
+    def clear(self) -> None:
+        """
+        Очищает индекс.
+        """
+        self._cells.clear()
@@ -0,0 +1,137 @@
+"""
+
+Пул поверхностей для перерисовки виджетов.
+
+Виджет создает новую поверхность при каждом обновлении, даже если его размер
+не изменился. Пул хранит освободившиеся поверхности и выдает их повторно
+для того же размера и флагов. Объем хранимых поверхностей ограничен,
+давно не использовавшиеся поверхности вытесняются.
+
+Поверхности возвращаются и выдаются повторно только в основном потоке:
+старое изображение виджета, обновленного в другом потоке, может в это время
+рисоваться основным циклом.
+
+"""
+
+from __future__ import annotations
+
+import threading
+import typing as ty
+import weakref
+from collections import OrderedDict
+
+import pygame as pg
+
+from .surfaces import get_bytes
+
+if ty.TYPE_CHECKING:
+    # Ключ пула: ((ширина, высота), флаги)
+    PoolKey = tuple[tuple[int, int], int]
+
+
+class SurfacePool:
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024):
+        """
+        Пул поверхностей.
+        Принимает обратно только поверхности, которые сам выдал.
+        :param max_bytes: Максимальный объем хранимых поверхностей в байтах.
+        """
+        self.max_bytes = max_bytes
+        self.hits = 0  # Количество повторно выданных поверхностей
+        self.misses = 0  # Количество созданных поверхностей
+        self.evictions = 0  # Количество вытесненных поверхностей
+
+        # {<ключ>: [<поверхность>, ...], ...} в порядке последнего возврата
+        self._free: OrderedDict[PoolKey, list[pg.Surface]] = OrderedDict()
+        self._bytes = 0  # Объем хранимых поверхностей
+        # Выданные поверхности, которые можно вернуть в пул
+        self._issued: weakref.WeakKeyDictionary[
+            pg.Surface, PoolKey
+        ] = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def acquire(self, size: ty.Sequence[int], flags: int = pg.SRCALPHA) -> pg.Surface:
+        """
+        Выдает очищенную поверхность.
+        :param size: Размер поверхности.
+        :param flags: Флаги поверхности.
+        :return: Прозрачная поверхность.
+        """
+        key = ((int(size[0]), int(size[1])), flags)
+        with self._lock:
+            if _is_main_thread() and (surfaces := self._free.get(key)):
+                surface = surfaces.pop()
+                if not surfaces:
+                    del self._free[key]
+                self._bytes -= get_bytes(surface)
+                self._issued[surface] = key
+                self.hits += 1
+            else:
+                surface = None
+                self.misses += 1
+
+        if surface is None:
+            surface = pg.Surface(*key, 32)
+            if flags & pg.SRCALPHA:
+                surface = surface.convert_alpha()
+            with self._lock:
+                self._issued[surface] = key
+        else:
+            surface.fill((0, 0, 0, 0))
+        return surface
+
+    def release(self, surface: pg.Surface | None) -> None:
+        """
+        Возвращает поверхность в пул.
+        После возврата поверхность нельзя использовать.
+        Вне основного потока поверхность не возвращается.
+        :param surface: Поверхность, выданная пулом.
+        """
+        if surface is None or not _is_main_thread():
+            return
+        nbytes = get_bytes(surface)
+        with self._lock:
+            if (key := self._issued.pop(surface, None)) is None:
+                return
+            if nbytes > self.max_bytes:
+                return
+            self._free.setdefault(key, []).append(surface)
+            self._free.move_to_end(key)
+            self._bytes += nbytes
+
+            while self._bytes > self.max_bytes:
+                key, surfaces = next(iter(self._free.items()))
+                self._bytes -= get_bytes(surfaces.pop(0))
+                if not surfaces:
+                    del self._free[key]
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """
+        Очищает пул и счетчики.
+        """
+        with self._lock:
+            self._free.clear()
+            self._issued.clear()
+            self._bytes = 0
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> dict[str, int]:
+        """
+        :return: Статистика использования пула.
+        """
+        return dict(
+            size=sum(map(len, self._free.values())),
+            bytes=self._bytes,
+            max_bytes=self.max_bytes,
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+        )
+
+
+def _is_main_thread() -> True | False:
+    return threading.current_thread() is threading.main_thread()
+
+
+surface_pool = SurfacePool()
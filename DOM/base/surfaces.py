@@ -0,0 +1,23 @@
+"""
+
+Общие функции для хранилищ поверхностей.
+
+Кэши текста (text_cache) и изображений (image_cache) и атлас текстур (atlas)
+выдают одну и ту же поверхность всем, кто ее запросил. Такие поверхности
+нельзя изменять: изменение появится у всех виджетов, которые их используют.
+Чтобы нарисовать что-то поверх, нужно работать с копией (surface.copy()).
+Поверхности из пула (surface_pool), наоборот, принадлежат тому, кто их получил.
+
+"""
+
+from __future__ import annotations
+
+import pygame as pg
+
+
+def get_bytes(surface: pg.Surface) -> int:
+    """
+    :param surface: Поверхность.
+    :return: Объем пикселей поверхности в байтах.
+    """
+    return surface.get_pitch() * surface.get_height()
@@ -0,0 +1,110 @@
+"""
+
+Кэш отрисованного текста.
+
+Одинаковый текст (ники, значения характеристик, описания предметов)
+отрисовывается заново при каждом обновлении виджета.
+Кэш хранит готовые поверхности и вытесняет давно неиспользуемые.
+
+"""
+
+from __future__ import annotations
+
+import threading
+import typing as ty
+from collections import OrderedDict
+
+import pygame as pg
+
+if ty.TYPE_CHECKING:
+    # Ключ кэша: (id шрифта, высота шрифта, текст, цвет, сглаживание, ...)
+    CacheKey = tuple[ty.Hashable, ...]
+    # Элемент кэша: (шрифт, поверхность)
+    CacheItem = tuple[pg.font.Font, pg.Surface]
+
+
+class TextCache:
+    def __init__(self, max_size: int = 1024):
+        """
+        LRU-кэш поверхностей с текстом.
+        :param max_size: Максимальное количество поверхностей в кэше.
+        """
+        self.max_size = max_size
+        self.hits = 0  # Количество попаданий
+        self.misses = 0  # Количество промахов
+
+        # Шрифт хранится, чтобы его id не был переиспользован другим шрифтом
+        self._surfaces: OrderedDict[CacheKey, CacheItem] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        font: pg.font.Font,
+        key: CacheKey,
+        renderer: ty.Callable[[], pg.Surface],
+    ) -> pg.Surface:
+        """
+        Возвращает поверхность из кэша или отрисовывает новую.
+        :param font: Шрифт, которым отрисован текст.
+        :param key: Параметры отрисовки, кроме шрифта.
+        :param renderer: Функция, отрисовывающая текст при промахе.
+        :return: Поверхность с текстом.
+        """
+        key = (id(font), font.get_height(), *key)
+        with self._lock:
+            if (item := self._surfaces.get(key)) is not None:
+                self._surfaces.move_to_end(key)
+                self.hits += 1
+                return item[1]
+            self.misses += 1
+
+        surface = renderer()
+
+        with self._lock:
+            self._surfaces[key] = (font, surface)
+            while len(self._surfaces) > self.max_size:
+                self._surfaces.popitem(last=False)
+        return surface
+
+    def render(
+        self,
+        font: pg.font.Font,
+        text: str | None,
+        color: pg.Color | str,
+        antialias: True | False = True,
+    ) -> pg.Surface:
+        """
+        Отрисовывает однострочный текст.
+        :param font: Шрифт.
+        :param text: Текст.
+        :param color: Цвет текста.
+        :param antialias: Сглаживание.
+        :return: Поверхность с текстом.
+        """
+        return self.get(
+            font,
+            (text, tuple(pg.Color(color)), antialias, None),
+            lambda: font.render(text, antialias, color),
+        )
+
+    def clear(self) -> None:
+        """
+        Очищает кэш и счетчики.
+        """
+        with self._lock:
+            self._surfaces.clear()
+            self.hits = self.misses = 0
+
+    def stats(self) -> dict[str, int]:
+        """
+        :return: Статистика использования кэша.
+        """
+        return dict(
+            size=len(self._surfaces),
+            max_size=self.max_size,
+            hits=self.hits,
+            misses=self.misses,
+        )
+
+
+text_cache = TextCache()
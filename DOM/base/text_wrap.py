@@ -0,0 +1,96 @@
+"""
+
+Перенос текста по ширине.
+
+Ширина строки считается как сумма ширин символов (font.metrics),
+поэтому каждый символ измеряется один раз, а не при каждом добавлении
+к строке. Результат переноса кэшируется для (шрифт, текст, ширина).
+
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+
+import pygame as pg
+
+
+def _advances(font: pg.font.Font, text: str) -> list[int]:
+    """
+    :param font: Шрифт.
+    :param text: Текст.
+    :return: Ширина каждого символа текста.
+    """
+    return [
+        metrics[4] if metrics is not None else font.size(char)[0]
+        for char, metrics in zip(text, font.metrics(text))
+    ]
+
+
+def _split_chars(font: pg.font.Font, line: str, width: int) -> list[str]:
+    """
+    Переносит строку по символам.
+    :param font: Шрифт.
+    :param line: Строка.
+    :param width: Максимальная ширина строки.
+    :return: Строки, на которые разбита исходная.
+    """
+    lines = []
+    start = line_width = 0
+    for i, advance in enumerate(_advances(font, line)):
+        if i > start and line_width + advance > width:
+            lines.append(line[start:i])
+            start, line_width = i, 0
+        line_width += advance
+    lines.append(line[start:])
+    return lines
+
+
+def _split_words(font: pg.font.Font, line: str, width: int) -> list[str]:
+    """
+    Переносит строку по словам. Слова длиннее строки не разрываются.
+    :param font: Шрифт.
+    :param line: Строка.
+    :param width: Максимальная ширина строки.
+    :return: Строки, на которые разбита исходная.
+    """
+    if not (words := line.split()):
+        return [""]
+
+    space = font.size(" ")[0]
+    lines = []
+    start, line_width = 0, sum(_advances(font, words[0]))
+    for i, word in enumerate(words[1:], start=1):
+        word_width = sum(_advances(font, word))
+        if line_width + space + word_width > width:
+            lines.append(" ".join(words[start:i]))
+            start, line_width = i, word_width
+        else:
+            line_width += space + word_width
+    lines.append(" ".join(words[start:]))
+    return lines
+
+
+@lru_cache(maxsize=512)
+def wrap(
+    font: pg.font.Font,
+    text: str,
+    width: int,
+    soft_split: True | False = False,
+) -> tuple[str, ...]:
+    """
+    Разделяет текст на строки, которые не выходят за заданную ширину.
+    :param font: Шрифт.
+    :param text: Текст.
+    :param width: Максимальная ширина строки.
+    :param soft_split: True - Переносит текст не разрывая слова.
+    :return: Строки текста.
+    """
+    split = _split_words if soft_split else _split_chars
+    lines = []
+    for line in text.splitlines():
+        if font.size(line)[0] <= width:
+            lines.append(line)
+        else:
+            lines.extend(split(font, line, width))
+    return tuple(lines)
@@ -1,25 +1,38 @@
 """
 
-Менеджер дополнительного потока.
-Дает интерфейс для выполнения функций в отдельном потоке.
+Менеджер дополнительных потоков.
+Дает интерфейс для выполнения функций в отдельных потоках.
 
 Существует, для того, чтобы окно приложения не зависало,
 при выполнении ресурса затратных задач,
 
+Задания выполняются ограниченным пулом потоков. Готовые задания хранятся
+в куче по приоритету, повторяющиеся задания ждут своего времени в отдельной куче.
+Свободные потоки спят на условной переменной и просыпаются сразу,
+как только появляется задание. Долгое задание занимает только один поток.
+
 """
 
 from __future__ import annotations
 
+import heapq
+import itertools
 import re
 import threading
 import time
 import typing as ty
+from concurrent.futures import Future
 
 from loguru import logger
 
+from .tracing import TRACE
+
 if ty.TYPE_CHECKING:
     from .types import Response
 
+    # Элемент очереди: (<приоритет или время запуска>, <порядковый номер>, <задание>)
+    QueueItem = tuple[float, int, "Thread"]
+
 
 def _safe_text(text: str) -> str:
     if isinstance(text, str):
@@ -28,24 +41,20 @@ def _safe_text(text: str) -> str:
 
 
 class Thread:
-    _thread: threading.Thread = ...  # Объект потока
-    _workers: list[Thread] = []  # Список заданий
-    _running: True | False = False  # True - поток активен
-    _sleeping = 1  # Интервал проверки новых заданий (в секундах)
+    max_workers = 4  # Максимальное количество потоков
 
-    def __new__(cls, *args, **kwargs):
-        """
-        Создание нового экземпляра класса.
-        """
-        if cls._thread is ...:  # Если поток не создан
-            cls._running = True
-            cls._thread = threading.Thread(target=cls._worker, name="ThreadWorker")
-            # Поток автоматически остановится при остановке основного потока
-            cls._thread.daemon = True
-            cls._thread.start()
-            logger.opt(colors=True).debug(f"Поток <c>{cls._thread.name}</c> запущен")
+    _threads: list[threading.Thread] = []  # Запущенные потоки
+    _idle = 0  # Количество потоков, ожидающих заданий
+    _ready: list[QueueItem] = []  # Задания, готовые к выполнению
+    _delayed: list[QueueItem] = []  # Повторяющиеся задания, ожидающие запуска
+    _counter = itertools.count()  # Порядок заданий с одним приоритетом
+    _condition = threading.Condition()
 
-        return super(Thread, cls).__new__(cls)
+    # Статистика
+    _max_depth = 0  # Максимальное количество готовых заданий в очереди
+    _started = 0  # Количество запусков заданий
+    _total_wait = 0.0  # Суммарное время ожидания в очереди (в секундах)
+    _max_wait = 0.0  # Максимальное время ожидания в очереди (в секундах)
 
     def __init__(
         self,
@@ -56,9 +65,10 @@ class Thread:
         callback: ty.Callable[[Response], ty.Any] = None,
         repetitive: True | False = False,
         timeout: int = 1,
+        priority: int = 0,
     ):
         """
-        Менеджер дополнительного потока.
+        Задание для дополнительного потока.
 
         :param worker: Функция, которую нужно выполнить.
         :type worker: Функция(может быть lambda), принимающая любое число аргументов
@@ -69,62 +79,158 @@ class Thread:
          после завершения работы основной функции.
         :type callback: Функция принимающая строго 1 позиционный аргумент
          и возвращающая любое значение.
-        :param repetitive: True - Задание будет повторяться каждые <timeout> секунд.
+        :param repetitive: True - Задание будет повторяться каждые <timeout> секунд,
+         пока не будет отменено.
         :param timeout: Раз в сколько секунд будет выполняться задание.
+        :param priority: Приоритет задания. Задания с меньшим значением
+         выполняются раньше.
         """
-        logger.opt(colors=True).trace(
-            "Создано новое задание "
-            "<y>worker</y>=<c>{worker}</c> "
-            "<y>args</y>=<c>{args}</c> "
-            "<y>kwargs</y>=<c>{kwargs}</c> "
-            "<y>callback</y>=<c>{callback}</c> "
-            "<y>repetitive</y>=<c>{repetitive}</c>",
-            worker=str(worker),
-            args=args,
-            kwargs=kwargs,
-            callback=str(callback),
-            repetitive=repetitive,
-        )
+        if TRACE:
+            logger.opt(colors=True).trace(
+                "Создано новое задание "
+                "<y>worker</y>=<c>{worker}</c> "
+                "<y>args</y>=<c>{args}</c> "
+                "<y>kwargs</y>=<c>{kwargs}</c> "
+                "<y>callback</y>=<c>{callback}</c> "
+                "<y>repetitive</y>=<c>{repetitive}</c>",
+                worker=str(worker),
+                args=args,
+                kwargs=kwargs,
+                callback=str(callback),
+                repetitive=repetitive,
+            )
         self.worker = worker
         self.args = args
         self.kwargs = kwargs or {}
         self.callback = callback
         self.repetitive = repetitive
         self.timeout = timeout
+        self.priority = priority
+
+        # Результат задания. У повторяющегося задания завершается только отменой
+        self.future: Future = Future()
+        self.cancelled = False
+        self._queued_at = 0.0  # Время постановки в очередь готовых заданий
 
-        self._last_start = 0
+    def run(self) -> Future:
+        """
+        Ставит задание в очередь.
+        :return: Результат задания.
+        """
+        cls = self.__class__
+        with cls._condition:
+            cls._push_ready(self)
+            cls._condition.notify()
+        if TRACE:
+            logger.opt(colors=True).trace(
+                "Задание <c>{worker}</c> добавлено в очередь", worker=self.worker
+            )
+        return self.future
+
+    def cancel(self) -> True | False:
+        """
+        Отменяет задание. Выполняющийся запуск не прерывается,
+        но повторяющееся задание больше не запускается.
+        :return: True - задание больше не будет запущено.
+        """
+        with self._condition:
+            if not self.future.cancel():
+                return False
+            self.cancelled = True
+        return True
 
     @classmethod
-    def _worker(cls) -> ty.NoReturn:
-        # Основной цикл потока.
-        while cls._running:
-            for worker in cls._workers.copy():
-                if worker.repetitive:
-                    if worker._last_start + worker.timeout > int(time.time()):
+    def stats(cls) -> dict[str, int | float]:
+        """
+        :return: Статистика пула потоков.
+        """
+        with cls._condition:
+            return dict(
+                workers=len(cls._threads),
+                max_workers=cls.max_workers,
+                idle=cls._idle,
+                depth=len(cls._ready),
+                max_depth=cls._max_depth,
+                delayed=len(cls._delayed),
+                started=cls._started,
+                mean_wait=cls._total_wait / cls._started if cls._started else 0.0,
+                max_wait=cls._max_wait,
+            )
+
+    @classmethod
+    def _push_ready(cls, job: Thread) -> None:
+        # Вызывается под блокировкой
+        job._queued_at = time.monotonic()
+        heapq.heappush(cls._ready, (job.priority, next(cls._counter), job))
+        cls._max_depth = max(cls._max_depth, len(cls._ready))
+        if not cls._idle and len(cls._threads) < cls.max_workers:
+            thread = threading.Thread(
+                target=cls._worker, name=f"ThreadWorker-{len(cls._threads)}"
+            )
+            # Поток автоматически остановится при остановке основного потока
+            thread.daemon = True
+            cls._threads.append(thread)
+            thread.start()
+            logger.opt(colors=True).debug(f"Поток <c>{thread.name}</c> запущен")
+
+    @classmethod
+    def _take(cls) -> Thread:
+        """
+        Ждет и забирает следующее задание.
+        :return: Задание.
+        """
+        with cls._condition:
+            while True:
+                now = time.monotonic()
+                while cls._delayed and cls._delayed[0][0] <= now:
+                    job = heapq.heappop(cls._delayed)[2]
+                    if not job.cancelled:
+                        cls._push_ready(job)
+                while cls._ready:
+                    job = heapq.heappop(cls._ready)[2]
+                    if job.cancelled:
                         continue
-                try:
-                    response = worker.worker(*worker.args, **worker.kwargs)
-                    if worker.callback:
-                        worker.callback(response)
-                except Exception:
-                    import traceback
+                    wait = now - job._queued_at
+                    cls._total_wait += wait
+                    cls._max_wait = max(cls._max_wait, wait)
+                    cls._started += 1
+                    return job
 
-                    traceback.print_exc()
+                cls._idle += 1
+                cls._condition.wait(cls._delayed[0][0] - now if cls._delayed else None)
+                cls._idle -= 1
 
-                if not worker.repetitive:
-                    cls._workers.remove(worker)
+    @classmethod
+    def _worker(cls) -> ty.NoReturn:
+        # Основной цикл потока.
+        while True:
+            job = cls._take()
+            if not job.repetitive and not job.future.set_running_or_notify_cancel():
+                continue
+
+            try:
+                response = job.worker(*job.args, **job.kwargs)
+                if job.callback:
+                    job.callback(response)
+            except Exception as err:
+                logger.opt(exception=True).error(f"Ошибка в задании {job.worker}")
+                if not job.repetitive:
+                    job.future.set_exception(err)
+            else:
+                if not job.repetitive:
+                    job.future.set_result(response)
+
+            if not job.repetitive:
+                if TRACE:
                     logger.opt(colors=True).trace(
-                        "Задание <c>{worker}</c> выполнено", worker=worker.worker
+                        "Задание <c>{worker}</c> выполнено", worker=job.worker
                     )
-                else:
-                    worker._last_start = int(time.time())
-            time.sleep(cls._sleeping)
+                continue
 
-    def run(self) -> None:
-        """
-        Запускает задания.
-        """
-        self.__class__._workers.append(self)
-        logger.opt(colors=True).trace(
-            "Задание <c>{worker}</c> добавлено в очередь", worker=self.worker
-        )
+            with cls._condition:
+                if not job.cancelled:
+                    heapq.heappush(
+                        cls._delayed,
+                        (time.monotonic() + job.timeout, next(cls._counter), job),
+                    )
+                    cls._condition.notify()
@@ -0,0 +1,165 @@
+"""
+
+Таймеры основного цикла окна.
+
+Отложенные и периодические вызовы хранятся в куче по времени срабатывания.
+Основной цикл (FrameClock) вызывает наступившие таймеры в начале кадра,
+а в простое ждет событий не дольше, чем до ближайшего таймера,
+поэтому ожидающие таймеры не занимают ни потоков, ни процессора.
+Функции таймеров выполняются в основном потоке.
+
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import threading
+import time
+import typing as ty
+
+from loguru import logger
+
+from .tracing import TRACE
+
+
+class Timer:
+    def __init__(
+        self,
+        when: float,
+        interval: float | None,
+        callback: ty.Callable[[...], ty.Any],
+        args: tuple[...],
+    ):
+        """
+        Таймер. Создается через TimerScheduler.
+        :param when: Время срабатывания по time.monotonic.
+        :param interval: Период повторения в секундах. None - таймер однократный.
+        :param callback: Функция, которую нужно вызвать.
+        :param args: Позиционные аргументы функции.
+        """
+        self.when = when
+        self.interval = interval
+        self.callback = callback
+        self.args = args
+        self.cancelled = False
+
+    def cancel(self) -> None:
+        """
+        Отменяет таймер. Отмененный таймер больше не вызывается.
+        """
+        self.cancelled = True
+
+    def __repr__(self) -> str:
+        return f"Timer({self.callback}, interval={self.interval})"
+
+
+class TimerScheduler:
+    def __init__(self):
+        """
+        Куча таймеров.
+        Таймеры можно создавать и отменять из любого потока.
+        """
+        # [(<время срабатывания>, <порядковый номер>, <таймер>), ...]
+        self._heap: list[tuple[float, int, Timer]] = []
+        self._counter = itertools.count()  # Порядок таймеров с одним временем
+        self._lock = threading.Lock()
+
+    def call_later(
+        self, delay: float, callback: ty.Callable[[...], ty.Any], *args
+    ) -> Timer:
+        """
+        Вызывает функцию через delay секунд.
+        :param delay: Задержка в секундах.
+        :param callback: Функция.
+        :param args: Позиционные аргументы функции.
+        :return: Таймер.
+        """
+        return self._push(Timer(time.monotonic() + delay, None, callback, args))
+
+    def call_every(
+        self, interval: float, callback: ty.Callable[[...], ty.Any], *args
+    ) -> Timer:
+        """
+        Вызывает функцию каждые interval секунд, пока таймер не отменен.
+        Первый вызов - через interval секунд.
+        :param interval: Период в секундах.
+        :param callback: Функция.
+        :param args: Позиционные аргументы функции.
+        :return: Таймер.
+        """
+        if interval <= 0:
+            raise ValueError("interval должен быть положительным числом")
+        return self._push(Timer(time.monotonic() + interval, interval, callback, args))
+
+    @staticmethod
+    def cancel(timer: Timer | None) -> None:
+        """
+        Отменяет таймер.
+        :param timer: Таймер. None игнорируется.
+        """
+        if timer is not None:
+            timer.cancel()
+
+    def get_delay(self) -> float | None:
+        """
+        :return: Время до ближайшего таймера в секундах. None - таймеров нет.
+        """
+        with self._lock:
+            # Отмененные таймеры не должны будить основной цикл
+            while self._heap and self._heap[0][2].cancelled:
+                heapq.heappop(self._heap)
+            if not self._heap:
+                return None
+            return max(0.0, self._heap[0][0] - time.monotonic())
+
+    def run(self) -> int:
+        """
+        Вызывает наступившие таймеры.
+        Таймеры, созданные во время вызова, ждут следующего кадра.
+        :return: Количество вызванных таймеров.
+        """
+        now = time.monotonic()
+        due: list[Timer] = []
+        with self._lock:
+            while self._heap and self._heap[0][0] <= now:
+                due.append(heapq.heappop(self._heap)[2])
+
+        count = 0
+        for timer in due:
+            if timer.cancelled:
+                continue
+            if timer.interval is not None:
+                # Периодический таймер не накапливает пропущенные вызовы
+                timer.when = max(timer.when + timer.interval, now)
+                self._push(timer)
+            if TRACE:
+                logger.opt(colors=True).trace(
+                    "Таймер <c>{timer}</c> сработал", timer=timer
+                )
+            try:
+                timer.callback(*timer.args)
+            except Exception:
+                logger.exception(f"Ошибка в таймере {timer}")
+            count += 1
+        return count
+
+    def clear(self) -> None:
+        """
+        Отменяет все таймеры.
+        """
+        with self._lock:
+            for *_, timer in self._heap:
+                timer.cancel()
+            self._heap.clear()
+
+    def _push(self, timer: Timer) -> Timer:
+        with self._lock:
+            heapq.heappush(self._heap, (timer.when, next(self._counter), timer))
+        return timer
+
+
+timers = TimerScheduler()
+call_later = timers.call_later
+call_every = timers.call_every
+cancel = timers.cancel
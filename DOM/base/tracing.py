@@ -0,0 +1,19 @@
+"""
+
+Переключатель трассировочных логов.
+
+Сообщения logger.trace в виджетах собираются через f-строки и __repr__
+при каждом вызове, даже если уровень логирования выше TRACE.
+Вызовы в часто выполняемом коде обернуты в `if TRACE:`,
+поэтому при выключенной трассировке сообщения не формируются.
+
+Значение определяется один раз при импорте по переменной окружения LOGGING_LEVEL.
+При запуске с `python -O` трассировка выключена всегда.
+
+"""
+
+from __future__ import annotations
+
+import os
+
+TRACE: True | False = __debug__ and os.environ.get("LOGGING_LEVEL") == "TRACE"
@@ -12,13 +12,25 @@ from abc import ABC, abstractmethod
 import pygame as pg
 from loguru import logger
 
+from . import layout, loop
 from .object import Object
+from .surface_pool import surface_pool
+from .tracing import TRACE
 
 if ty.TYPE_CHECKING:
     from .group import Group
 
 
 class BaseWidget(Object, ABC):
+    event_types = frozenset()
+
+    _global_rect: pg.Rect | None = None  # Положение виджета в окне
+    # Параметры, при изменении которых меняются положения вложенных виджетов
+    _layout_key: tuple | None = None
+    # Счетчик сбросов положений. Не дает сохранить положение,
+    # посчитанное одновременно со сбросом в другом потоке
+    _layout_generation: int = 0
+
     def __init__(
         self, parent: Group | None, name: str = None, *, hidden: True | False = False
     ):
@@ -28,9 +40,13 @@ class BaseWidget(Object, ABC):
         :param name: Название объекта.
         :param hidden: Будет ли виджет скрыт.
         """
+        # Область экрана, в которой виджет был отображен в последний раз
+        self._drawn_rect: pg.Rect | None = None
+
         Object.__init__(self, parent, name, hidden=hidden)
 
         self.rect: pg.Rect = self._get_rect()
+        self._check_layout()
         self.image: pg.Surface = self._render()
 
     @abstractmethod
@@ -51,9 +67,31 @@ class BaseWidget(Object, ABC):
         """
         Обновляет виджет.
         """
-        logger.opt(colors=True).trace(f"update {self}")
-        self.rect = self._get_rect()
-        self.image = self._render()
+        if TRACE:
+            logger.opt(colors=True).trace(f"update {self}")
+        with layout.layout_pass():
+            self.rect = self._get_rect()
+            self._check_layout()
+            # Новое изображение рисуется на другой поверхности,
+            # старая возвращается в пул и будет использована при следующем обновлении
+            image, self.image = self.__dict__.get("image"), self._render()
+        if image is not self.image:
+            surface_pool.release(image)
+        self._dirty = True
+        loop.wake()
+
+    @property
+    def rect(self) -> pg.Rect:
+        """
+        :return: Геометрия виджета и его положение в группе.
+        """
+        rect = self._rect
+        layout.track(self, rect)
+        return rect
+
+    @rect.setter
+    def rect(self, value: pg.Rect):
+        self._rect = value
 
     def handle_event(self, event: pg.event.Event) -> None:
         """
@@ -70,18 +108,68 @@ class BaseWidget(Object, ABC):
         if not self.hidden:
             surface.blit(self.image, self.rect)
 
+    def get_dirty_rects(self, hidden: True | False = False) -> list[pg.Rect]:
+        rect = None if hidden or self.hidden else self.get_global_rect()
+        if not self._dirty and rect == self._drawn_rect:
+            return []
+        self._dirty = False
+
+        # Нужно стереть виджет со старого места и отобразить на новом
+        rects = [r for r in (self._drawn_rect, rect) if r is not None]
+        self._drawn_rect = rect
+        return rects
+
     def get_global_rect(self) -> pg.Rect:
         """
         :return: Экземпляр pg.Rect описывающий положение виджета в окне.
         """
-        rect = self.rect.copy()
-        if self.parent and hasattr(self.parent, "get_global_rect"):
-            parent_rect: pg.Rect = self.parent.get_global_rect()
-            padding = self.parent.padding if hasattr(self.parent, "padding") else 0
-            border_width = (
-                self.parent.border_width if hasattr(self.parent, "border_width") else 0
-            )
-            rect.x += parent_rect.x + padding + border_width
-            rect.y += parent_rect.y + padding + border_width
-
-        return rect
+        if self._global_rect is None:
+            generation = BaseWidget._layout_generation
+            rect = self.rect.copy()
+            if self.parent and hasattr(self.parent, "get_global_rect"):
+                parent_rect: pg.Rect = self.parent.get_global_rect()
+                padding = self.parent.padding if hasattr(self.parent, "padding") else 0
+                border_width = (
+                    self.parent.border_width
+                    if hasattr(self.parent, "border_width")
+                    else 0
+                )
+                rect.x += parent_rect.x + padding + border_width
+                rect.y += parent_rect.y + padding + border_width
+            if generation != BaseWidget._layout_generation:
+                return rect
+            self._global_rect = rect
+
+        return self._global_rect.copy()
+
+    @Object.parent.setter
+    def parent(self, parent: Group | None):
+        Object.parent.fset(self, parent)
+        # Положение в новой группе будет посчитано заново
+        self._layout_key = None
+        self._reset_global_rect()
+
+    def _check_layout(self) -> None:
+        """
+        Сбрасывает сохраненные положения виджета и вложенных в него виджетов,
+        если изменились его геометрия, отступы, обводка или родитель.
+        """
+        key = (
+            tuple(self._rect),
+            getattr(self, "padding", 0),
+            getattr(self, "border_width", 0),
+            id(self.parent),
+        )
+        if key != self._layout_key:
+            self._layout_key = key
+            BaseWidget._layout_generation += 1
+            self._reset_global_rect()
+
+    def _reset_global_rect(self) -> None:
+        """
+        Сбрасывает сохраненные положения виджета и вложенных в него виджетов.
+        """
+        self._global_rect = None
+        for obj in getattr(self, "_objects", ()):
+            if isinstance(obj, BaseWidget):
+                obj._reset_global_rect()
@@ -4,5 +4,6 @@ from .input_box import InputBox
 from .input_line import InputLine, PasswordInputLine
 from .label import Label
 from .line import Line
+from .list_view import ListView
 from .text import Text
 from .widgets_group import WidgetsGroup
@@ -1,15 +1,79 @@
+"""
+
+Диалоговое окно.
+
+Окно располагается по центру слоя затемнения размером с экран.
+Затемнение не перерисовывается при изменении окна: изображение
+для каждой пары (размер, прозрачность) создается один раз и используется
+всеми окнами. Пока окно скрыто, раскладка окна и вложенных в него
+виджетов не пересчитывается, окно обновляется один раз при показе.
+
+"""
+
 from __future__ import annotations
 
 import typing as ty
+from functools import lru_cache
 
 import pygame as pg
 from loguru import logger
 
+from .. import layout
+from ..group import Group
 from .widgets_group import WidgetsGroup
 
 if ty.TYPE_CHECKING:
     from ..types import CordFunction
-    from ..group import Group
+
+
+@lru_cache(maxsize=16)
+def _get_fog(size: tuple[int, int], alpha: int) -> pg.Surface:
+    """
+    :param size: Размер затемнения.
+    :param alpha: Прозрачность затемнения.
+    :return: Изображение затемнения.
+    """
+    if alpha == 255:
+        # Непрозрачное затемнение копируется без смешивания
+        fog = pg.Surface(size).convert()
+    else:
+        fog = pg.Surface(size, pg.SRCALPHA).convert_alpha()
+    fog.fill(pg.Color(0, 0, 0, alpha))
+    return fog
+
+
+class _Fog(WidgetsGroup):
+    # Пропущено обновление вложенных виджетов, пока слой был скрыт
+    outdated: True | False = False
+
+    def __init__(self, parent: Group, name: str, *, size: tuple[int, int], alpha: int):
+        """
+        Слой затемнения под диалоговым окном.
+        :param parent: Объект к которому принадлежит виджет.
+        :param name: Название объекта.
+        :param size: Размер затемнения.
+        :param alpha: Прозрачность затемнения.
+        """
+        self._alpha = alpha
+        super(_Fog, self).__init__(
+            parent, name, x=0, y=0, width=size[0], height=size[1], hidden=True
+        )
+
+    def _render(self) -> pg.Surface:
+        return _get_fog(tuple(self.rect.size), self._alpha)
+
+    def holds_updates(self) -> True | False:
+        if self.hidden:
+            self.outdated = True
+        return self.hidden
+
+    def draw(self, surface: pg.Surface) -> None:
+        if not self.hidden:
+            if self._alpha:
+                surface.blit(self.image, self.get_global_rect())
+            for obj in self.objects:
+                if isinstance(obj, Group):
+                    obj.draw(surface)
 
 
 class Alert(WidgetsGroup):
@@ -47,16 +111,7 @@ class Alert(WidgetsGroup):
         if not (0 <= fogging <= 255):
             raise ValueError("fogging и transparency должны быть в отрезке от 0 до 255")
 
-        self._tab = WidgetsGroup(
-            parent,
-            f"{name}-Tab",
-            x=0,
-            y=0,
-            width=parent_size[0],
-            height=parent_size[1],
-            background=pg.Color(0, 0, 0, fogging),
-            hidden=True,
-        )
+        self._tab = _Fog(parent, f"{name}-Tab", size=parent_size, alpha=fogging)
         self._tab.disable()
 
         super(Alert, self).__init__(
@@ -78,6 +133,9 @@ class Alert(WidgetsGroup):
         """
         logger.opt(colors=True).debug(f"Диалог <y>{self}</y> открыт")
         self._tab.show()
+        if self._tab.outdated:
+            self._tab.outdated = False
+            self.update()
         self._tab.enable()
         if self.__dict__.get("disabled_widgets") is None:
             self.__dict__["disabled_widgets"] = []
@@ -98,3 +156,8 @@ class Alert(WidgetsGroup):
                 widget.enable()
             del self.__dict__["disabled_widgets"]
         self._tab.disable()
+
+    def update(self, *args, **kwargs) -> None:
+        # Скрытое окно будет обновлено при показе
+        if not layout.held(self):
+            super(Alert, self).update(*args, **kwargs)
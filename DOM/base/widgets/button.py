@@ -8,6 +8,7 @@ from loguru import logger
 from .label import Label
 from ..anchor import Anchor
 from ..events import ButtonClickEvent
+from ..tracing import TRACE
 
 if ty.TYPE_CHECKING:
     from ..types import CordFunction, ButtonCallback
@@ -15,6 +16,8 @@ if ty.TYPE_CHECKING:
 
 
 class Button(Label):
+    event_types = frozenset({pg.MOUSEBUTTONDOWN, pg.MOUSEBUTTONUP})
+
     def __init__(
         self,
         parent: Group,
@@ -94,9 +97,10 @@ class Button(Label):
                     rect = self.get_global_rect()
                     if rect.collidepoint(event.pos):
                         self.pressed = True
-                        logger.opt(colors=True).trace(
-                            f"Кнопка <y>{self.text}</y> нажата"
-                        )
+                        if TRACE:
+                            logger.opt(colors=True).trace(
+                                f"Кнопка <y>{self.text}</y> нажата"
+                            )
             elif event.type == pg.MOUSEBUTTONUP:
                 if event.button == pg.BUTTON_LEFT:
                     if self.pressed:
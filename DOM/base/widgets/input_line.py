@@ -7,6 +7,7 @@ from loguru import logger
 
 from .label import Label
 from ..anchor import Anchor
+from ..tracing import TRACE
 
 if ty.TYPE_CHECKING:
     from ..types import CordFunction
@@ -15,6 +16,8 @@ if ty.TYPE_CHECKING:
 
 
 class InputLine(Label):
+    event_types = frozenset({pg.MOUSEBUTTONDOWN, pg.KEYDOWN})
+
     def __init__(
         self,
         parent: Group,
@@ -108,9 +111,10 @@ class InputLine(Label):
     def active(self, value: True | False):
         if self._active != value:
             self._active = value
-            logger.opt(colors=True).trace(
-                f"{self} <le>active</le>=<y>{self._active}</y>"
-            )
+            if TRACE:
+                logger.opt(colors=True).trace(
+                    f"{self} <le>active</le>=<y>{self._active}</y>"
+                )
             self.background = (
                 self._active_background if value else self._inactive_background
             )
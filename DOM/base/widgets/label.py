@@ -5,7 +5,10 @@ from inspect import isfunction
 
 import pygame as pg
 
+from .. import layout
 from ..anchor import Anchor
+from ..surface_pool import surface_pool
+from ..text_cache import text_cache
 from ..widget import BaseWidget
 
 if ty.TYPE_CHECKING:
@@ -113,7 +116,7 @@ class Label(BaseWidget):
         return self.rect
 
     def _render(self) -> pg.Surface:
-        image = pg.Surface(self.rect.size, pg.SRCALPHA, 32).convert_alpha()
+        image = surface_pool.acquire(self.rect.size)
         if self.background:
             pg.draw.rect(image, self.background, image.get_rect())
         if self.border_width:
@@ -141,11 +144,11 @@ class Label(BaseWidget):
         super(Label, self).update(*args, **kwargs)
 
     def _render_text(self) -> pg.Surface:
-        return self.font.render(self.text, True, self.color)
+        return text_cache.render(self.font, self.text, self.color)
 
     @property
     def x(self) -> int:
-        return self._x(self) if isfunction(self._x) else self._x
+        return layout.evaluate(self, "x", self._x) if isfunction(self._x) else self._x
 
     @x.setter
     def x(self, value: int | CordFunction):
@@ -153,7 +156,7 @@ class Label(BaseWidget):
 
     @property
     def y(self) -> int:
-        return self._y(self) if isfunction(self._y) else self._y
+        return layout.evaluate(self, "y", self._y) if isfunction(self._y) else self._y
 
     @y.setter
     def y(self, value: int | CordFunction):
@@ -162,7 +165,7 @@ class Label(BaseWidget):
     @property
     def width(self) -> int | None:
         if isfunction(self._width):
-            return self._width(self)
+            return layout.evaluate(self, "width", self._width)
         return self._width
 
     @width.setter
@@ -172,7 +175,7 @@ class Label(BaseWidget):
     @property
     def height(self) -> int | None:
         if isfunction(self._height):
-            return self._height(self)
+            return layout.evaluate(self, "height", self._height)
         return self._height
 
     @height.setter
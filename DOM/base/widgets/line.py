@@ -5,6 +5,8 @@ from inspect import isfunction
 
 import pygame as pg
 
+from .. import layout
+from ..surface_pool import surface_pool
 from ..widget import BaseWidget
 
 if ty.TYPE_CHECKING:
@@ -52,13 +54,13 @@ class Line(BaseWidget):
         return self.rect
 
     def _render(self) -> pg.Surface:
-        image = pg.Surface(self.rect.size, pg.SRCALPHA, 32).convert_alpha()
+        image = surface_pool.acquire(self.rect.size)
         pg.draw.rect(image, self.color, image.get_rect())
         return image
 
     @property
     def x(self) -> int:
-        return self._x(self) if isfunction(self._x) else self._x
+        return layout.evaluate(self, "x", self._x) if isfunction(self._x) else self._x
 
     @x.setter
     def x(self, value: int | CordFunction):
@@ -66,7 +68,7 @@ class Line(BaseWidget):
 
     @property
     def y(self) -> int:
-        return self._y(self) if isfunction(self._y) else self._y
+        return layout.evaluate(self, "y", self._y) if isfunction(self._y) else self._y
 
     @y.setter
     def y(self, value: int | CordFunction):
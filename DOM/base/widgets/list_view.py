@@ -0,0 +1,282 @@
+"""
+
+Виртуализированный список.
+
+Список создает виджеты только для строк, которые помещаются в его область.
+При прокрутке виджеты ушедших строк привязываются к новым элементам,
+поэтому количество виджетов не зависит от количества элементов.
+Смещения линий хранятся в массиве префиксных сумм их высот,
+первая и последняя видимые линии находятся бинарным поиском.
+
+Вложенные группы рисуются сразу на экран и не обрезаются областью списка,
+поэтому список прокручивается по линиям и отображает только линии,
+которые помещаются в него целиком.
+
+"""
+
+from __future__ import annotations
+
+import bisect
+import itertools
+import typing as ty
+
+import pygame as pg
+
+from .. import layout
+from .widgets_group import WidgetsGroup
+
+if ty.TYPE_CHECKING:
+    from ..group import Group
+    from ..types import CordFunction
+    from ..widget import BaseWidget
+
+
+class ListView(WidgetsGroup):
+    event_types = frozenset({pg.MOUSEWHEEL})
+
+    def __init__(
+        self,
+        parent: Group | None,
+        name: str = None,
+        *,
+        x: int | CordFunction,
+        y: int | CordFunction,
+        width: int,
+        height: int,
+        create_row: ty.Callable[[ListView, ty.Any], BaseWidget],
+        bind_row: ty.Callable[[BaseWidget, ty.Any], None],
+        row_height: int | ty.Callable[[ty.Any], int] | None = None,
+        columns: int = 1,
+        padding: int = 0,
+        background: pg.Color | None = None,
+        border_color: pg.Color = pg.Color(255, 255, 255),
+        border_width: int = 0,
+        hidden: True | False = False,
+    ):
+        """
+        Прокручиваемый список, отображающий только видимые строки.
+        :param parent: Объект к которому принадлежит виджет.
+        :type parent: Объект класса, родителем которого является Group.
+        :param name: Название объекта.
+        :param x: Координата x.
+        :type x: Число или функция вычисляющая координату.
+        :param y: Координата y.
+        :type y: Число или функция вычисляющая координату.
+        :param width: Ширина списка.
+        :param height: Высота списка.
+        :param create_row: Создает виджет строки для элемента.
+            Виджет, не добавленный в список, добавляется в него автоматически.
+        :type create_row: Функция, принимающая список и элемент.
+        :param bind_row: Привязывает существующий виджет строки к другому элементу.
+        :type bind_row: Функция, принимающая виджет строки и элемент.
+        :param row_height: Высота строки.
+        :type row_height: Число, функция вычисляющая высоту по элементу
+            или None - высота первого созданного виджета строки.
+        :param columns: Количество строк в одной линии списка.
+        :param padding: Отступы от границ виджета.
+        :param background: Цвет фона.
+        :param border_color: Цвет обводки виджета.
+        :param border_width: Ширина обводки.
+        :param hidden: Будет ли список скрыт.
+        """
+        if columns < 1:
+            raise ValueError("columns должно быть положительным числом")
+
+        self.create_row = create_row
+        self.bind_row = bind_row
+        self.row_height = row_height
+        self.columns = columns
+
+        self._items: list = []
+        self._offsets: list[int] | None = [0]  # Префиксные суммы высот линий
+        self._first = 0  # Первая отображаемая линия
+        self._rows: list[tuple[BaseWidget, ty.Any]] = []  # Отображаемые строки
+        self._free: list[
+            BaseWidget
+        ] = []  # Скрытые виджеты для повторного использования
+        self._row_size: int | None = None  # Измеренная высота строки
+
+        super(ListView, self).__init__(
+            parent,
+            name,
+            x=x,
+            y=y,
+            width=width,
+            height=height,
+            padding=padding,
+            background=background,
+            border_color=border_color,
+            border_width=border_width,
+            hidden=hidden,
+        )
+
+    @property
+    def items(self) -> tuple:
+        return tuple(self._items)
+
+    def set_items(self, items: ty.Iterable) -> None:
+        """
+        Заменяет все элементы списка. Позиция прокрутки сохраняется.
+        :param items: Элементы.
+        """
+        self._items = list(items)
+        self._offsets = None
+        self._layout_rows()
+
+    def append_item(self, item: ...) -> None:
+        """
+        Добавляет элемент в конец списка.
+        :param item: Элемент.
+        """
+        self._items.append(item)
+        self._offsets = None
+        self._layout_rows()
+
+    def remove_item(self, item: ...) -> None:
+        """
+        Удаляет элемент из списка.
+        :param item: Элемент.
+        """
+        self._items.remove(item)
+        self._offsets = None
+        self._layout_rows()
+
+    def set_item(self, index: int, item: ...) -> None:
+        """
+        Заменяет элемент списка.
+        Если элемент отображается, его виджет привязывается к нему заново,
+        даже если это тот же объект.
+        :param index: Индекс элемента.
+        :param item: Новый элемент.
+        """
+        old, self._items[index] = self._items[index], item
+        self._offsets = None
+        with layout.deferred():
+            for i, (row, bound) in enumerate(self._rows):
+                if bound is old:
+                    self._rows[i] = (row, item)
+                    self.bind_row(row, item)
+                    break
+            self._layout_rows()
+
+    def scroll(self, lines: int) -> None:
+        """
+        Прокручивает список.
+        :param lines: Количество линий. Отрицательное значение - прокрутка вверх.
+        """
+        self._first = max(0, self._first + lines)
+        self._layout_rows()
+
+    @property
+    def column_width(self) -> int:
+        """
+        :return: Ширина строки списка.
+        """
+        return self._get_content_size()[0] // self.columns
+
+    def handle_event(self, event: pg.event.Event) -> None:
+        super(ListView, self).handle_event(event)
+        if self.enabled and event.type == pg.MOUSEWHEEL:
+            if self.get_global_rect().collidepoint(pg.mouse.get_pos()):
+                self.scroll(-event.y)
+
+    def _get_content_size(self) -> tuple[int, int]:
+        """
+        :return: Размер области, в которой располагаются строки.
+        """
+        indent = (self.padding + self.border_width) * 2
+        return self.rect.width - indent, self.rect.height - indent
+
+    def _get_row_height(self, item: ...) -> int:
+        """
+        :param item: Элемент.
+        :return: Высота строки элемента.
+        """
+        if self.row_height is None:
+            return self._row_size
+        if callable(self.row_height):
+            return self.row_height(item)
+        return self.row_height
+
+    def _update_offsets(self) -> None:
+        """
+        Пересчитывает смещения линий.
+        """
+        if self.row_height is None and self._row_size is None and self._items:
+            # Высота строки берется у первого созданного виджета
+            row = self._create_row(self._items[0])
+            self._rows.append((row, self._items[0]))
+            self._row_size = row.rect.height
+
+        heights = (
+            max(map(self._get_row_height, self._items[i : i + self.columns]))
+            for i in range(0, len(self._items), self.columns)
+        )
+        self._offsets = list(itertools.accumulate(heights, initial=0))
+
+    def _create_row(self, item: ...) -> BaseWidget:
+        """
+        :param item: Элемент.
+        :return: Виджет строки, добавленный в список.
+        """
+        row = self.create_row(self, item)
+        if row.parent is not self:
+            self.add(row)
+        return row
+
+    def _layout_rows(self) -> None:
+        """
+        Привязывает виджеты к видимым элементам и расставляет их.
+        """
+        with layout.deferred():
+            if self._offsets is None:
+                self._update_offsets()
+            offsets = self._offsets
+            lines = len(offsets) - 1
+            viewport = self._get_content_size()[1]
+
+            # Дальше линии, начиная с которой оставшиеся линии помещаются целиком,
+            # прокручивать не нужно
+            last_first = bisect.bisect_left(offsets, offsets[-1] - viewport)
+            self._first = max(0, min(self._first, last_first, lines - 1))
+            top = offsets[self._first]
+            end = bisect.bisect_right(offsets, top + viewport) - 1
+            end = min(max(end, self._first + 1), lines)
+            visible = range(
+                self._first * self.columns,
+                min(end * self.columns, len(self._items)),
+            )
+
+            # Виджеты элементов, которые остались видимыми, не перепривязываются
+            bound = {id(item): row for row, item in self._rows}
+            rows = [(bound.pop(id(self._items[i]), None), i) for i in visible]
+            released = list(bound.values())
+
+            self._rows = []
+            column_width = self.column_width
+            for row, index in rows:
+                item = self._items[index]
+                if row is None:
+                    if released:
+                        row = released.pop()
+                        self.bind_row(row, item)
+                    elif self._free:
+                        row = self._free.pop()
+                        self.bind_row(row, item)
+                        row.show()
+                        self.add(row)
+                    else:
+                        row = self._create_row(item)
+                self._rows.append((row, item))
+
+                line, column = divmod(index, self.columns)
+                x, y = column * column_width, offsets[line] - top
+                if row.x != x:
+                    row.x = x
+                if row.y != y:
+                    row.y = y
+
+            for row in released:
+                row.hide()
+                self.remove(row)
+                self._free.append(row)
@@ -6,6 +6,8 @@ import pygame as pg
 
 from .label import Label
 from ..anchor import Anchor
+from ..text_cache import text_cache
+from ..text_wrap import wrap
 
 if ty.TYPE_CHECKING:
     from ..types import CordFunction
@@ -75,33 +77,25 @@ class Text(Label):
         )
 
     def _render_text(self) -> pg.Surface:
+        return text_cache.get(
+            self.font,
+            (
+                self.text,
+                tuple(pg.Color(self.color)),
+                True,
+                self.width,
+                self._soft_split,
+                self.anchor,
+            ),
+            self._render_lines,
+        )
+
+    def _render_lines(self) -> pg.Surface:
         # Разделяет текст на строки, которые не выходят за рамку родительского виджета
-        text = self.text.splitlines()
-        lines = []
-        for line in text:
-            if self.font.size(line)[0] <= self.width:
-                lines.append(self.font.render(line, True, self.color))
-            else:
-                if self._soft_split:
-                    words = line.split()
-                    _line = words[0]
-                    for word in words[1:]:
-                        if self.font.size(_line + " " + word)[0] > self.width:
-                            lines.append(self.font.render(_line, True, self.color))
-                            _line = ""
-                        _line += " " + word
-                        _line = _line.strip()
-                    if len(_line):
-                        lines.append(self.font.render(_line, True, self.color))
-                else:
-                    _line = line[0]
-                    for char in line:
-                        if self.font.size(_line + char)[0] > self.width:
-                            lines.append(self.font.render(_line, True, self.color))
-                            _line = ""
-                        _line += char
-                    if len(_line):
-                        lines.append(self.font.render(_line, True, self.color))
+        lines = [
+            self.font.render(line, True, self.color)
+            for line in wrap(self.font, self.text, self.width, self._soft_split)
+        ]
 
         image = pg.Surface(
             (
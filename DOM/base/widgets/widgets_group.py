@@ -5,7 +5,9 @@ from inspect import isfunction
 
 import pygame as pg
 
+from .. import layout
 from ..group import Group
+from ..surface_pool import surface_pool
 from ..widget import BaseWidget
 
 if ty.TYPE_CHECKING:
@@ -13,6 +15,8 @@ if ty.TYPE_CHECKING:
 
 
 class WidgetsGroup(Group, BaseWidget):
+    event_types = frozenset()
+
     def __init__(
         self,
         parent: Group | None,
@@ -98,8 +102,8 @@ class WidgetsGroup(Group, BaseWidget):
         size = tuple(
             n - self.padding * 2 - self.border_width * 2 for n in self.rect.size
         )
-        bg_image = pg.Surface(self.rect.size, pg.SRCALPHA, 32).convert_alpha()
-        content_image = pg.Surface(size, pg.SRCALPHA, 32).convert_alpha()
+        bg_image = surface_pool.acquire(self.rect.size)
+        content_image = surface_pool.acquire(size)
 
         if self.background:
             pg.draw.rect(bg_image, self.background, bg_image.get_rect())
@@ -116,14 +120,16 @@ class WidgetsGroup(Group, BaseWidget):
         rect = bg_image.get_rect()
         rect.x = rect.y = self.padding + self.border_width
         bg_image.blit(content_image, rect)
+        surface_pool.release(content_image)
 
         return bg_image
 
     def update(self, *args, **kwargs) -> None:
         if hasattr(self, "_objects"):
-            for widget in self.objects:
-                widget.update(*args, **kwargs)
-            BaseWidget.update(self, *args, **kwargs)
+            with layout.layout_pass():
+                for widget in self.objects:
+                    widget.update(*args, **kwargs)
+                BaseWidget.update(self, *args, **kwargs)
 
     def draw(self, surface: pg.Surface) -> None:
         if not self.hidden:
@@ -133,13 +139,25 @@ class WidgetsGroup(Group, BaseWidget):
                     if isinstance(obj, Group):
                         obj.draw(surface)
 
+    def get_dirty_rects(self, hidden: True | False = False) -> list[pg.Rect]:
+        if not hasattr(self, "image"):
+            return []
+        # Остальные объекты отображаются на изображении группы
+        rects, self._dirty_rects = self._dirty_rects, []
+        rects.extend(BaseWidget.get_dirty_rects(self, hidden))
+        hidden = hidden or self.hidden
+        for obj in self.objects.copy():
+            if isinstance(obj, Group):
+                rects.extend(obj.get_dirty_rects(hidden))
+        return rects
+
     def handle_event(self, event: pg.event.Event) -> None:
         if hasattr(self, "_objects"):
             super(WidgetsGroup, self).handle_event(event)
 
     @property
     def x(self) -> int:
-        return self._x(self) if isfunction(self._x) else self._x
+        return layout.evaluate(self, "x", self._x) if isfunction(self._x) else self._x
 
     @x.setter
     def x(self, value: int | CordFunction):
@@ -147,7 +165,7 @@ class WidgetsGroup(Group, BaseWidget):
 
     @property
     def y(self) -> int:
-        return self._y(self) if isfunction(self._y) else self._y
+        return layout.evaluate(self, "y", self._y) if isfunction(self._y) else self._y
 
     @y.setter
     def y(self, value: int | CordFunction):
@@ -156,7 +174,7 @@ class WidgetsGroup(Group, BaseWidget):
     @property
     def width(self) -> int | None:
         if isfunction(self._width):
-            return self._width(self)
+            return layout.evaluate(self, "width", self._width)
         return self._width
 
     @width.setter
@@ -166,7 +184,7 @@ class WidgetsGroup(Group, BaseWidget):
     @property
     def height(self) -> int | None:
         if isfunction(self._height):
-            return self._height(self)
+            return layout.evaluate(self, "height", self._height)
         return self._height
 
     @height.setter
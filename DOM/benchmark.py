@@ -0,0 +1,398 @@
+"""
+
+Замер производительности интерфейса без окна (SDL_VIDEODRIVER=dummy).
+
+Для каждого разрешения из ALLOWED_RESOLUTION измеряется:
+- время создания экранов меню и игрового клиента;
+- время кадра: перерисовка изменившихся областей и полная перерисовка;
+- стоимость Group.add;
+- стоимость переноса текста в Text;
+- стоимость Field.update_field.
+
+Сервер не нужен: экраны получают данные от OfflineNetworkClient
+с синтетической комнатой. Результаты сохраняются в JSON,
+чтобы сравнивать запуски между собой.
+
+Запуск:
+    python benchmark.py --env <директория с файлами игры> --output bench.json
+
+"""
+
+from __future__ import annotations
+
+import argparse
+import atexit
+import json
+import math
+import os
+import platform
+import statistics
+import tempfile
+import time
+import typing as ty
+
+os.environ["PYGAME_HIDE_SUPPORT_PROMPT"] = "1"
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+parser = argparse.ArgumentParser()
+parser.add_argument(
+    "--env",
+    default=r"{LOCALAPPDATA}\DOM",
+    type=str,
+    help="Путь к директории с файлами игры",
+)
+parser.add_argument(
+    "--output",
+    default="benchmark.json",
+    type=str,
+    help="Файл с результатами",
+)
+parser.add_argument("--frames", default=120, type=int, help="Количество кадров")
+parser.add_argument(
+    "--widgets", default=200, type=int, help="Количество виджетов для Group.add"
+)
+parser.add_argument("--friends", default=300, type=int, help="Количество друзей")
+parser.add_argument("--field-size", default=20, type=int, help="Размер поля")
+parser.add_argument("--enemies", default=15, type=int, help="Количество врагов")
+
+args = parser.parse_args()
+
+# CONFIG SETUP
+# Файлы игры берутся из директории клиента, база данных и логи - временные,
+# чтобы не изменять настройки клиента
+os.environ["APP_DIR"] = args.env.format(**{k: v for k, v in os.environ.items()})
+# Директория удаляется при выходе. Логгер закрывает файл раньше,
+# так как регистрирует свой обработчик выхода позже
+_tmp_dir = tempfile.TemporaryDirectory(
+    prefix="dom-benchmark-", ignore_cleanup_errors=True
+)
+atexit.register(_tmp_dir.cleanup)
+os.environ["DB_PATH"] = os.path.join(_tmp_dir.name, "database.sqlite")
+os.environ["DEBUG_PATH"] = os.path.join(_tmp_dir.name, "debug.log")
+os.environ["AUTH_PATH"] = os.path.join(_tmp_dir.name, ".auth")
+for key, directory in (
+    ("CHARACTERS_PATH", "characters"),
+    ("USER_ICONS_PATH", "user_icons"),
+    ("UI_ICONS_PATH", "ui_icons"),
+    ("ITEMS_PATH", "items"),
+    ("ITEM_BORDERS_PATH", "item_borders"),
+    ("ITEM_STANDS_PATH", "item_stands"),
+    ("BUTTONS_PATH", "buttons"),
+    ("BOSSES_PATH", "bosses"),
+    ("ENEMIES_PATH", "enemies"),
+    ("LOCATIONS_PATH", "locations"),
+    ("CUBE_PATH", "cube"),
+):
+    os.environ[key] = os.path.join(os.environ["APP_DIR"], directory)
+os.environ["FONT"] = os.path.join(os.environ["APP_DIR"], "font.ttf")
+os.environ["VERSION"] = "1.0.0-beta.1"
+os.environ["LOGGING_LEVEL"] = "INFO"
+os.environ["HOST"] = "offline"
+# Все разрешения доступны и ни одно не открывается в полный экран
+os.environ["MAX_RESOLUTION"] = "7680;4320"
+
+import pygame as pg  # noqa
+
+pg.init()
+
+from logger import logger  # noqa
+
+import database  # noqa
+from base import Group, Label, Text, WidgetsGroup  # noqa
+from base.fonts import get_font  # noqa
+from base.inbox import inbox  # noqa
+from base.text_wrap import wrap  # noqa
+from database.field_types import ALLOWED_RESOLUTION, Resolution  # noqa
+from game import Player, Room  # noqa
+from game.boss import Boss  # noqa
+from game.character import Character, characters  # noqa
+from game.enemy import Enemy  # noqa
+from game.item import Item  # noqa
+from network import NetworkClient, User  # noqa
+
+T = ty.TypeVar("T")
+
+TEXT = (
+    "Подземелье встречает героев сыростью и тишиной. "
+    "Каждый ход приближает отряд к логову босса, "
+    "но враги не дремлют и охраняют сокровища до последнего вздоха. "
+) * 8
+
+
+class OfflineSocket:
+    def __init__(self, responses: dict[str, ...]):
+        """
+        Соединение с сервером без сервера.
+        Запоминает обработчики и сразу отвечает на известные запросы.
+        :param responses: Ответы сервера: {<событие>: <данные ответа>, ...}.
+        """
+        self.responses = responses
+        self.handlers: dict[str, ty.Callable] = {}
+        self.connected = True
+
+    def on(self, event: str, handler: ty.Callable) -> None:
+        self.handlers[event] = handler
+
+    def emit(self, event: str, *args, **kwargs) -> None:
+        if event in self.responses and event in self.handlers:
+            self.handlers[event](self.responses[event])
+
+    def wait(self) -> None:
+        pass
+
+
+class OfflineNetworkClient(NetworkClient):
+    def __init__(self, user: User, room: Room, friends: list[User]):
+        """
+        Сетевой клиент с синтетическими данными.
+        :param user: Текущий пользователь.
+        :param room: Комната, в которой находится пользователь.
+        :param friends: Друзья пользователя.
+        """
+        super(OfflineNetworkClient, self).__init__()
+        self.user = user
+        self.room = room
+        self.sio = OfflineSocket(
+            {
+                "get social": dict(
+                    me=_user_to_dict(user),
+                    friends=[_user_to_dict(friend) for friend in friends],
+                    friend_requests=[],
+                )
+            }
+        )
+
+
+def _user_to_dict(user: User) -> dict[str, ...]:
+    return dict(
+        uid=user.uid,
+        username=user.username,
+        icon=user.icon,
+        friends=user.friends,
+        friend_requests=user.friend_requests,
+        status=1,
+    )
+
+
+def make_user(uid: int) -> User:
+    return User(uid, f"Player{uid}", 1 + uid % 4, [], [], 1)
+
+
+def make_room(user: User, size: int, enemies: int) -> Room:
+    """
+    Создает комнату с квадратным полем, окруженным стенами.
+    :param user: Текущий пользователь.
+    :param size: Размер поля.
+    :param enemies: Количество врагов.
+    :return: Комната.
+    """
+    locations = os.environ["LOCATIONS_PATH"]
+    room = Room(1)
+    room.game = True
+    room.field = [
+        [0 < i < size - 1 and 0 < j < size - 1 for j in range(size)]
+        for i in range(size)
+    ]
+    room.location_name = (
+        sorted(os.listdir(locations))[0] if os.path.isdir(locations) else "synthetic"
+    )
+    room.location = [[1 + (i * j) % 3 for j in range(size)] for i in range(size)]
+    room.shop = [Item(f"Предмет {i}", 1, 10 * i, "item.png", {}) for i in range(6)]
+
+    for i in range(4):
+        character = (
+            characters[i % len(characters)]
+            if characters
+            else Character("Герой", "character.png", max_hp=10, hp=10)
+        )
+        character = Character(
+            **{**character.__dict__, "items": [None] * 6, "pos": (1 + i, 1)}
+        )
+        room.players.append(
+            Player(
+                user.uid + i,
+                user.username if not i else f"Player{user.uid + i}",
+                1 + i,
+                character=character,
+                character_id=i,
+            )
+        )
+
+    room.boss = Boss("Босс", 100, [size // 2, size // 2], [], "diablo.png")
+    room.enemies = [
+        Enemy(eid, "Враг", 5, 1, 1, 1, (1 + eid % (size - 2), size - 2), "mogus.png")
+        for eid in range(enemies)
+    ]
+    room.queue = f"p{user.uid}"
+    return room
+
+
+def measure(func: ty.Callable[[], ...], repeat: int = 1) -> list[float]:
+    """
+    :param func: Функция.
+    :param repeat: Количество вызовов.
+    :return: Время каждого вызова в миллисекундах.
+    """
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def construct(factory: ty.Callable[[], T]) -> tuple[T, float]:
+    """
+    Ответы сервера, отправленные в основной поток при создании,
+    применяются сразу и входят в замер.
+    :param factory: Функция, создающая объект.
+    :return: Созданный объект и время создания в миллисекундах.
+    """
+    start = time.perf_counter()
+    obj = factory()
+    inbox.run(math.inf)
+    return obj, round((time.perf_counter() - start) * 1000, 4)
+
+
+def summarize(samples: list[float]) -> dict[str, float]:
+    """
+    :param samples: Замеры в миллисекундах.
+    :return: Статистика замеров.
+    """
+    ordered = sorted(samples)
+    return dict(
+        count=len(ordered),
+        mean_ms=round(statistics.fmean(ordered), 4),
+        median_ms=round(statistics.median(ordered), 4),
+        p95_ms=round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 4),
+        max_ms=round(ordered[-1], 4),
+    )
+
+
+def bench_frames(screen: Group, frames: int) -> dict[str, dict[str, float]]:
+    """
+    Замер кадров экрана. Курсор проходит по диагонали окна,
+    поэтому виджеты под ним меняют состояние.
+    :param screen: Экран.
+    :param frames: Количество кадров.
+    :return: Статистика кадров.
+    """
+    width, height = screen.screen.get_size()
+    dirty, full = [], []
+    for i in range(frames):
+        pos = (width * i // frames, height * i // frames)
+        screen.handle_event(
+            pg.event.Event(pg.MOUSEMOTION, pos=pos, rel=(0, 0), buttons=(0, 0, 0))
+        )
+        dirty += measure(screen.render)
+    for _ in range(frames):
+        screen._dirty = True
+        full += measure(screen.render)
+    return dict(frame=summarize(dirty), full_frame=summarize(full))
+
+
+def bench_toolkit(resolution: Resolution) -> dict[str, dict[str, float]]:
+    """
+    Замер базовых виджетов.
+    :param resolution: Разрешение окна.
+    :return: Статистика замеров.
+    """
+    font = get_font(None, int(os.environ["font_size"]))
+    root = Group(name="BenchmarkRoot")
+    group = WidgetsGroup(
+        root, "Benchmark", x=0, y=0, width=resolution.width, height=resolution.height
+    )
+
+    labels = [
+        Label(None, f"Label-{i}", x=(i * 37) % resolution.width, y=i, text=str(i))
+        for i in range(args.widgets)
+    ]
+    add = [measure(lambda: group.add(label))[0] for label in labels]
+
+    batch = WidgetsGroup(
+        root, "Batch", x=0, y=0, width=resolution.width, height=resolution.height
+    )
+    labels = [
+        Label(None, f"Batch-{i}", x=(i * 37) % resolution.width, y=i, text=str(i))
+        for i in range(args.widgets)
+    ]
+    add_batch = measure(lambda: batch.add(*labels))
+
+    def make_text() -> None:
+        Text(
+            None,
+            "Text",
+            x=0,
+            y=0,
+            width=resolution.width // 2,
+            text=TEXT,
+            font=font,
+            soft_split=True,
+        )
+
+    def make_text_cold() -> None:
+        wrap.cache_clear()
+        make_text()
+
+    return dict(
+        group_add=summarize(add),
+        group_add_batch=summarize(add_batch),
+        text_wrap_cold=summarize(measure(make_text_cold, 20)),
+        text_wrap_warm=summarize(measure(make_text, 20)),
+    )
+
+
+def bench_resolution(resolution: Resolution) -> dict[str, ...]:
+    """
+    Замеры для одного разрешения.
+    :param resolution: Разрешение окна.
+    :return: Результаты замеров.
+    """
+    from game_client import GameClientScreen
+    from menu import MenuScreen
+
+    logger.info(f"Разрешение {resolution.width}x{resolution.height}")
+    os.environ["resolution"] = str(resolution)
+
+    user = make_user(1)
+    friends = [make_user(uid) for uid in range(100, 100 + args.friends)]
+    network_client = OfflineNetworkClient(
+        user, make_room(user, args.field_size, args.enemies), friends
+    )
+
+    result = {}
+    menu, construct_ms = construct(lambda: MenuScreen(network_client))
+    result["menu"] = dict(construct_ms=construct_ms, **bench_frames(menu, args.frames))
+
+    result["toolkit"] = bench_toolkit(resolution)
+
+    game, construct_ms = construct(lambda: GameClientScreen(network_client))
+    result["game"] = dict(
+        construct_ms=construct_ms,
+        update_field=summarize(measure(game.field.update_field, args.frames)),
+        **bench_frames(game, args.frames),
+    )
+    return result
+
+
+def main() -> None:
+    results = dict(
+        version=os.environ["VERSION"],
+        python=platform.python_version(),
+        pygame=pg.version.ver,
+        platform=platform.platform(),
+        args=vars(args),
+        resolutions={},
+    )
+    for resolution in ALLOWED_RESOLUTION:
+        results["resolutions"][str(resolution)] = bench_resolution(resolution)
+
+    with open(args.output, "w", encoding="utf-8") as file:
+        json.dump(results, file, ensure_ascii=False, indent=2)
+    logger.info(f"Результаты сохранены в {args.output}")
+
+
+if __name__ == "__main__":
+    main()
+    pg.quit()
@@ -8,6 +8,7 @@ from ..field_types import Resolution, ALLOWED_RESOLUTION
 
 class Config(Table):
     resolution: Resolution = Resolution(1600, 900)
+    fps: int = 60  # Ограничение частоты кадров
 
     @classmethod
     def init(cls) -> None:
@@ -18,6 +19,16 @@ class Config(Table):
         """
         logger.trace("Инициализация конфигурации")
         db = cls(os.environ["DB_PATH"])
+        # Таблица, созданная прошлой версией, не содержит новых полей
+        columns = {
+            column[1]
+            for column in db.api.fetchall(f"PRAGMA table_info({db.table_name})")
+        }
+        for field in cls.get_fields():
+            if field not in columns:
+                logger.debug(f"Добавление поля {field} в таблицу конфигурации")
+                db.add_field(field)
+
         config = db.filter()
         if not config:
             logger.debug("Конфигурация не установлена")
@@ -7,8 +7,10 @@ from inspect import isfunction
 
 import pygame as pg
 
+from base import layout
 from base.events import BaseEvent
 from base.group import Group
+from base.surface_pool import surface_pool
 from base.widget import BaseWidget
 from utils import load_image
 
@@ -307,7 +309,7 @@ class Dice(BaseWidget):
                 round(abs(polygon_[0][1] - polygon_[2][1])) + 1,
             )
 
-        image = pg.Surface(self.rect.size, pg.SRCALPHA, 32).convert_alpha()
+        image = surface_pool.acquire(self.rect.size)
         corners = (
             self.visible_corners
             if self.__dict__.get("in_move")
@@ -331,7 +333,7 @@ class Dice(BaseWidget):
 
     @property
     def x(self) -> int:
-        return self._x(self) if isfunction(self._x) else self._x
+        return layout.evaluate(self, "x", self._x) if isfunction(self._x) else self._x
 
     @x.setter
     def x(self, value: int | CordFunction):
@@ -339,7 +341,7 @@ class Dice(BaseWidget):
 
     @property
     def y(self) -> int:
-        return self._y(self) if isfunction(self._y) else self._y
+        return layout.evaluate(self, "y", self._y) if isfunction(self._y) else self._y
 
     @y.setter
     def y(self, value: int | CordFunction):
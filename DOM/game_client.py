@@ -6,16 +6,33 @@
 
 from __future__ import annotations
 
+import heapq
 import math
 import os
-import time
 import typing as ty
 from dataclasses import dataclass
 
 import pygame as pg
 
-from base import WidgetsGroup, Group, Label, Alert, Button, Anchor, Line, Text, Thread
+from base import (
+    WidgetsGroup,
+    Group,
+    Label,
+    Alert,
+    Button,
+    Anchor,
+    Line,
+    Text,
+    FrameClock,
+)
+from base.atlas import TextureAtlas
 from base.events import ButtonClickEvent
+from base.fonts import get_font
+from base.image_cache import ImageCache
+from base.inbox import inbox
+from base.layout import deferred
+from base.spatial import GridIndex
+from base.timers import call_later, cancel
 from base.widget import BaseWidget
 from database.field_types import Resolution
 from dice import Dice, DiceMovingStop
@@ -30,13 +47,32 @@ if ty.TYPE_CHECKING:
     from game.item import Item
     from game.enemy import Enemy
     from game.boss import Boss
+    from base.timers import Timer
     from base.types import CordFunction
 
+    # Изображение на поле: (<порядок отрисовки>, <изображение>, <положение>)
+    Layer = tuple[tuple[int, int, int, int], pg.Surface, pg.Rect]
+
+PING_LIFETIME = 3  # Время отображения пинга (в секундах)
+HIT_LIFETIME = 2  # Время отображения ударов (в секундах)
+HEAL_INDICATOR_LIFETIME = 2  # Время отображения лечения босса (в секундах)
+MOVE_SPEED = 8  # Скорость перемещения объектов поля (клеток в секунду)
+MAX_MOVE_TIME = 0.4  # Максимальное время перемещения объекта поля (в секундах)
+
+FIELD_DEFAULT_BLOCK_SIZE = 32  # Минимальный размер блока при открытии поля
+FIELD_MIN_BLOCK_SIZE = 8  # Минимальный размер блока при отдалении
+FIELD_MIN_VIEW_CELLS = 5  # Минимальное количество клеток в камере при приближении
+FIELD_ZOOM_STEP = 1.25  # Изменение масштаба за один шаг колеса мыши
+FIELD_CHUNK_SIZE = 256  # Размер куска пола и стен (в пикселях)
+FIELD_CHUNK_CACHE_BYTES = 48 * 1024 * 1024  # Объем кэша кусков пола и стен
+
 
 # ==== MENUS ====
 
 
 class MyQueueAlert(DropMenu):
+    event_types = frozenset({pg.MOUSEBUTTONDOWN})
+
     def __init__(self, parent: WidgetsGroup):
         resolution = Resolution.converter(os.environ["resolution"])
         font_size = int(os.environ["font_size"])
@@ -61,7 +97,7 @@ class MyQueueAlert(DropMenu):
             ),
             y=0,
             text="Ваш ход",
-            font=pg.font.Font(font, font_size),
+            font=get_font(font, font_size),
         )
 
         self.pos = (
@@ -128,7 +164,7 @@ class GameOverStatistic(WidgetsGroup):
             y=0,
             width=self.rect.width - self.padding * 2,
             text=username,
-            font=pg.font.Font(font, font_size),
+            font=get_font(font, font_size),
             anchor=Anchor.center,
         )
 
@@ -144,7 +180,7 @@ class GameOverStatistic(WidgetsGroup):
                     y=y,
                     width=self.rect.width - self.padding * 2,
                     text=f"{self.eng_rus[key]}:  {value}",
-                    font=pg.font.Font(font, round(font_size * 0.8)),
+                    font=get_font(font, round(font_size * 0.8)),
                     anchor=Anchor.center,
                 )
             )
@@ -182,7 +218,7 @@ class GameOverAlert(Alert):
             y=0,
             width=self.rect.width - self.padding * 2,
             text="Игра окончена",
-            font=pg.font.Font(font, font_size),
+            font=get_font(font, font_size),
             anchor=Anchor.center,
         )
 
@@ -204,7 +240,7 @@ class GameOverAlert(Alert):
             text="Выйти",
             padding=5,
             active_background=pg.Color("gray"),
-            font=pg.font.Font(font, font_size),
+            font=get_font(font, font_size),
             anchor=Anchor.center,
             border_width=2,
             callback=lambda event: (
@@ -262,7 +298,7 @@ class EscMenu(Alert):
             y=0,
             width=self.rect.width,
             text="Меню",
-            font=pg.font.Font(font, font_size),
+            font=get_font(font, font_size),
             anchor=Anchor.center,
         )
 
@@ -275,7 +311,7 @@ class EscMenu(Alert):
             text="Продолжить",
             padding=5,
             active_background=pg.Color("gray"),
-            font=pg.font.Font(font, font_size),
+            font=get_font(font, font_size),
             anchor=Anchor.center,
             border_width=2,
             callback=lambda event: self.hide(),
@@ -290,7 +326,7 @@ class EscMenu(Alert):
             text="Настройки",
             padding=5,
             active_background=pg.Color("gray"),
-            font=pg.font.Font(font, font_size),
+            font=get_font(font, font_size),
             anchor=Anchor.center,
             border_width=2,
             callback=lambda event: self.settings.show(),
@@ -305,7 +341,7 @@ class EscMenu(Alert):
             text="Выйти",
             padding=5,
             active_background=pg.Color("gray"),
-            font=pg.font.Font(font, font_size),
+            font=get_font(font, font_size),
             anchor=Anchor.center,
             border_width=2,
             callback=lambda event: (
@@ -319,6 +355,8 @@ class EscMenu(Alert):
 
 
 class ItemDropMenu(DropMenu):
+    event_types = frozenset({pg.MOUSEBUTTONDOWN})
+
     def __init__(self, parent: PlayerWidget, can_remove: True | False):
         """
         Выпадающее меню для предметов.
@@ -355,7 +393,7 @@ class ItemDropMenu(DropMenu):
                 text="Продать",
                 padding=5,
                 active_background=pg.Color("gray"),
-                font=pg.font.Font(font, font_size),
+                font=get_font(font, font_size),
                 anchor=Anchor.center,
                 border_width=2,
                 callback=lambda event: (
@@ -402,27 +440,48 @@ class ItemDropMenu(DropMenu):
 
 @dataclass
 class Ping:
-    # TODO: Пинги перестают исчезать.
-    #  Возможно это связано с тем, что при изменении разрешения создается новый
-    #  Thread Filed._manage_pings
     rect: pg.Rect
-    spawn_time: int
+    timer: Timer  # Таймер исчезновения
+
+
+@dataclass
+class Tween:
+    start: tuple[int, int]  # Положение в начале перемещения
+    end: pg.Rect  # Положение в конце перемещения
+    duration: float  # Время перемещения (в секундах)
+    elapsed: float = 0.0  # Прошедшее время (в секундах)
+    started: True | False = False  # Был ли показан первый кадр перемещения
 
 
 @dataclass
 class EntityWidget:
     icon: pg.Surface
-    rect: pg.Rect
+    rect: pg.Rect  # Отображаемое положение
     data: ...
     indicator: pg.Surface | None
+    tween: Tween | None = None  # Перемещение в новую клетку
+
+    def get_target_rect(self) -> pg.Rect:
+        """
+        :return: Положение объекта после завершения перемещения.
+        """
+        return self.rect if self.tween is None else self.tween.end
 
     def blit(self, surface: pg.Surface) -> None:
         surface.blit(self.icon, self.rect)
         if self.indicator is not None:
-            rect = self.rect.copy()
-            rect.x = round(rect.x + rect.w / 2 - self.indicator.get_width() / 2)
-            rect.y = rect.top - self.indicator.get_height() - 3
-            surface.blit(self.indicator, rect)
+            surface.blit(self.indicator, self.get_indicator_rect())
+
+    def get_indicator_rect(self) -> pg.Rect | None:
+        """
+        :return: Положение индикатора над объектом. None - индикатора нет.
+        """
+        if self.indicator is None:
+            return None
+        rect = self.indicator.get_rect()
+        rect.x = round(self.rect.x + self.rect.w / 2 - self.indicator.get_width() / 2)
+        rect.y = self.rect.top - self.indicator.get_height() - 3
+        return rect
 
 
 @dataclass
@@ -444,9 +503,16 @@ class CharacterWidget(EntityWidget):
 
 
 class Field(WidgetsGroup):
+    event_types = frozenset(
+        {pg.MOUSEWHEEL, pg.MOUSEBUTTONDOWN, pg.MOUSEBUTTONUP, pg.MOUSEMOTION}
+    )
+
     def __init__(self, parent: GameClientScreen):
         """
         Виджет поля.
+        Отображает только видимую область поля (камеру).
+        Колесо мыши изменяет масштаб, перетаскивание правой или средней
+        кнопкой мыши перемещает камеру.
         :param parent: ...
         """
         font = os.environ["FONT"]
@@ -467,6 +533,23 @@ class Field(WidgetsGroup):
             height=height,
         )
 
+        room = self.network_client.room
+        # Сколько клеток помещается в поле по большей стороне.
+        # Маленькое поле помещается целиком, на большом клетки не меньше
+        # FIELD_DEFAULT_BLOCK_SIZE
+        self._view_cells: float = min(
+            max(len(room.field), len(room.field[0])),
+            max(width / FIELD_DEFAULT_BLOCK_SIZE, FIELD_MIN_VIEW_CELLS),
+        )
+        # Видимая область поля в координатах поля
+        self.camera = pg.Rect(0, 0, width, height)
+        self._drag_pos: tuple[int, int] | None = None  # Точка начала перетаскивания
+        # Куски пола и стен: {(<слой>, <строка>, <столбец>): <изображение>}.
+        # В кэш помещаются оба слоя камеры вместе с кусками вокруг нее
+        self._chunks = ImageCache(
+            max(FIELD_CHUNK_CACHE_BYTES, 2 * 4 * (width + FIELD_CHUNK_SIZE * 2) ** 2)
+        )
+
         self._generate_location_map()
 
         self._label = Label(
@@ -479,43 +562,26 @@ class Field(WidgetsGroup):
             sprite=self._field_image,
         )
 
-        self._boss_image = load_image(
-            self.network_client.room.boss.icon,
-            namespace=os.environ["BOSSES_PATH"],
-            size=(None, round(self.block_height * 2)),
-            save_ratio=True,
-        )
-        if self._boss_image.get_width() == 1:
-            # TODO: remove this
-            self._boss_image = load_image(
-                "diablo.png",
-                namespace=os.environ["BOSSES_PATH"],
-                size=(None, round(self.block_height * 2)),
-                save_ratio=True,
-            )
-
         self.boss: BossWidget = ...
         self.enemies: dict[Cord, EnemyWidget] = {}
         self.characters: dict[Cord, CharacterWidget] = {}
+        # Виджеты всех врагов и персонажей, в том числе перекрытых: {<id>: <виджет>}
+        self._enemy_widgets: dict[int, EnemyWidget] = {}
+        self._character_widgets: dict[int, CharacterWidget] = {}
+        # Перемещающиеся объекты: {id(<виджет>): <виджет>}
+        self._moving: dict[int, EntityWidget] = {}
+        # Ключи изображений, нарисованных на поле
+        self._drawn_layers: set[tuple] = set()
         self.ways: dict[Cord, pg.Rect] = {}
-        self._way_image = load_image(
-            "indicator.png",
-            namespace=os.environ["UI_ICONS_PATH"],
-            size=(round(self.block_width), round(self.block_height)),
-        )
         self.hit: dict[Cord, pg.Rect] = {}
-        self._hit_image = load_image(
-            "damage.png",
-            namespace=os.environ["UI_ICONS_PATH"],
-            size=(round(self.block_width), round(self.block_height)),
-        )
-        self._finish_image = load_image(
-            "indicator.png",
-            namespace=os.environ["UI_ICONS_PATH"],
-            size=(round(self.block_width), round(self.block_height)),
-        )
+        self._hit_timer: Timer | None = None  # Таймер исчезновения ударов
         self.finish: pg.Rect = ...
+        # Объекты поля, на которые можно нажать
+        self._hit_index: GridIndex[EntityWidget | pg.Rect] = GridIndex(
+            self.block_width, self.block_height
+        )
 
+        # Надпись уровня не масштабируется и не перемещается вместе с камерой
         self.lvl_label = Label(
             None,
             f"{self.name}-LvlLabel",
@@ -527,118 +593,251 @@ class Field(WidgetsGroup):
             border_color=pg.Color("#b9a66d"),
             border_width=3,
             padding=3,
-            font=pg.font.Font(font, round(self.block_height - 12)),
+            font=get_font(font, round(self.block_height - 12)),
         )
 
-        self._ping_image = load_image(
-            "ping.png",
-            namespace=os.environ["UI_ICONS_PATH"],
-            size=(round(self.block_width), round(self.block_height)),
-        )
         self.pings: dict[Cord, Ping] = {}
 
+        # Камера начинает с персонажа игрока
+        if player := room.get_by_uid(self.network_client.user.uid):
+            self.camera.center = self._get_cell_rect(player.character.pos).center
+            self.camera.clamp_ip(pg.Rect((0, 0), self._world_size))
         self.update_field()
 
-        Thread(self._manage_pings, repetitive=True).run()
-
     def init_ways(self, ways: list[Cords]) -> None:
         self.ways.clear()
         for way in ways:
             for cord in way:
                 cord = tuple(cord)
                 if cord not in self.ways:
-                    self.ways[cord] = pg.Rect(
-                        self.block_width * cord[1],
-                        self.block_height * cord[0],
-                        self.block_width,
-                        self.block_height,
-                    )
+                    self.ways[cord] = self._get_cell_rect(cord)
         self.update_field()
 
     def init_hit(self, cords: list[Cord]) -> None:
         for cord in cords:
             cord = tuple(cord)
             if cord not in self.hit:
-                self.hit[cord] = pg.Rect(
-                    self.block_width * cord[1],
-                    self.block_height * cord[0],
-                    self.block_width,
-                    self.block_height,
-                )
+                self.hit[cord] = self._get_cell_rect(cord)
         self.update_field()
-        Thread(self._delete_hit).run()
+        # Новые удары продлевают отображение всех ударов
+        cancel(self._hit_timer)
+        self._hit_timer = call_later(HIT_LIFETIME, self._delete_hit)
 
     def _delete_hit(self) -> None:
-        time.sleep(2)
+        self._hit_timer = None
         self.hit.clear()
         self.update_field()
 
     def _generate_location_map(self) -> None:
         """
-        Создает картинку поля.
+        Вычисляет размеры блоков для текущего масштаба
+        и загружает изображения нужного размера.
+        Пол и стены рисуются кусками при первом появлении в камере.
         """
-        self.floors: list[tuple[pg.Surface, pg.Rect]] = []  # Элементы пола
-        self.walls: list[list[tuple[pg.Surface, pg.Rect] | None]] = []  # Элементы стен
-
+        room = self.network_client.room
         self.block_width, self.block_height = (
-            self.width / len(self.network_client.room.field[0]),
-            self.height / len(self.network_client.room.field),
+            self.width / min(len(room.field[0]), self._view_cells),
+            self.height / min(len(room.field), self._view_cells),
         )  # Размеры одного блока
+        # Размеры всего поля
+        self._world_size = (
+            round(self.block_width * len(room.field[0])),
+            round(self.block_height * len(room.field)),
+        )
+        self.camera.clamp_ip(pg.Rect((0, 0), self._world_size))
+        self._chunks.clear()
+
+        self._atlas = self._build_atlas()
+        self._way_image = self._atlas["ui_icons", "indicator.png"]
+        self._hit_image = self._atlas["ui_icons", "damage.png"]
+        self._finish_image = self._atlas["ui_icons", "indicator.png"]
+        self._ping_image = self._atlas["ui_icons", "ping.png"]
+
+        self._boss_image = load_image(
+            room.boss.icon,
+            namespace=os.environ["BOSSES_PATH"],
+            size=(None, round(self.block_height * 2)),
+            save_ratio=True,
+        )
+        if self._boss_image.get_width() == 1:
+            # TODO: remove this
+            self._boss_image = load_image(
+                "diablo.png",
+                namespace=os.environ["BOSSES_PATH"],
+                size=(None, round(self.block_height * 2)),
+                save_ratio=True,
+            )
 
-        for i, (board_line, location_line) in enumerate(
-            zip(self.network_client.room.field, self.network_client.room.location)
+    def _build_atlas(self) -> TextureAtlas[tuple[str, str]]:
+        """
+        Собирает плитки локации и иконки поля текущего размера в один атлас.
+        :return: Атлас: {(<директория>, <файл>): <изображение>}.
+        """
+        tile_size = (round(self.block_width) + 1, round(self.block_height * 1.3))
+        images: dict[tuple[str, str], pg.Surface] = {}
+        for board_line, location_line in zip(
+            self.network_client.room.field, self.network_client.room.location
         ):
-            walls_line: list[tuple[pg.Surface, pg.Rect] | None] = []
-            y = self.block_height * i
-            for j, (board_block, location_block) in enumerate(
-                zip(board_line, location_line)
-            ):
-                x = self.block_width * j
-                if board_block is True:  # Если блок - элемента пола
-                    rect = pg.Rect(x, y, self.block_width, self.block_height)
-                    self.floors.append(
-                        (
-                            load_image(
-                                f"floor{location_block}.png",
-                                namespace=os.path.join(
-                                    os.environ["LOCATIONS_PATH"],
-                                    self.network_client.room.location_name,
-                                    "floors",
-                                ),
-                                size=(
-                                    round(self.block_width) + 1,
-                                    round(self.block_height * 1.3),
-                                ),
-                            ),
-                            rect,
-                        )
-                    )
-                    walls_line.append(None)
-                else:  # Если блок - элемент стены
-                    rect = pg.Rect(
-                        x,
-                        y - self.block_height * 0.3,
-                        self.block_width,
-                        self.block_height * 1.3,
+            for board_block, location_block in zip(board_line, location_line):
+                if board_block is True:
+                    key = ("floors", f"floor{location_block}.png")
+                else:
+                    key = ("walls", f"wall{location_block}.png")
+                if key not in images:
+                    images[key] = load_image(
+                        key[1],
+                        namespace=os.path.join(
+                            os.environ["LOCATIONS_PATH"],
+                            self.network_client.room.location_name,
+                            key[0],
+                        ),
+                        size=tile_size,
                     )
-                    walls_line.append(
-                        (
-                            load_image(
-                                f"wall{location_block}.png",
-                                namespace=os.path.join(
-                                    os.environ["LOCATIONS_PATH"],
-                                    self.network_client.room.location_name,
-                                    "walls",
-                                ),
-                                size=(
-                                    round(self.block_width) + 1,
-                                    round(self.block_height * 1.3),
-                                ),
-                            ),
-                            rect,
-                        )
-                    )
-            self.walls.append(walls_line)
+
+        for file_name in ("indicator.png", "damage.png", "ping.png"):
+            images["ui_icons", file_name] = load_image(
+                file_name,
+                namespace=os.environ["UI_ICONS_PATH"],
+                size=(round(self.block_width), round(self.block_height)),
+            )
+        return TextureAtlas(images)
+
+    def _get_cells(self, rect: pg.Rect, margin: int = 0) -> tuple[range, range]:
+        """
+        :param rect: Область в координатах поля.
+        :param margin: Сколько клеток добавить с каждой стороны.
+        :return: Строки и столбцы клеток, которые пересекает область.
+        """
+        room = self.network_client.room
+        return (
+            range(
+                max(0, math.floor(rect.top / self.block_height) - margin),
+                min(
+                    len(room.field),
+                    math.floor((rect.bottom - 1) / self.block_height) + margin + 1,
+                ),
+            ),
+            range(
+                max(0, math.floor(rect.left / self.block_width) - margin),
+                min(
+                    len(room.field[0]),
+                    math.floor((rect.right - 1) / self.block_width) + margin + 1,
+                ),
+            ),
+        )
+
+    def _get_floor(self, i: int, j: int) -> tuple[pg.Surface, pg.Rect] | None:
+        """
+        :param i: Строка.
+        :param j: Столбец.
+        :return: Изображение пола в клетке и его положение. None - в клетке стена.
+        """
+        room = self.network_client.room
+        if room.field[i][j] is not True:
+            return None
+        return self._atlas["floors", f"floor{room.location[i][j]}.png"], pg.Rect(
+            self.block_width * j,
+            self.block_height * i,
+            self.block_width,
+            self.block_height,
+        )
+
+    def _get_wall(self, i: int, j: int) -> tuple[pg.Surface, pg.Rect] | None:
+        """
+        :param i: Строка.
+        :param j: Столбец.
+        :return: Изображение стены в клетке и ее положение. None - в клетке пол.
+        """
+        room = self.network_client.room
+        if room.field[i][j] is True:
+            return None
+        return self._atlas["walls", f"wall{room.location[i][j]}.png"], pg.Rect(
+            self.block_width * j,
+            self.block_height * i - self.block_height * 0.3,
+            self.block_width,
+            self.block_height * 1.3,
+        )
+
+    def _get_wall_layers(self, rect: pg.Rect) -> list[Layer]:
+        """
+        :param rect: Область в координатах поля.
+        :return: Стены, пересекающие область, в порядке отрисовки.
+        """
+        layers: list[Layer] = []
+        rows, columns = self._get_cells(rect, margin=1)
+        for i in rows:
+            for j in columns:
+                if wall := self._get_wall(i, j):
+                    sprite, dest = wall
+                    wall_rect = pg.Rect(dest.topleft, sprite.get_size())
+                    if wall_rect.colliderect(rect):
+                        layers.append(((i, j, 0, 0), sprite, wall_rect))
+        return layers
+
+    def _get_chunk(self, layer: str, row: int, column: int) -> pg.Surface:
+        """
+        Пол и стены не меняются до конца уровня, поэтому рисуются один раз
+        кусками по FIELD_CHUNK_SIZE пикселей. Куски, давно не попадавшие
+        в камеру, вытесняются из кэша.
+        :param layer: "floor" - только пол, "static" - пол и стены.
+        :param row: Строка куска.
+        :param column: Столбец куска.
+        :return: Изображение куска.
+        """
+
+        def draw() -> pg.Surface:
+            rect = self._get_chunk_rect(row, column)
+            if layer == "static":
+                image = self._get_chunk("floor", row, column).copy()
+                for _, sprite, dest in self._get_wall_layers(rect):
+                    image.blit(sprite, dest.move(-rect.x, -rect.y))
+                return image
+
+            image = pg.Surface(rect.size)
+            # Плитки пола выше клетки и перекрывают клетки снизу
+            rows, columns = self._get_cells(rect, margin=1)
+            for i in rows:
+                for j in columns:
+                    if floor := self._get_floor(i, j):
+                        sprite, dest = floor
+                        image.blit(sprite, dest.move(-rect.x, -rect.y))
+            return image
+
+        return self._chunks.get((layer, row, column), draw)
+
+    def _get_chunk_rect(self, row: int, column: int) -> pg.Rect:
+        """
+        :param row: Строка куска.
+        :param column: Столбец куска.
+        :return: Область куска в координатах поля.
+        """
+        return pg.Rect(
+            column * FIELD_CHUNK_SIZE,
+            row * FIELD_CHUNK_SIZE,
+            FIELD_CHUNK_SIZE,
+            FIELD_CHUNK_SIZE,
+        ).clip(pg.Rect((0, 0), self._world_size))
+
+    def _blit_chunks(self, image: pg.Surface, layer: str, rect: pg.Rect) -> None:
+        """
+        Рисует куски слоя, пересекающие область.
+        :param image: Изображение камеры.
+        :param layer: Слой.
+        :param rect: Область в координатах поля.
+        """
+        rect = rect.clip(pg.Rect((0, 0), self._world_size))
+        for row in range(
+            rect.top // FIELD_CHUNK_SIZE, (rect.bottom - 1) // FIELD_CHUNK_SIZE + 1
+        ):
+            for column in range(
+                rect.left // FIELD_CHUNK_SIZE, (rect.right - 1) // FIELD_CHUNK_SIZE + 1
+            ):
+                image.blit(
+                    self._get_chunk(layer, row, column),
+                    self._get_chunk_rect(row, column).move(
+                        -self.camera.x, -self.camera.y
+                    ),
+                )
 
     def update_field(self) -> None:
         """
@@ -647,140 +846,510 @@ class Field(WidgetsGroup):
         if self.network_client.room is ...:
             return
 
-        image = pg.Surface(self._field_image.get_size())
-        for floor_image, floor_rect in self.floors:
-            image.blit(floor_image, floor_rect)
+        self._place_entities()
+        self._redraw()
 
-        rect = pg.Rect(
-            self.block_width * self.network_client.room.boss.pos[1]
-            - self.block_width * 0.5,
-            self.block_height * self.network_client.room.boss.pos[0] - self.block_width,
-            self._boss_image.get_width(),
-            self._boss_image.get_height(),
+    def _redraw(self) -> None:
+        """
+        Рисует видимую область поля заново.
+        """
+        if self.boss is ...:
+            return
+
+        image = pg.Surface(self._field_image.get_size())
+        self._blit_chunks(image, "static", self.camera)
+        # Стены уже нарисованы, но могут перекрывать объекты,
+        # поэтому области объектов рисуются заново в порядке отрисовки
+        layers = self._get_visible_layers()
+        self._draw_regions(
+            image, self._merge_rects([rect for _, _, rect in layers]), layers
         )
+        self._draw_overlay(image)
+        self._drawn_layers = set(map(self._get_layer_id, layers))
+
+        self.field_image = image
+
+    def move_entities(self) -> None:
+        """
+        Отображение перемещения объектов поля.
+        Изображения объектов не загружаются заново, перерисовываются только
+        старые и новые области изменившихся объектов.
+        """
+        if self.network_client.room is ...:
+            return
         if self.boss is ...:
-            self.boss = BossWidget(
-                self._boss_image, rect=rect, data=self.network_client.room.boss
+            self.update_field()
+            return
+
+        self._place_entities()
+        self._redraw_moved()
+
+    def _redraw_moved(self) -> True | False:
+        """
+        Перерисовывает старые и новые области изменившихся объектов.
+        Поле изменяется только в основном потоке, поэтому рисуется на месте,
+        а на экране обновляются только перерисованные области.
+        :return: True - что-то было перерисовано.
+        """
+        layers = self._get_visible_layers()
+        drawn_layers = set(map(self._get_layer_id, layers))
+        regions = self._merge_rects(
+            [pg.Rect(rect) for *_, rect in self._drawn_layers ^ drawn_layers]
+        )
+        if not regions:
+            return False
+
+        image = self._field_image
+        self._draw_regions(image, regions, layers)
+        for region in regions:
+            image.set_clip(region.move(-self.camera.x, -self.camera.y))
+            self._draw_overlay(image)
+        image.set_clip(None)
+        self._drawn_layers = drawn_layers
+
+        self._present(regions)
+        return True
+
+    def _present(self, regions: list[pg.Rect]) -> None:
+        """
+        Переносит области изображения камеры на экран,
+        не перерисовывая виджеты поля целиком.
+        :param regions: Области в координатах поля.
+        """
+        offset = self.padding + self.border_width
+        label_rect = self._label.rect
+        global_rect = self.get_global_rect()
+        view = self._field_image.get_rect()
+        for region in regions:
+            region = region.move(-self.camera.x, -self.camera.y).clip(view)
+            if not region:
+                continue
+            self._label.image.blit(self._field_image, region, region)
+            self.image.blit(
+                self._field_image,
+                region.move(offset + label_rect.x, offset + label_rect.y),
+                region,
+            )
+            self._dirty_rects.append(
+                region.move(
+                    global_rect.x + offset + label_rect.x,
+                    global_rect.y + offset + label_rect.y,
+                )
             )
+
+    def animate(self, delta: float) -> None:
+        """
+        Продвигает перемещения объектов поля между клетками.
+        Положение объекта зависит только от прошедшего времени,
+        поэтому перемещение не зависит от частоты кадров.
+        :param delta: Время с прошлого кадра в секундах.
+        """
+        if not self._moving:
+            return
+
+        for key, entity in list(self._moving.items()):
+            tween = entity.tween
+            if not tween.started:
+                # Время прошлого кадра могло включать ожидание событий в простое
+                tween.started = True
+                continue
+            tween.elapsed += delta
+            progress = min(tween.elapsed / tween.duration, 1.0)
+            progress = progress * progress * (3 - 2 * progress)  # Плавные старт и стоп
+            entity.rect = pg.Rect(
+                round(tween.start[0] + (tween.end.x - tween.start[0]) * progress),
+                round(tween.start[1] + (tween.end.y - tween.start[1]) * progress),
+                tween.end.width,
+                tween.end.height,
+            )
+            if tween.elapsed >= tween.duration:
+                entity.rect, entity.tween = tween.end, None
+                del self._moving[key]
+
+        if not self._redraw_moved():
+            # Кадр без изменений усыпил бы основной цикл до конца перемещения
+            self._present([entity.rect for entity in self._moving.values()])
+
+    def _move_entity(
+        self, entity: EntityWidget, rect: pg.Rect, animate: True | False
+    ) -> None:
+        """
+        Перемещает объект поля.
+        :param entity: Объект.
+        :param rect: Новое положение.
+        :param animate: True - объект плавно перемещается из отображаемого положения.
+            False - объект сразу оказывается в новом положении.
+        """
+        target = entity.rect if entity.rect is ... else entity.get_target_rect()
+        if not animate or target is ... or target.size != rect.size:
+            entity.rect, entity.tween = rect, None
+        elif target.topleft != rect.topleft:
+            distance = math.dist(entity.rect.topleft, rect.topleft) / self.block_width
+            entity.tween = Tween(
+                entity.rect.topleft, rect, min(distance / MOVE_SPEED, MAX_MOVE_TIME)
+            )
+
+    def pan(self, dx: int, dy: int) -> None:
+        """
+        Перемещает камеру.
+        :param dx: Смещение по горизонтали в пикселях.
+        :param dy: Смещение по вертикали в пикселях.
+        """
+        camera = self.camera.move(dx, dy).clamp(pg.Rect((0, 0), self._world_size))
+        if camera.topleft != self.camera.topleft:
+            self.camera = camera
+            # Несколько перемещений за кадр отрисовываются один раз
+            inbox.post(self._redraw, key=(self, "redraw"))
+
+    def zoom(self, steps: int, pos: tuple[int, int] | None = None) -> None:
+        """
+        Изменяет масштаб поля.
+        :param steps: Количество шагов. Положительное значение - приближение.
+        :param pos: Точка в окне, которая остается на месте. None - центр поля.
+        """
+        room = self.network_client.room
+        max_cells = min(
+            max(len(room.field), len(room.field[0])),
+            self.width / FIELD_MIN_BLOCK_SIZE,
+        )
+        view_cells = max(
+            min(FIELD_MIN_VIEW_CELLS, max_cells),
+            min(self._view_cells / FIELD_ZOOM_STEP**steps, max_cells),
+        )
+        if view_cells == self._view_cells:
+            return
+
+        if pos is None:
+            local = (self.camera.width / 2, self.camera.height / 2)
         else:
-            self.boss.rect = rect
-            self.boss.data = self.network_client.room.boss
+            local = self._to_view(pos)
+        # Клетка под точкой
+        cell = (
+            (self.camera.y + local[1]) / self.block_height,
+            (self.camera.x + local[0]) / self.block_width,
+        )
+
+        self._view_cells = view_cells
+        self._generate_location_map()
+        self.camera.topleft = (
+            round(cell[1] * self.block_width - local[0]),
+            round(cell[0] * self.block_height - local[1]),
+        )
+        self.camera.clamp_ip(pg.Rect((0, 0), self._world_size))
+
+        # Положение и изображения объектов зависят от размера блока
+        for cells in (self.ways, self.hit):
+            for cord in cells:
+                cells[cord] = self._get_cell_rect(cord)
+        for cord, ping in self.pings.items():
+            ping.rect = self._get_cell_rect(cord)
+        if self.boss is not ...:
+            self.boss.icon = self._boss_image
+        for enemy in self._enemy_widgets.values():
+            enemy.icon = self._load_enemy_image(enemy.data)
+        for character in self._character_widgets.values():
+            character.icon = self._load_character_image(character.data)
+        # Перемещения в старом масштабе завершаются сразу
+        self._place_entities(animate=False)
+        self._redraw()
 
-        enemies = {enemy.data.eid: enemy for enemy in self.enemies.values()}
-        self.enemies.clear()
-        for enemy in self.network_client.room.enemies:
+    def handle_event(self, event: pg.event.Event) -> None:
+        super(Field, self).handle_event(event)
+        if not self.enabled:
+            return
+        if event.type == pg.MOUSEWHEEL:
+            if self.get_global_rect().collidepoint(pos := pg.mouse.get_pos()):
+                self.zoom(event.y, pos)
+        elif event.type == pg.MOUSEBUTTONDOWN:
+            if event.button in (pg.BUTTON_RIGHT, pg.BUTTON_MIDDLE):
+                if self.get_global_rect().collidepoint(event.pos):
+                    self._drag_pos = event.pos
+        elif event.type == pg.MOUSEBUTTONUP:
+            if event.button in (pg.BUTTON_RIGHT, pg.BUTTON_MIDDLE):
+                self._drag_pos = None
+        elif event.type == pg.MOUSEMOTION and self._drag_pos is not None:
+            self.pan(self._drag_pos[0] - event.pos[0], self._drag_pos[1] - event.pos[1])
+            self._drag_pos = event.pos
+
+    def _get_cell_rect(self, cell: Cord) -> pg.Rect:
+        """
+        :param cell: Клетка.
+        :return: Область клетки в координатах поля.
+        """
+        return pg.Rect(
+            self.block_width * cell[1],
+            self.block_height * cell[0],
+            self.block_width,
+            self.block_height,
+        )
+
+    def _load_enemy_image(self, enemy: Enemy) -> pg.Surface:
+        """
+        :param enemy: Враг.
+        :return: Изображение врага.
+        """
+        enemy_image = load_image(
+            enemy.icon,
+            namespace=os.environ["ENEMIES_PATH"],
+            size=(None, round(self.block_height * 1.25)),
+            save_ratio=True,
+        )
+        if enemy_image.get_width() == 1:
             enemy_image = load_image(
-                enemy.icon,
+                "mogus.png",
                 namespace=os.environ["ENEMIES_PATH"],
                 size=(None, round(self.block_height * 1.25)),
                 save_ratio=True,
             )
-            if enemy_image.get_width() == 1:
-                enemy_image = load_image(
-                    "mogus.png",
-                    namespace=os.environ["ENEMIES_PATH"],
-                    size=(None, round(self.block_height * 1.25)),
-                    save_ratio=True,
-                )
-            rect = pg.Rect(
-                self.block_width * enemy.pos[1]
-                - ((enemy_image.get_width() - self.block_width) / 2),
-                self.block_height * enemy.pos[0] - self.block_width * 0.25,
-                enemy_image.get_width(),
-                enemy_image.get_height(),
-            )
-            if enemy.eid not in enemies:
-                enemy_widget = EnemyWidget(enemy_image, rect=rect, data=enemy)
-            else:
-                enemy_widget = enemies[enemy.eid]
-                enemy_widget.rect = rect
-                enemy_widget.data = enemy
+        return enemy_image
+
+    def _load_character_image(self, player: Player) -> pg.Surface:
+        """
+        :param player: Игрок.
+        :return: Изображение персонажа игрока.
+        """
+        return load_image(
+            player.character.icon,
+            namespace=os.environ["CHARACTERS_PATH"],
+            size=(None, round(self.block_height * 1.5)),
+            save_ratio=True,
+        )
+
+    def _get_entity_rect(self, image: pg.Surface, pos: Cord, lift: float) -> pg.Rect:
+        """
+        :param image: Изображение объекта.
+        :param pos: Клетка объекта.
+        :param lift: На сколько блоков объект поднимается над клеткой.
+        :return: Положение объекта на поле.
+        """
+        return pg.Rect(
+            self.block_width * pos[1] - ((image.get_width() - self.block_width) / 2),
+            self.block_height * pos[0] - self.block_width * lift,
+            image.get_width(),
+            image.get_height(),
+        )
 
-            self.enemies[tuple(enemy.pos)] = enemy_widget
+    def _place_entities(self, animate: True | False = True) -> None:
+        """
+        Расставляет объекты поля по клеткам из данных комнаты.
+        Изображения загружаются только для новых объектов.
+        :param animate: True - объекты, сменившие клетку, перемещаются плавно.
+        """
+        room = self.network_client.room
 
-        characters = {
-            character.data.uid: character for character in self.characters.values()
+        rect = pg.Rect(
+            self.block_width * room.boss.pos[1] - self.block_width * 0.5,
+            self.block_height * room.boss.pos[0] - self.block_width,
+            self._boss_image.get_width(),
+            self._boss_image.get_height(),
+        )
+        if self.boss is ...:
+            self.boss = BossWidget(self._boss_image, rect=rect, data=room.boss)
+        else:
+            self._move_entity(self.boss, rect, animate)
+            self.boss.data = room.boss
+
+        # Объекты в одной клетке перекрывают друг друга, но их виджеты сохраняются
+        enemy_widgets = {}
+        for enemy in room.enemies:
+            if (enemy_widget := self._enemy_widgets.get(enemy.eid)) is None:
+                enemy_image = self._load_enemy_image(enemy)
+                enemy_widget = EnemyWidget(enemy_image, rect=..., data=enemy)
+            self._move_entity(
+                enemy_widget,
+                self._get_entity_rect(enemy_widget.icon, enemy.pos, 0.25),
+                animate,
+            )
+            enemy_widget.data = enemy
+            enemy_widgets[enemy.eid] = enemy_widget
+        self._enemy_widgets = enemy_widgets
+        self.enemies = {
+            tuple(enemy.data.pos): enemy for enemy in enemy_widgets.values()
         }
-        self.characters.clear()
-        for player in self.network_client.room.players:
-            player_image = load_image(
-                player.character.icon,
-                namespace=os.environ["CHARACTERS_PATH"],
-                size=(None, round(self.block_height * 1.5)),
-                save_ratio=True,
+
+        character_widgets = {}
+        for player in room.players:
+            if (character := self._character_widgets.get(player.uid)) is None:
+                player_image = self._load_character_image(player)
+                character = CharacterWidget(player_image, rect=..., data=player)
+            self._move_entity(
+                character,
+                self._get_entity_rect(character.icon, player.character.pos, 0.5),
+                animate,
             )
-            rect = pg.Rect(
-                self.block_width * player.character.pos[1]
-                - ((player_image.get_width() - self.block_width) / 2),
-                self.block_height * player.character.pos[0] - self.block_width * 0.5,
-                player_image.get_width(),
-                player_image.get_height(),
+            character.data = player
+            character_widgets[player.uid] = character
+        self._character_widgets = character_widgets
+        self.characters = {
+            tuple(character.data.character.pos): character
+            for character in character_widgets.values()
+        }
+
+        self._moving = {
+            id(entity): entity
+            for entity in (
+                self.boss,
+                *enemy_widgets.values(),
+                *character_widgets.values(),
             )
-            if player.uid not in characters:
-                character = CharacterWidget(player_image, rect=rect, data=player)
-            else:
-                character = characters[player.uid]
-                character.rect = rect
-                character.data = player
-
-            self.characters[tuple(player.character.pos)] = character
-
-        for i, walls_line in enumerate(self.walls):
-            for j, wall in enumerate(walls_line):
-                if wall:
-                    image.blit(*wall)
-                j -= 1
-                if way := self.ways.get((i, j)):
-                    image.blit(self._way_image, way)
-                if enemy := self.enemies.get((i, j)):
-                    enemy.blit(image)
-                if character := self.characters.get((i, j)):
-                    character.blit(image)
-                if hit := self.hit.get((i, j)):
-                    image.blit(self._hit_image, hit)
-                if tuple(self.boss.data.pos) == (i, j):
-                    if self.boss.data.hp > 0:
-                        self.boss.blit(image)
-                if ping := self.pings.get((i, j)):
-                    image.blit(self._ping_image, ping)
-
-        if self.network_client.room.boss.hp == 0:
+            if entity.tween is not None
+        }
+
+        if room.boss.hp == 0:
             self.finish = pg.Rect(
-                self.block_width * self.network_client.room.field[-1].index(True),
-                self.block_height * (len(self.network_client.room.field) - 1),
+                self.block_width * room.field[-1].index(True),
+                self.block_height * (len(room.field) - 1),
                 self._finish_image.get_width(),
                 self._finish_image.get_height(),
             )
-            image.blit(self._finish_image, self.finish)
 
+        # Порядок добавления определяет приоритет при клике
+        hit_index = GridIndex(self.block_width, self.block_height)
+        if self.boss.data.hp > 0:
+            hit_index.insert(self.boss.get_target_rect(), self.boss)
+        for enemy in self.enemies.values():
+            hit_index.insert(enemy.get_target_rect(), enemy)
+        for character in self.characters.values():
+            hit_index.insert(character.get_target_rect(), character)
+        if self.finish is not ...:
+            hit_index.insert(self.finish, self.finish)
+        self._hit_index = hit_index
+
+    def _draw_regions(
+        self, image: pg.Surface, regions: list[pg.Rect], layers: list[Layer]
+    ) -> None:
+        """
+        Рисует области поля заново: пол, стены и объекты в порядке отрисовки.
+        :param image: Изображение камеры.
+        :param regions: Непересекающиеся области в координатах поля.
+        :param layers: Изображения объектов поля в порядке отрисовки.
+        """
+        rects = [rect for _, _, rect in layers]
+        offset = (-self.camera.x, -self.camera.y)
+        for region in regions:
+            region = region.clip(self.camera)
+            if not region:
+                continue
+            image.set_clip(region.move(offset))
+            self._blit_chunks(image, "floor", region)
+            for _, sprite, dest in heapq.merge(
+                [layers[i] for i in region.collidelistall(rects)],
+                self._get_wall_layers(region),
+                key=lambda layer: layer[0],
+            ):
+                image.blit(sprite, dest.move(offset))
+        image.set_clip(None)
+
+    def _draw_overlay(self, image: pg.Surface) -> None:
+        """
+        Рисует то, что находится поверх объектов поля.
+        :param image: Изображение камеры.
+        """
+        if self.finish is not ...:
+            image.blit(
+                self._finish_image, self.finish.move(-self.camera.x, -self.camera.y)
+            )
         image.blit(self.lvl_label.image, self.lvl_label.rect)
 
-        self.field_image = image
+    @staticmethod
+    def _get_layer_id(layer: Layer) -> tuple:
+        """
+        :param layer: Изображение на поле.
+        :return: Ключ, который не зависит от количества других изображений.
+        """
+        key, sprite, rect = layer
+        return key[:3], sprite, tuple(rect)
 
-    def _manage_pings(self) -> ty.NoReturn:
-        while True:
-            upd = False
-            for pos, ping in self.pings.copy().items():
-                if time.time() - ping.spawn_time > 3:
-                    del self.pings[pos]
-                    upd = True
-            if upd:
-                self.update_field()
+    def _get_dynamic_layers(self) -> list[Layer]:
+        """
+        Объект в клетке (i, j) рисуется после стены в клетке (i, j + 1).
+        Объекты последнего столбца не рисуются.
+        :return: Изображения объектов поля.
+        """
+        width = len(self.network_client.room.field[0])
+        layers: list[Layer] = []
+
+        def add(cell: Cord, order: int, sprite: pg.Surface, dest: pg.Rect) -> None:
+            if cell[1] + 1 < width:
+                rect = pg.Rect(dest.topleft, sprite.get_size())
+                layers.append(
+                    ((cell[0], cell[1] + 1, order, len(layers)), sprite, rect)
+                )
+
+        def add_entity(cell: Cord, order: int, entity: EntityWidget) -> None:
+            add(cell, order, entity.icon, entity.rect)
+            if entity.indicator is not None:
+                add(cell, order, entity.indicator, entity.get_indicator_rect())
+
+        for cell, way in self.ways.items():
+            add(cell, 1, self._way_image, way)
+        for cell, enemy in self.enemies.items():
+            add_entity(cell, 2, enemy)
+        for cell, character in self.characters.items():
+            add_entity(cell, 3, character)
+        for cell, hit in self.hit.items():
+            add(cell, 4, self._hit_image, hit)
+        if self.boss.data.hp > 0:
+            add_entity(tuple(self.boss.data.pos), 5, self.boss)
+        for cell, ping in self.pings.items():
+            add(cell, 6, self._ping_image, ping.rect)
+        return layers
+
+    def _get_visible_layers(self) -> list[Layer]:
+        """
+        :return: Изображения объектов, попадающие в камеру, в порядке отрисовки.
+        """
+        return sorted(
+            (
+                layer
+                for layer in self._get_dynamic_layers()
+                if layer[2].colliderect(self.camera)
+            ),
+            key=lambda layer: layer[0],
+        )
+
+    @staticmethod
+    def _merge_rects(rects: list[pg.Rect]) -> list[pg.Rect]:
+        """
+        :param rects: Области поля.
+        :return: Непересекающиеся и не соприкасающиеся области, покрывающие исходные.
+        """
+        merged: list[pg.Rect] = []
+        for rect in rects:
+            rect = rect.copy()
+            # Соседние области тоже объединяются, чтобы не перерисовывать
+            # общие для них стены несколько раз
+            while (index := rect.inflate(2, 2).collidelist(merged)) != -1:
+                rect.union_ip(merged.pop(index))
+            merged.append(rect)
+        return merged
 
     def spawn_ping(self, y: int, x: int) -> None:
         pos = (y, x)
-        if pos in self.pings:
-            self.pings[pos].spawn_time = int(time.time())
+        if ping := self.pings.get(pos):
+            ping.timer.cancel()
+            ping.timer = call_later(PING_LIFETIME, self._remove_ping, pos)
         else:
-            rect = pg.Rect(
-                self.block_width * x,
-                self.block_height * y,
-                round(self.block_width),
-                round(self.block_height),
+            self.pings[pos] = Ping(
+                self._get_cell_rect(pos),
+                call_later(PING_LIFETIME, self._remove_ping, pos),
             )
-            self.pings[pos] = Ping(rect, int(time.time()))
             self.update_field()
 
+    def _remove_ping(self, pos: Cord) -> None:
+        del self.pings[pos]
+        self.update_field()
+
+    def cancel_timers(self) -> None:
+        """
+        Отменяет таймеры поля. Вызывается перед удалением поля,
+        чтобы таймеры не перерисовывали его и не удерживали в памяти.
+        """
+        cancel(self._hit_timer)
+        self._hit_timer = None
+        for ping in self.pings.values():
+            ping.timer.cancel()
+
     @property
     def field_image(self) -> pg.Surface:
         return self._field_image
@@ -792,7 +1361,11 @@ class Field(WidgetsGroup):
             self._label.sprite = self._field_image
 
     def get_global_rect_of(self, rect: pg.Rect) -> pg.Rect:
-        rect = rect.copy()
+        """
+        :param rect: Область в координатах поля.
+        :return: Область в окне.
+        """
+        rect = rect.move(-self.camera.x, -self.camera.y)
 
         self_rect: pg.Rect = self.get_global_rect()
         rect.x += self_rect.x + self.padding + self.border_width
@@ -800,6 +1373,48 @@ class Field(WidgetsGroup):
 
         return rect
 
+    def _to_view(self, pos: tuple[int, int]) -> tuple[int, int]:
+        """
+        :param pos: Точка в окне.
+        :return: Точка на изображении камеры.
+        """
+        self_rect: pg.Rect = self.get_global_rect()
+        return (
+            pos[0] - self_rect.x - self.padding - self.border_width,
+            pos[1] - self_rect.y - self.padding - self.border_width,
+        )
+
+    def to_local(self, pos: tuple[int, int]) -> tuple[int, int] | None:
+        """
+        :param pos: Точка в окне.
+        :return: Точка на поле с учетом камеры. None - точка вне камеры.
+        """
+        x, y = self._to_view(pos)
+        if 0 <= x < self.camera.width and 0 <= y < self.camera.height:
+            return x + self.camera.x, y + self.camera.y
+
+    def get_cell(self, pos: tuple[int, int]) -> Cord | None:
+        """
+        :param pos: Точка в окне.
+        :return: Клетка поля, в которой находится точка. None - точка вне поля.
+        """
+        if (local := self.to_local(pos)) is None:
+            return None
+        x, y = local
+        room = self.network_client.room
+        cell = (int(y // self.block_height), int(x // self.block_width))
+        if 0 <= cell[0] < len(room.field) and 0 <= cell[1] < len(room.field[0]):
+            return cell
+
+    def get_targets(self, pos: tuple[int, int]) -> list[EntityWidget | pg.Rect]:
+        """
+        :param pos: Точка в окне.
+        :return: Объекты поля под точкой в порядке приоритета.
+        """
+        if (local := self.to_local(pos)) is None:
+            return []
+        return self._hit_index.query(local)
+
 
 # ==== STATS ====
 
@@ -840,7 +1455,7 @@ class StatWidget(WidgetsGroup):
             x=self.icon.rect.right + 5,
             y=lambda obj: self.icon.height / 2 - obj.rect.height / 2,
             text=value,
-            font=pg.font.Font(font, icon_size),
+            font=get_font(font, icon_size),
         )
 
 
@@ -904,22 +1519,23 @@ class StatsWidget(WidgetsGroup):
         Обновляет характеристики.
         :param player: Экземпляр игрока.
         """
-        # Перебор всех характеристик
-        for stat in {
-            "hp",
-            "damage",
-            "attack_range",
-            "armor",
-            "move_speed",
-            "life_abduction",
-            "coins",
-        }:
-            widget: StatWidget = self.__getattribute__(stat)
-            # Если значение изменилось
-            if widget.value.text != (
-                value := str(player.character.__getattribute__(stat))
-            ):
-                widget.value.text = value
+        with deferred():
+            # Перебор всех характеристик
+            for stat in {
+                "hp",
+                "damage",
+                "attack_range",
+                "armor",
+                "move_speed",
+                "life_abduction",
+                "coins",
+            }:
+                widget: StatWidget = self.__getattribute__(stat)
+                # Если значение изменилось
+                if widget.value.text != (
+                    value := str(player.character.__getattribute__(stat))
+                ):
+                    widget.value.text = value
 
 
 # ==== ITEMS ====
@@ -1163,7 +1779,7 @@ class ItemDescription(WidgetsGroup):
                 else None
             ),
             text=item.name,
-            font=pg.font.Font(font, font_size),
+            font=get_font(font, font_size),
             **dict(soft_split=True) if parent.width else {},
         )
 
@@ -1173,7 +1789,7 @@ class ItemDescription(WidgetsGroup):
             x=0,
             y=self.icon.rect.bottom + 5,
             text=f"Цена: {item.price}",
-            font=pg.font.Font(font, font_size),
+            font=get_font(font, font_size),
         )
         self.price_icon_label = Label(
             self,
@@ -1276,11 +1892,13 @@ class ShortPlayerWidget(WidgetsGroup):
                 if f"p{player.uid}" == parent.network_client.room.queue
                 else pg.Color("white")
             ),
-            font=pg.font.Font(font, font_size),
+            font=get_font(font, font_size),
         )
 
 
 class PlayerWidget(WidgetsGroup):
+    event_types = frozenset({pg.MOUSEBUTTONDOWN})
+
     def __init__(
         self,
         parent: Group,
@@ -1304,7 +1922,6 @@ class PlayerWidget(WidgetsGroup):
         icon_size = int(os.environ["icon_size"])
         font = os.environ.get("font")
 
-        self.lock = False
         self.player = player
         self.network_client = network_client
 
@@ -1329,7 +1946,7 @@ class PlayerWidget(WidgetsGroup):
             x=lambda obj: self.icon.rect.right + 5,
             y=lambda obj: self.icon.rect.height / 2 - obj.rect.height / 2,
             text="",
-            font=pg.font.Font(font, font_size),
+            font=get_font(font, font_size),
         )
 
         self.line = Line(
@@ -1352,46 +1969,34 @@ class PlayerWidget(WidgetsGroup):
         Обновляет данные об игроке.
         :param player: Новый экземпляр игрока.
         """
-
-        def wait_unlock():
-            while self.lock:
-                time.sleep(0.1)
-            self.update_data(player)
-
-        if self.lock:
-            return Thread(wait_unlock).run()
-
-        self.lock = True
-
         icon_size = int(os.environ["icon_size"])
 
-        self.player = player
-        self.name = f"{player.username}-Widget"
-        self.icon.sprite = load_image(
-            player.character.icon,
-            namespace=os.environ["CHARACTERS_PATH"],
-            size=(None, icon_size),
-            save_ratio=True,
-        )
-        self.username.text = player.username
-        if self.username.color == pg.Color("red"):
-            color = pg.Color("red")
-        elif f"p{player.uid}" == self.network_client.room.queue:
-            color = pg.Color("#b9a66d")
-        else:
-            color = pg.Color("white")
-        self.username.color = color
-
-        if self.items is ...:
-            self.items = ItemsWidget(self)
-        else:
-            self.items.update_items(self.player)
+        with deferred():
+            self.player = player
+            self.name = f"{player.username}-Widget"
+            self.icon.sprite = load_image(
+                player.character.icon,
+                namespace=os.environ["CHARACTERS_PATH"],
+                size=(None, icon_size),
+                save_ratio=True,
+            )
+            self.username.text = player.username
+            if self.username.color == pg.Color("red"):
+                color = pg.Color("red")
+            elif f"p{player.uid}" == self.network_client.room.queue:
+                color = pg.Color("#b9a66d")
+            else:
+                color = pg.Color("white")
+            self.username.color = color
 
-        if self.stats is not ...:
-            self.remove(self.stats)
-        self.stats = StatsWidget(self)
+            if self.items is ...:
+                self.items = ItemsWidget(self)
+            else:
+                self.items.update_items(self.player)
 
-        self.lock = False
+            if self.stats is not ...:
+                self.remove(self.stats)
+            self.stats = StatsWidget(self)
 
     def handle_event(self, event: pg.event.Event) -> None:
         super(PlayerWidget, self).handle_event(event)
@@ -1517,7 +2122,7 @@ class EnemyMenu(WidgetsGroup):
             x=lambda obj: self.icon.rect.right + 5,
             y=lambda obj: round(self.icon.rect.height / 2 - obj.rect.height / 2),
             text="...",
-            font=pg.font.Font(font, font_size),
+            font=get_font(font, font_size),
         )
 
         self.stats_widget = WidgetsGroup(
@@ -1549,7 +2154,8 @@ class EnemyMenu(WidgetsGroup):
 
     def update_data(self, enemy: Enemy) -> None:
         self.enemy.data.__dict__.update(enemy.__dict__)
-        self.init(self.enemy)
+        with deferred():
+            self.init(self.enemy)
 
     def add_stat(self, icon: str, value: int) -> StatWidget:
         """
@@ -1589,7 +2195,7 @@ class BossSkill(WidgetsGroup):
             y=0,
             width=round(width * 0.8),
             text=f"{index}. " + (skill.get("desc") or ""),
-            font=pg.font.Font(font, font_size),
+            font=get_font(font, font_size),
             soft_split=True,
         )
 
@@ -1668,7 +2274,7 @@ class BossMenu(WidgetsGroup):
             y=lambda obj: round(self.icon.rect.height / 2 - obj.rect.height / 2),
             width=round(self.rect.width - icon_size * 1.5),
             text="...",
-            font=pg.font.Font(font, font_size),
+            font=get_font(font, font_size),
         )
 
         self.hp = StatWidget(
@@ -1731,6 +2337,8 @@ class BossMenu(WidgetsGroup):
 
 
 class ShopMenu(WidgetsGroup):
+    event_types = frozenset({pg.MOUSEBUTTONDOWN})
+
     def __init__(self, parent: GameClientScreen):
         """
         Магазин.
@@ -1773,7 +2381,7 @@ class ShopMenu(WidgetsGroup):
             text="Купить",
             padding=5,
             active_background=pg.Color(222, 222, 222, 100),
-            font=pg.font.Font(font, font_size),
+            font=get_font(font, font_size),
             anchor=Anchor.center,
         )
         self.buy_button.disable()
@@ -1931,7 +2539,7 @@ class GameClientScreen(Group):
         font_size = int(os.environ["font_size"])
         font = os.environ.get("font")
 
-        self.clock = pg.time.Clock()
+        self.clock = FrameClock()
         self.running = True
         self.finish_status = FinishStatus.close
 
@@ -1953,6 +2561,7 @@ class GameClientScreen(Group):
         self.loading_screen.show_message("Загрузка окружения...")
 
         self.field = Field(self)
+        self._heal_timer: Timer | None = None  # Таймер индикатора лечения босса
         self.players_menu = PlayersMenu(self)
         self.shop = ShopMenu(self)
 
@@ -1970,7 +2579,7 @@ class GameClientScreen(Group):
             text="Пропустить ход",
             padding=5,
             active_background=pg.Color(222, 222, 222, 100),
-            font=pg.font.Font(font, font_size),
+            font=get_font(font, font_size),
             anchor=Anchor.center,
             callback=lambda ev: self.network_client.pass_move(
                 self.info_alert.show_message
@@ -2006,114 +2615,149 @@ class GameClientScreen(Group):
         self.my_queue_alert = MyQueueAlert(self.field)
         self.game_over_alert = GameOverAlert(self)
 
+        # Обработчики вызываются в потоке socketio, а виджеты меняются
+        # только в основном потоке. Повторные обновления одного виджета объединяются
+        ui = inbox.wrap
+        update_field = ui(self.field.update_field, key=lambda: self.field.update_field)
+        move_entities = ui(
+            self.field.move_entities, key=lambda: self.field.move_entities
+        )
+        update_player = ui(
+            self.update_player, key=lambda player: (self.update_player, player.uid)
+        )
+
         self.network_client.on_leaving_the_lobby(
-            callback=lambda msg: (
-                self.info_alert.show_message(msg),
-                self.players_menu.update_players(),
-                self.field.update_field(),
+            callback=ui(
+                lambda msg: (
+                    self.info_alert.show_message(msg),
+                    self.players_menu.update_players(),
+                    self.field.update_field(),
+                )
             )
         )
         self.network_client.on_loading_game(
-            callback=lambda: self.loading_screen.show_message(
-                "Переход на новый уровень"
+            callback=ui(
+                lambda: self.loading_screen.show_message("Переход на новый уровень")
             )
         )
-        self.network_client.on_start_game(callback=self.on_start_game)
+        self.network_client.on_start_game(callback=ui(self.on_start_game))
         self.network_client.on_game_over(
-            callback=lambda data: (
-                self.game_over_alert.init(data),
-                self.game_over_alert.show(),
+            callback=ui(
+                lambda data: (
+                    self.game_over_alert.init(data),
+                    self.game_over_alert.show(),
+                )
+            )
+        )
+        self.network_client.on_ping(
+            callback=ui(
+                self.field.spawn_ping, key=lambda y, x: (self.field.spawn_ping, y, x)
             )
         )
-        self.network_client.on_ping(callback=self.field.spawn_ping)
 
         # ITEMS
         self.network_client.on_buying_an_item(
-            callback=lambda item_index, player: (
-                self.shop.items[item_index].sales(),
-                self.update_player(player),
-                (
-                    (self.shop.item_preview.hide(), self.shop.item_preview.disable())
-                    if self.shop.item_desc is not ...
-                    and self.shop.item_desc.item_index == item_index
-                    else ...
-                ),
+            callback=ui(
+                lambda item_index, player: (
+                    self.shop.items[item_index].sales(),
+                    self.update_player(player),
+                    (
+                        (
+                            self.shop.item_preview.hide(),
+                            self.shop.item_preview.disable(),
+                        )
+                        if self.shop.item_desc is not ...
+                        and self.shop.item_desc.item_index == item_index
+                        else ...
+                    ),
+                )
             )
         )
-        self.network_client.on_removing_an_item(callback=self.update_player)
+        self.network_client.on_removing_an_item(callback=update_player)
 
         # MOVING
         self.network_client.on_player_moving(
-            callback=lambda: (
-                self.field.ways.clear(),
-                self.field.update_field(),
-                self.network_client.next(),
+            callback=ui(
+                lambda: (
+                    self.field.ways.clear(),
+                    self.field.move_entities(),
+                    self.network_client.next(),
+                )
             )
         )
-        self.network_client.on_enemy_moving(callback=self.field.update_field)
-        self.network_client.on_boss_moving(callback=self.field.update_field)
+        self.network_client.on_enemy_moving(callback=move_entities)
+        self.network_client.on_boss_moving(callback=move_entities)
 
         # UPDATES
         self.network_client.on_update_players(
-            callback=lambda: list(
-                self.update_player(player)
-                for player in self.network_client.room.players
+            callback=ui(
+                lambda: list(
+                    self.update_player(player)
+                    for player in self.network_client.room.players
+                ),
+                key=lambda: (self, "update players"),
             )
         )
-        self.network_client.on_update_enemies(callback=self.field.update_field)
-        self.network_client.on_boss_heal(callback=self.on_boss_heal)
-        self.network_client.on_set_queue(callback=self.on_set_queue)
+        self.network_client.on_update_enemies(callback=update_field)
+        self.network_client.on_boss_heal(callback=ui(self.on_boss_heal))
+        self.network_client.on_set_queue(callback=ui(self.on_set_queue))
 
         # FIGHT
-        self.network_client.on_fight(callback=self.on_fight)
+        self.network_client.on_fight(callback=ui(self.on_fight))
 
         # HITS
-        self.network_client.on_hit_player(callback=self.update_player)
-        self.network_client.on_kill_player(callback=self.on_kill_player)
+        self.network_client.on_hit_player(callback=update_player)
+        self.network_client.on_kill_player(callback=ui(self.on_kill_player))
         self.network_client.on_hit_enemy(
-            callback=lambda enemy: (
-                self.field.update_field(),
-                (
-                    self.enemy_menu.update_data(enemy)
-                    if not self.enemy_menu.hidden
-                    and self.enemy_menu.enemy is not None
-                    and self.enemy_menu.enemy.data.eid == enemy.eid
-                    else ...
-                ),
+            callback=ui(
+                lambda enemy: (
+                    self.field.update_field(),
+                    (
+                        self.enemy_menu.update_data(enemy)
+                        if not self.enemy_menu.hidden
+                        and self.enemy_menu.enemy is not None
+                        and self.enemy_menu.enemy.data.eid == enemy.eid
+                        else ...
+                    ),
+                )
             )
         )
         self.network_client.on_kill_enemy(
-            callback=lambda eid: (
-                self.field.update_field(),
-                (
-                    (self.enemy_menu.disable(), self.enemy_menu.hide())
-                    if not self.enemy_menu.hidden
-                    and self.enemy_menu.enemy is not None
-                    and self.enemy_menu.enemy.data.eid == eid
-                    else ...
-                ),
+            callback=ui(
+                lambda eid: (
+                    self.field.update_field(),
+                    (
+                        (self.enemy_menu.disable(), self.enemy_menu.hide())
+                        if not self.enemy_menu.hidden
+                        and self.enemy_menu.enemy is not None
+                        and self.enemy_menu.enemy.data.eid == eid
+                        else ...
+                    ),
+                )
             )
         )
         self.network_client.on_hit_boss(
-            callback=lambda boss: (
-                self.boss_menu.hp.value.__setattr__("text", str(boss.hp))
-                if not self.boss_menu.hidden
-                else ...
+            callback=ui(
+                lambda boss: (
+                    self.boss_menu.hp.value.__setattr__("text", str(boss.hp))
+                    if not self.boss_menu.hidden
+                    else ...
+                )
             )
         )
-        self.network_client.on_kill_boss(callback=self.field.update_field)
-        self.network_client.on_hit(callback=self.on_hit)
+        self.network_client.on_kill_boss(callback=update_field)
+        self.network_client.on_hit(callback=ui(self.on_hit))
 
         # CHOICE ENEMY
-        self.network_client.on_need_choice_enemy(self.on_need_choice_enemy)
+        self.network_client.on_need_choice_enemy(ui(self.on_need_choice_enemy))
 
         # ROLLING DICES
-        self.network_client.on_rolling_the_dice(callback=self.rolling_the_dice)
+        self.network_client.on_rolling_the_dice(callback=ui(self.rolling_the_dice))
         self.network_client.on_rolling_the_fight_dice(
-            callback=self.rolling_the_fight_dice
+            callback=ui(self.rolling_the_fight_dice)
         )
         self.network_client.on_boss_rolling_the_dice(
-            callback=self.rolling_the_fight_dice
+            callback=ui(self.rolling_the_fight_dice)
         )
 
         if self.__dict__.get("eids"):
@@ -2134,9 +2778,24 @@ class GameClientScreen(Group):
             *self._right_menu_image.get_size(),
         )
 
+        # Фон окна
+        self._background = pg.Surface(resolution)
+        self._background.fill("#f0f0f0")
+        self._background.blit(self._left_menu_image, self._left_menu_rect)
+        self._background.blit(self._right_menu_image, self._right_menu_rect)
+
     def on_start_game(self) -> None:
+        self._cancel_timers()
         self.__init__()
 
+    def _cancel_timers(self) -> None:
+        """
+        Отменяет таймеры экрана перед его пересозданием или закрытием.
+        """
+        cancel(self._heal_timer)
+        self._heal_timer = None
+        self.field.cancel_timers()
+
     def update_player(self, player: Player) -> None:
         if player.uid == self.players_menu.client_player.player.uid:
             self.players_menu.client_player.update_data(player)
@@ -2225,7 +2884,7 @@ class GameClientScreen(Group):
 
     def on_boss_heal(self) -> None:
         def _remove_indicator():
-            time.sleep(2)
+            self._heal_timer = None
             self.field.boss.indicator = None
             self.field.update_field()
 
@@ -2242,7 +2901,8 @@ class GameClientScreen(Group):
                 "text", str(self.network_client.room.boss.hp)
             )
 
-        Thread(_remove_indicator).run()
+        cancel(self._heal_timer)
+        self._heal_timer = call_later(HEAL_INDICATOR_LIFETIME, _remove_indicator)
 
     def on_need_choice_enemy(self, uid: int, eids: list[int]) -> None:
         icon_size = int(int(os.environ["icon_size"]) * 0.5)
@@ -2265,26 +2925,23 @@ class GameClientScreen(Group):
         self.dices_widget.dice2.move_from_list(movement)
 
     def exec(self) -> str:
+        delta = 0  # Время прошлого кадра в миллисекундах
         while self.running:
-            for event in pg.event.get():
+            for event in self.clock.events():
                 if event.type == pg.QUIT:
                     self.terminate()
                 self.handle_event(event)
                 self.loading_screen.update()
             self.dices_widget.update()
-            self.render()
-            self.clock.tick()
+            self.field.animate(delta / 1000)
+            delta = self.clock.tick(self.render())
+        self._cancel_timers()
         return self.finish_status
 
-    def render(self) -> None:
-        self.screen.fill("#f0f0f0")
-
-        self.screen.blit(self._left_menu_image, self._left_menu_rect)
-        self.screen.blit(self._right_menu_image, self._right_menu_rect)
-
-        self.draw(self.screen)
-
-        pg.display.flip()
+    def render(self) -> list[pg.Rect]:
+        rects = self.draw(self.screen, self._background)
+        pg.display.update(rects)
+        return rects
 
     def terminate(self) -> None:
         self.running = False
@@ -2342,72 +2999,53 @@ class GameClientScreen(Group):
             elif event.type == pg.MOUSEBUTTONDOWN:
                 if event.button == pg.BUTTON_LEFT:
                     if self.field.enabled:
-                        if pg.key.get_mods() & pg.KMOD_ALT:
-                            pos = (
-                                event.pos[1] // round(self.field.block_height),
-                                (event.pos[0] - self.field.rect.left)
-                                // round(self.field.block_width),
-                            )
-                            if self.network_client.room.field[pos[0]][pos[1]]:
-                                self.network_client.ping(*pos)
-                                return
+                        cell = self.field.get_cell(event.pos)
+                        if cell is not None:
+                            if pg.key.get_mods() & pg.KMOD_ALT:
+                                if self.network_client.room.field[cell[0]][cell[1]]:
+                                    self.network_client.ping(*cell)
+                                    return
 
-                        for pos, rect in self.field.ways.items():
-                            if self.field.get_global_rect_of(rect).collidepoint(
-                                event.pos
-                            ):
+                            if cell in self.field.ways:
                                 self.network_client.move(
-                                    *pos, fail_callback=self.info_alert.show_message
+                                    *cell, fail_callback=self.info_alert.show_message
                                 )
 
-                        if self.field.boss is not ...:
-                            if self.field.boss.data.hp > 0:
-                                if self.field.get_global_rect_of(
-                                    self.field.boss.rect
-                                ).collidepoint(event.pos):
-                                    if self.__dict__.get("eids"):
-                                        self.network_client.choice_enemy(
-                                            -1,
-                                            fail_callback=self.info_alert.show_message,
-                                        )
-                                    self.enemy_menu.hide()
-                                    self.player_nemu.hide()
-                                    self.player_nemu.disable()
-                                    self.boss_menu.init(self.field.boss)
-                                    return
-                        for enemy in self.field.enemies.values():
-                            if self.field.get_global_rect_of(enemy.rect).collidepoint(
-                                event.pos
-                            ):
+                        for target in self.field.get_targets(event.pos):
+                            if target is self.field.boss:
                                 if self.__dict__.get("eids"):
                                     self.network_client.choice_enemy(
-                                        enemy.data.eid,
+                                        -1,
+                                        fail_callback=self.info_alert.show_message,
+                                    )
+                                self.enemy_menu.hide()
+                                self.player_nemu.hide()
+                                self.player_nemu.disable()
+                                self.boss_menu.init(self.field.boss)
+                                return
+                            elif isinstance(target, EnemyWidget):
+                                if self.__dict__.get("eids"):
+                                    self.network_client.choice_enemy(
+                                        target.data.eid,
                                         fail_callback=self.info_alert.show_message,
                                     )
                                 self.boss_menu.hide()
                                 self.player_nemu.hide()
                                 self.player_nemu.disable()
-                                self.enemy_menu.init(enemy)
+                                self.enemy_menu.init(target)
                                 return
-                        for player in self.field.characters.values():
-                            if (
-                                player.data.uid
-                                != self.players_menu.client_player.player.uid
-                            ):
-                                if self.field.get_global_rect_of(
-                                    player.rect
-                                ).collidepoint(event.pos):
+                            elif isinstance(target, CharacterWidget):
+                                if (
+                                    target.data.uid
+                                    != self.players_menu.client_player.player.uid
+                                ):
                                     self.boss_menu.hide()
                                     self.enemy_menu.hide()
-                                    self.player_nemu.update_data(player.data)
+                                    self.player_nemu.update_data(target.data)
                                     self.player_nemu.show()
                                     self.player_nemu.enable()
                                     return
-
-                        if self.field.finish is not ...:
-                            if self.field.get_global_rect_of(
-                                self.field.finish
-                            ).collidepoint(event.pos):
+                            elif target is self.field.finish:
                                 self.loading_screen.show_message(
                                     "Переход на новый уровень"
                                 )
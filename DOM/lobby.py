@@ -14,6 +14,8 @@ from loguru import logger
 
 from base import Button, WidgetsGroup, Group, Label, Anchor, Text
 from base.events import ButtonClickEvent
+from base.fonts import get_font
+from base.inbox import inbox
 from database.field_types import Resolution
 from game.character import characters
 from utils import load_image, DropMenu, InfoAlert
@@ -25,6 +27,8 @@ if ty.TYPE_CHECKING:
 
 
 class LobbyInvite(DropMenu):
+    event_types = frozenset()
+
     def __init__(self, parent: WidgetsGroup, msg: str, room_id: int):
         """
         Приглашение в лобби.
@@ -56,7 +60,7 @@ class LobbyInvite(DropMenu):
             y=0,
             width=self.width - self.padding * 2,
             text=msg,
-            font=pg.font.Font(font, font_size),
+            font=get_font(font, font_size),
             soft_split=True,
         )
 
@@ -67,7 +71,7 @@ class LobbyInvite(DropMenu):
             y=self.msg.rect.bottom + 20,
             text="Принять",
             padding=3,
-            font=pg.font.Font(font, font_size),
+            font=get_font(font, font_size),
             active_background=pg.Color(222, 222, 222, 100),
             border_width=3,
         )
@@ -79,7 +83,7 @@ class LobbyInvite(DropMenu):
             y=self.msg.rect.bottom + 20,
             text=" Х ",
             padding=3,
-            font=pg.font.Font(font, font_size),
+            font=get_font(font, font_size),
             active_background=pg.Color(222, 222, 222, 100),
             border_width=3,
         )
@@ -137,7 +141,7 @@ class PlayerWidget(WidgetsGroup):
             y=lambda obj: round(self.rect.height / 2 - obj.rect.height - 2),
             text=player.username,
             color=pg.Color("#f0ce69"),
-            font=pg.font.Font(font, font_size),
+            font=get_font(font, font_size),
         )
 
         self.status = Label(
@@ -150,7 +154,7 @@ class PlayerWidget(WidgetsGroup):
                 if player.is_owner
                 else ("Готов" if player.ready else "Не готов...")
             ),
-            font=pg.font.Font(font, font_size),
+            font=get_font(font, font_size),
         )
 
         if player.character is not ...:
@@ -190,7 +194,7 @@ class Buttons(WidgetsGroup):
             y=0,
             text=" Х ",
             padding=3,
-            font=pg.font.Font(font, font_size),
+            font=get_font(font, font_size),
             active_background=pg.Color(222, 222, 222, 100),
             border_width=3,
         )
@@ -215,13 +219,15 @@ class Buttons(WidgetsGroup):
                 )
             ),
             padding=3,
-            font=pg.font.Font(font, font_size),
+            font=get_font(font, font_size),
             active_background=pg.Color(222, 222, 222, 100),
             border_width=3,
         )
 
 
 class CharacterButton(WidgetsGroup):
+    event_types = frozenset({pg.MOUSEBUTTONDOWN, pg.MOUSEBUTTONUP})
+
     def __init__(
         self, parent: CharactersMenu, y: int, character: Character, character_id: int
     ):
@@ -257,7 +263,7 @@ class CharacterButton(WidgetsGroup):
             x=self.icon.rect.right + 10,
             y=lambda obj: round(self.rect.height / 2 - obj.rect.height / 2),
             text=character.name,
-            font=pg.font.Font(font, font_size),
+            font=get_font(font, font_size),
         )
 
     def handle_event(self, event: pg.event.Event) -> None:
@@ -293,7 +299,7 @@ class CharactersMenu(WidgetsGroup):
             x=0,
             y=0,
             text="Выбор персонажа",
-            font=pg.font.Font(font, font_size),
+            font=get_font(font, font_size),
         )
 
         self.characters = []
@@ -317,6 +323,8 @@ class CharactersMenu(WidgetsGroup):
 
 
 class Lobby(WidgetsGroup):
+    event_types = frozenset({ButtonClickEvent.type})
+
     def __init__(self, parent: Group, network_client: NetworkClient):
         """
         Интерфейс лобби.
@@ -344,13 +352,16 @@ class Lobby(WidgetsGroup):
         self.buttons: Buttons = ...
         self.characters_menu = CharactersMenu(self)
 
+        # Виджеты меняются только в основном потоке
         self.network_client.on_ready(
-            callback=lambda uid: self.on_set_ready(uid, status=True)
+            callback=inbox.wrap(lambda uid: self.on_set_ready(uid, status=True))
         )
         self.network_client.on_no_ready(
-            callback=lambda uid: self.on_set_ready(uid, status=False)
+            callback=inbox.wrap(lambda uid: self.on_set_ready(uid, status=False))
+        )
+        self.network_client.on_character_selection(
+            callback=inbox.wrap(self.on_character_selection)
         )
-        self.network_client.on_character_selection(callback=self.on_character_selection)
 
         self.info_alert = InfoAlert(
             parent, parent_size=resolution, width=int(resolution.width * 0.5)
@@ -17,10 +17,16 @@ class LoggingLevel:
     """
 
     level: str
+    no: int = dataclasses.field(init=False)  # Числовое значение уровня
+
+    def __setattr__(self, key: str, value: ...) -> None:
+        super(LoggingLevel, self).__setattr__(key, value)
+        if key == "level":
+            # Уровень ищется один раз, а не для каждой записи
+            super(LoggingLevel, self).__setattr__("no", logger.level(value).no)
 
     def __call__(self, record: dict) -> bool:
-        level_no = logger.level(self.level).no
-        return record["level"].no >= level_no
+        return record["level"].no >= self.no
 
 
 def update_logging_level(level: str) -> None:
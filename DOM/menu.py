@@ -12,8 +12,10 @@ import typing as ty
 import pygame as pg
 
 from app_info_alert import AppInfoAlert
-from base import Button, WidgetsGroup, Group, Alert, Label
+from base import Button, WidgetsGroup, Group, Alert, Label, FrameClock
 from base.events import ButtonClickEvent
+from base.fonts import get_font
+from base.inbox import inbox
 from database.field_types import Resolution
 from lobby import Lobby, LobbyInvite
 from settings_alert import Settings
@@ -48,7 +50,7 @@ class ExitAlert(Alert):
             ),
             y=0,
             text="Выход",
-            font=pg.font.Font(font, font_size),
+            font=get_font(font, font_size),
         )
 
         self.cancel_button = Button(
@@ -59,7 +61,7 @@ class ExitAlert(Alert):
             text=" X ",
             padding=5,
             active_background=pg.Color(222, 222, 222, 100),
-            font=pg.font.Font(font, int(font_size * 0.7)),
+            font=get_font(font, int(font_size * 0.7)),
             border_width=2,
             callback=lambda event: self.hide(),
         )
@@ -71,7 +73,7 @@ class ExitAlert(Alert):
             text="Выйти из аккаунта",
             padding=5,
             active_background=pg.Color(222, 222, 222, 100),
-            font=pg.font.Font(font, font_size),
+            font=get_font(font, font_size),
             border_width=2,
             callback=lambda event: (
                 parent.terminate(),
@@ -89,7 +91,7 @@ class ExitAlert(Alert):
             text="Выйти из игры",
             padding=5,
             active_background=pg.Color(222, 222, 222, 100),
-            font=pg.font.Font(font, font_size),
+            font=get_font(font, font_size),
             border_width=2,
             callback=lambda event: parent.terminate(),
         )
@@ -175,6 +177,7 @@ class MenuScreen(Group):
 
         self.finish_status: str = FinishStatus.close
         self.running = True
+        self.clock = FrameClock()
 
         self.network_client = (
             self.network_client if hasattr(self, "network_client") else network_client
@@ -193,7 +196,7 @@ class MenuScreen(Group):
             text=" i",
             padding=5,
             active_background=pg.Color("#171717"),
-            font=pg.font.Font(font, font_size),
+            font=get_font(font, font_size),
             border_width=2,
             callback=lambda event: self.app_info_alert.show(),
         )
@@ -219,27 +222,34 @@ class MenuScreen(Group):
             self, f"{self.name}-LoadingScreen", parent_size=resolution
         )
 
-        # Подключаем обработчики событий
-        self.network_client.on_lobby_invite(callback=self.on_lobby_invite)
-        self.network_client.on_joining_the_lobby(callback=self.lobby.init)
+        # Подключаем обработчики событий.
+        # Виджеты меняются только в основном потоке
+        self.network_client.on_lobby_invite(callback=inbox.wrap(self.on_lobby_invite))
+        self.network_client.on_joining_the_lobby(callback=inbox.wrap(self.lobby.init))
         self.network_client.on_leaving_the_lobby(
-            callback=lambda msg: (self.lobby.init(), self.info_alert.show_message(msg))
+            callback=inbox.wrap(
+                lambda msg: (self.lobby.init(), self.info_alert.show_message(msg))
+            )
         )
 
         self.network_client.on_loading_game(
-            callback=lambda: (
-                self.loading_screen.show_message("Запуск игры"),
-                self.update(),
+            callback=inbox.wrap(
+                lambda: (
+                    self.loading_screen.show_message("Запуск игры"),
+                    self.update(),
+                )
             )
         )
         self.network_client.on_start_game(
-            callback=lambda: (
-                self.__setattr__("finish_status", FinishStatus.enter_game),
-                self.terminate(),
+            callback=inbox.wrap(
+                lambda: (
+                    self.__setattr__("finish_status", FinishStatus.enter_game),
+                    self.terminate(),
+                )
             )
         )
 
-        self.network_client.on_error(callback=self.info_alert.show_message)
+        self.network_client.on_error(callback=inbox.wrap(self.info_alert.show_message))
 
         self.back_art = load_image(
             "backart.png", namespace=os.environ["APP_DIR"], size=resolution
@@ -271,7 +281,7 @@ class MenuScreen(Group):
 
     def exec(self) -> str:
         while self.running:
-            for event in pg.event.get():
+            for event in self.clock.events():
                 if event.type == pg.QUIT:
                     self.terminate()
                 elif event.type == ButtonClickEvent.type:
@@ -304,14 +314,13 @@ class MenuScreen(Group):
                             self.app_info_button.show()
 
                 self.handle_event(event)
-            self.render()
+            self.clock.tick(self.render())
         return self.finish_status
 
-    def render(self) -> None:
-        self.screen.blit(self.back_art, self.back_art.get_rect())
-        self.draw(self.screen)
-
-        pg.display.flip()
+    def render(self) -> list[pg.Rect]:
+        rects = self.draw(self.screen, self.back_art)
+        pg.display.update(rects)
+        return rects
 
     def terminate(self) -> None:
         self.running = False
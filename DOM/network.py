@@ -15,6 +15,7 @@ import requests
 import socketio  # noqa
 from loguru import logger
 
+from base.inbox import inbox
 from game import Room, Player
 from game.room import Move
 
@@ -85,7 +86,7 @@ class NetworkClient:
         :param fail_callback: Обработчик ошибки авторизации.
         """
         # Подключаем обработчик
-        self.sio.on(
+        self._on_response(
             "login",
             lambda response: self._on_auth(
                 response,
@@ -111,7 +112,7 @@ class NetworkClient:
         :param success_callback: Обработчик успешной авторизации.
         :param fail_callback: Обработчик ошибки регистрации.
         """
-        self.sio.on(
+        self._on_response(
             "signup",
             lambda response: self._on_auth(
                 response,
@@ -147,7 +148,7 @@ class NetworkClient:
     # ===== FRIENDS =====
 
     def get_social(self, callback: ty.Callable[[list[User], list[User]], ...]) -> None:
-        self.sio.on(
+        self._on_response(
             "get social",
             lambda response: (
                 self.__setattr__("user", User(**response["me"])),
@@ -165,7 +166,7 @@ class NetworkClient:
         success_callback: ty.Callable[[], ...],
         fail_callback: ty.Callable[[str], ...],
     ) -> None:
-        self.sio.on(
+        self._on_response(
             "send friend request",
             lambda response: (
                 (
@@ -237,7 +238,7 @@ class NetworkClient:
     # === CREATE LOBBY ===
 
     def create_lobby(self, callback: ty.Callable[[], ...]) -> None:
-        self.sio.on(
+        self._on_response(
             "create lobby", lambda response: self._on_create_lobby(response, callback)
         )
         self.sio.emit("create lobby")
@@ -254,7 +255,7 @@ class NetworkClient:
 
     def send_invite(self, user: User, fail_callback: ty.Callable[[str], ...]) -> None:
         if self.room is not ...:
-            self.sio.on(
+            self._on_response(
                 "send invite",
                 lambda response: fail_callback(response.get("msg", "Ошибка")),
             )
@@ -286,7 +287,7 @@ class NetworkClient:
         success_callback: ty.Callable[[], ...],
         fail_callback: ty.Callable[[str], ...],
     ) -> None:
-        self.sio.on(
+        self._on_response(
             "join lobby",
             lambda response: self._on_join_lobby(
                 response, success_callback, fail_callback
@@ -401,7 +402,7 @@ class NetworkClient:
     # === START GAME ===
 
     def start_game(self, fail_callback: ty.Callable[[str], ...]) -> None:
-        self.sio.on(
+        self._on_response(
             "start game fail",
             lambda response: fail_callback(response.get("msg", "err")),
         )
@@ -483,7 +484,9 @@ class NetworkClient:
     # === ITEMS ===
 
     def buy_item(self, item_index: int, fail_callback: ty.Callable[[str], ...]) -> None:
-        self.sio.on("buy item", lambda response: fail_callback(response.get("msg")))
+        self._on_response(
+            "buy item", lambda response: fail_callback(response.get("msg"))
+        )
         self.sio.emit(
             "buy item", dict(room_id=self.room.room_id, item_index=item_index)
         )
@@ -526,7 +529,9 @@ class NetworkClient:
     # === MOVING ===
 
     def move(self, y: int, x: int, fail_callback: ty.Callable[[str], ...]) -> None:
-        self.sio.on("move", lambda response: fail_callback(response.get("msg", "Err")))
+        self._on_response(
+            "move", lambda response: fail_callback(response.get("msg", "Err"))
+        )
         self.sio.emit("move", dict(room_id=self.room.room_id, y=y, x=x))
 
     def on_player_moving(self, callback: ty.Callable[[], ...]) -> None:
@@ -571,7 +576,7 @@ class NetworkClient:
     # == ROLL THE DICE ==
 
     def roll_the_dice(self, fail_callback: ty.Callable[[str], ...]) -> None:
-        self.sio.on(
+        self._on_response(
             "roll the dice", lambda response: fail_callback(response.get("msg"))
         )
         self.sio.emit("roll the dice", dict(room_id=self.room.room_id))
@@ -600,7 +605,7 @@ class NetworkClient:
         self.sio.emit("next", dict(room_id=self.room.room_id, command=command))
 
     def pass_move(self, fail_callback: ty.Callable[[str], ...]) -> None:
-        self.sio.on(
+        self._on_response(
             "pass move", lambda response: fail_callback(response.get("msg", "Err"))
         )
         self.sio.emit("pass move", dict(room_id=self.room.room_id))
@@ -632,7 +637,7 @@ class NetworkClient:
     # == FIGHT DICE ==
 
     def roll_the_fight_dice(self, fail_callback: ty.Callable[[str], ...]) -> None:
-        self.sio.on(
+        self._on_response(
             "roll the fight dice", lambda response: fail_callback(response.get("msg"))
         )
         self.sio.emit("roll the fight dice", dict(room_id=self.room.room_id))
@@ -765,7 +770,7 @@ class NetworkClient:
     # == CHOICE ENEMY ==
 
     def choice_enemy(self, eid: int, fail_callback: ty.Callable[[str], ...]) -> None:
-        self.sio.on(
+        self._on_response(
             "choice enemy", lambda response: fail_callback(response.get("msg", "Err"))
         )
         self.sio.emit("choice enemy", dict(room_id=self.room.room_id, eid=eid))
@@ -820,5 +825,17 @@ class NetworkClient:
             + "&".join(f"{k}={v}" for k, v in kwargs.items())
         ).json()
 
+    def _on_response(
+        self, event: str, handler: ty.Callable[[dict[str, ...]], ...]
+    ) -> None:
+        """
+        Подключает обработчик ответа на запрос клиента.
+        Обработчик выполняется в основном потоке, так как вызывает
+        переданные экранами функции, которые изменяют виджеты.
+        :param event: Название события.
+        :param handler: Обработчик ответа сервера.
+        """
+        self.sio.on(event, inbox.wrap(handler))
+
     def connect_handlers(self) -> None:
         self.sio.on("need next", lambda *_: self.next())
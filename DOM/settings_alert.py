@@ -14,6 +14,9 @@ from loguru import logger
 
 from base import Button, WidgetsGroup, Alert, Label
 from base.events import ButtonClickEvent
+from base.fonts import get_font, preload
+from base.image_cache import image_cache
+from base.surface_pool import surface_pool
 from database import Config
 from database.field_types import ALLOWED_RESOLUTION, Resolution
 
@@ -22,6 +25,8 @@ if ty.TYPE_CHECKING:
 
 
 class Settings(Alert):
+    event_types = frozenset({ButtonClickEvent.type})
+
     def __init__(self, parent: Group):
         resolution = Resolution.converter(os.environ["resolution"])
         font_size = int(os.environ["font_size"])
@@ -48,7 +53,7 @@ class Settings(Alert):
             text=" X ",
             padding=5,
             active_background=pg.Color(222, 222, 222, 100),
-            font=pg.font.Font(font, int(font_size * 0.7)),
+            font=get_font(font, int(font_size * 0.7)),
             border_width=2,
             callback=lambda event: self.hide(),
         )
@@ -93,6 +98,9 @@ class Settings(Alert):
 
         Config.update(resolution=resolution)
         self.init_interface_size()
+        # Поверхности и изображения старого размера больше не понадобятся
+        surface_pool.clear()
+        image_cache.clear()
 
         self._tab.parent.__init__()
 
@@ -115,6 +123,21 @@ class Settings(Alert):
             int(30 * (1 + ALLOWED_RESOLUTION.index(resolution) * 0.4))
         )  # Масштабируем размер кнопок в зависимости от размера окна
 
+        # Загружаем шрифты, которые используют интерфейсы при этом разрешении
+        font_size = int(os.environ["font_size"])
+        icon_size = int(os.environ["icon_size"])
+        preload(
+            os.environ.get("font"),
+            {
+                font_size,
+                int(font_size * 0.7),
+                int(font_size * 0.8),
+                round(font_size * 0.8),
+                int(int(font_size * 0.7) * 0.8),
+                int(icon_size * 0.5),
+            },
+        )
+
 
 class ResolutionSetting(WidgetsGroup):
     """
@@ -134,7 +157,7 @@ class ResolutionSetting(WidgetsGroup):
             x=0,
             y=0,
             text="Разрешение:",
-            font=pg.font.Font(font, font_size),
+            font=get_font(font, font_size),
         )
 
         self.btn_low = Button(
@@ -145,7 +168,7 @@ class ResolutionSetting(WidgetsGroup):
             text=" < ",
             padding=2,
             active_background=pg.Color(222, 222, 222, 100),
-            font=pg.font.Font(font, int(font_size * 0.7)),
+            font=get_font(font, int(font_size * 0.7)),
             border_width=2,
         )
 
@@ -156,7 +179,7 @@ class ResolutionSetting(WidgetsGroup):
             y=lambda obj: round(self.btn_low.rect.height / 2 - obj.rect.height / 2),
             text=str(resolution),
             color=pg.Color("#b9a66d"),
-            font=pg.font.Font(font, font_size),
+            font=get_font(font, font_size),
         )
 
         self.btn_up = Button(
@@ -167,7 +190,7 @@ class ResolutionSetting(WidgetsGroup):
             text=" > ",
             padding=2,
             active_background=pg.Color(222, 222, 222, 100),
-            font=pg.font.Font(font, int(font_size * 0.7)),
+            font=get_font(font, int(font_size * 0.7)),
             border_width=2,
         )
 
@@ -24,8 +24,11 @@ from base import (
     Line,
     Alert,
     InputBox,
+    ListView,
 )
 from base.events import ButtonClickEvent
+from base.fonts import get_font
+from base.inbox import inbox
 from database.field_types import Resolution
 from utils import load_image, NickTextFilter, InfoAlert, DropMenu
 
@@ -70,7 +73,7 @@ class FriendDropMenu(DropMenu):
             text="Удалить друга",
             padding=5,
             active_background=pg.Color(222, 222, 222, 100),
-            font=pg.font.Font(font, int(font_size * 0.7)),
+            font=get_font(font, int(font_size * 0.7)),
         )
 
         self.send_invite_button = Button(
@@ -81,7 +84,7 @@ class FriendDropMenu(DropMenu):
             text="Пригласить в группу",
             padding=5,
             active_background=pg.Color(222, 222, 222, 100),
-            font=pg.font.Font(font, int(font_size * 0.7)),
+            font=get_font(font, int(font_size * 0.7)),
         )
 
     def show(self) -> None:
@@ -155,7 +158,7 @@ class UserWidget(WidgetsGroup):
             x=self.icon.rect.right + 30,
             y=0,
             text=user.username,
-            font=pg.font.Font(font, font_size),
+            font=get_font(font, font_size),
         )
 
         self.status = Label(
@@ -165,7 +168,7 @@ class UserWidget(WidgetsGroup):
             y=self.username.rect.bottom + 5,
             text=user.status.text,
             color=pg.Color(user.status.color),
-            font=pg.font.Font(font, int(font_size * 0.8)),
+            font=get_font(font, int(font_size * 0.8)),
         )
 
     def set_status(self, status: UserStatus) -> None:
@@ -179,18 +182,34 @@ class UserWidget(WidgetsGroup):
         self.status.text = status.text
         self.status.color = status.color
 
+    def set_user(self, user: User) -> None:
+        """
+        Привязывает виджет к другому пользователю.
+        Используется при повторном использовании строки списка.
+        :param user: Объект пользователя.
+        """
+        if user.icon != self.user.icon:
+            icon_size = self.icon.rect.width
+            self.icon.sprite = load_image(
+                f"icon_{user.icon}.png",
+                namespace=os.environ["USER_ICONS_PATH"],
+                size=(icon_size - 2, icon_size - 2),
+            )
+        self.user = user
+        self.name = f"{user.username}-UserWidget"
+        self.username.text = user.username
+        self.status.text = user.status.text
+        self.status.color = pg.Color(user.status.color)
+
 
 class FriendWidget(UserWidget):
-    def __init__(
-        self,
-        parent: Social,
-        y: int | CordFunction,
-        user: User,
-    ):
+    event_types = frozenset({ButtonClickEvent.type})
+
+    def __init__(self, parent: Social, user: User):
         """
         Виджет друга.
-        :param parent: Объект к которому принадлежит виджет.
-        :param y: Координата y.
+        Создается без родителя, в список друзей его добавляет ListView.
+        :param parent: Виджет сообщества.
         :param user: Объект пользователя.
         """
         font_size = int(int(os.environ["font_size"]) * 0.7)
@@ -198,18 +217,11 @@ class FriendWidget(UserWidget):
         self.social = parent
 
         super(FriendWidget, self).__init__(
-            None, x=0, y=y, user=user, font_size=font_size
+            None, x=0, y=0, user=user, font_size=font_size
         )
 
         self.drop_menu: FriendDropMenu = ...
 
-    def delete(self) -> None:
-        """
-        Удаляет виджет.
-        """
-        self.parent.remove(self)
-        self.drop_menu.parent.remove(self.drop_menu)
-
     def handle_event(self, event: pg.event.Event) -> None:
         super(FriendWidget, self).handle_event(event)
         if event.type == ButtonClickEvent.type and self.drop_menu is not ...:
@@ -228,7 +240,7 @@ class FriendWidget(UserWidget):
 class FriendRequestWidget(UserWidget):
     def __init__(
         self,
-        parent: FriendRequests,
+        parent: ListView,
         x: int | CordFunction,
         y: int | CordFunction,
         user: User,
@@ -253,7 +265,7 @@ class FriendRequestWidget(UserWidget):
             x,
             y,
             user,
-            width=(parent.rect.width - parent.padding * 2) // 3,
+            width=parent.column_width,
         )
 
         self.ok_button = Button(
@@ -264,7 +276,7 @@ class FriendRequestWidget(UserWidget):
             text=" + ",
             padding=1,
             active_background=pg.Color(222, 222, 222, 100),
-            font=pg.font.Font(font, int(font_size * 0.8)),
+            font=get_font(font, int(font_size * 0.8)),
             callback=lambda event: callback("ok", self),
         )
 
@@ -276,7 +288,7 @@ class FriendRequestWidget(UserWidget):
             text=" - ",
             padding=1,
             active_background=pg.Color(222, 222, 222, 100),
-            font=pg.font.Font(font, int(font_size * 0.8)),
+            font=get_font(font, int(font_size * 0.8)),
             callback=lambda event: callback("cancel", self),
         )
 
@@ -323,7 +335,7 @@ class FriendRequests(Alert):
             text=" X ",
             padding=5,
             active_background=pg.Color(222, 222, 222, 100),
-            font=pg.font.Font(font, int(font_size * 0.7)),
+            font=get_font(font, int(font_size * 0.7)),
             border_width=2,
             callback=lambda event: self.hide(),
         )
@@ -336,7 +348,7 @@ class FriendRequests(Alert):
             ),
             y=0,
             text="Добавить друзей",
-            font=pg.font.Font(font, font_size),
+            font=get_font(font, font_size),
         )
 
         self.username_input = InputBox(
@@ -347,7 +359,7 @@ class FriendRequests(Alert):
             description="Имя пользователя",
             width=int(self.rect.width * 0.8) - self.padding * 2,
             padding=5,
-            font=pg.font.Font(font, font_size),
+            font=get_font(font, font_size),
             inactive_border_color=pg.Color("#b9a66d"),
             active_border_color=pg.Color("#f0ce69"),
             border_width=3,
@@ -363,7 +375,7 @@ class FriendRequests(Alert):
             height=self.username_input.input_line.rect.height,
             text="Найти",
             padding=5,
-            font=pg.font.Font(font, font_size),
+            font=get_font(font, font_size),
             active_background=pg.Color(222, 222, 222, 100),
             border_width=3,
             callback=lambda event: self.send_request(),
@@ -377,10 +389,28 @@ class FriendRequests(Alert):
             ),
             y=self.find_friend_button.rect.bottom + 10,
             text="Запросы в друзья",
-            font=pg.font.Font(font, font_size),
+            font=get_font(font, font_size),
         )
 
-        self.friend_requests = []
+        y = self.title.rect.bottom + 20
+        indent = (self.padding + self.border_width) * 2
+        self.friend_requests = ListView(
+            self,
+            f"{self.name}-FriendRequestsList",
+            x=0,
+            y=y,
+            width=self.rect.width - indent,
+            height=self.rect.height - indent - y,
+            create_row=lambda list_view, user: FriendRequestWidget(
+                list_view,
+                x=0,
+                y=0,
+                user=user,
+                callback=self.manage_friend_request,
+            ),
+            bind_row=lambda widget, user: widget.set_user(user),
+            columns=3,
+        )
 
     def send_request(self) -> None:
         """
@@ -423,24 +453,22 @@ class FriendRequests(Alert):
         Добавляет пользователя в друзья.
         :param widget: Виджет запроса.
         """
-        # Удаляем виджет запроса в друзья
-        self.remove(widget)
-        self.friend_requests.remove(widget)
-        self.parent.update()
+        # Удаляем запрос из списка, виджет может быть привязан к другому запросу
+        user = widget.user
+        self.friend_requests.remove_item(user)
 
-        self.network_client.add_friend(uid=widget.user.uid)
+        self.network_client.add_friend(uid=user.uid)
 
     def delete_friend_request(self, widget: FriendRequestWidget) -> None:
         """
         Отклоняет запрос.
         :param widget: Виджет запроса.
         """
-        # Удаляем виджет запроса в друзья
-        self.remove(widget),
-        self.friend_requests.remove(widget)
-        self.parent.update()
+        # Удаляем запрос из списка, виджет может быть привязан к другому запросу
+        user = widget.user
+        self.friend_requests.remove_item(user)
 
-        self.network_client.delete_friend_request(user=widget.user)
+        self.network_client.delete_friend_request(user=user)
 
 
 class Social(WidgetsGroup):
@@ -489,7 +517,7 @@ class Social(WidgetsGroup):
             x=5,
             y=self.line.rect.bottom + 5,
             text="Сообщество",
-            font=pg.font.Font(font, int(font_size * 0.8)),
+            font=get_font(font, int(font_size * 0.8)),
         )
         self.add_friend_button = Button(
             self,
@@ -498,7 +526,7 @@ class Social(WidgetsGroup):
             y=self.title.rect.top,
             text=" + ",
             color=pg.Color("#b9a66d"),
-            font=pg.font.Font(font, int(font_size * 0.8)),
+            font=get_font(font, int(font_size * 0.8)),
             padding=1,
             active_background=pg.Color(222, 222, 222, 100),
             callback=lambda event: self.friend_requests.show(),
@@ -511,53 +539,68 @@ class Social(WidgetsGroup):
             width=int(resolution.width * 0.5),
         )
 
-        self.friends: list[FriendWidget] = []
+        y = self.title.rect.bottom + 10
+        self.friends = ListView(
+            self,
+            f"{self.name}-FriendsList",
+            x=0,
+            y=y,
+            width=self.rect.width - self.border_width * 2,
+            height=self.rect.height - self.border_width * 2 - y,
+            create_row=self.create_friend_widget,
+            bind_row=lambda widget, user: widget.set_user(user),
+        )
 
-        # Подключаем обработчики событий сообщества
-        network_client.on_delete_friend(callback=self.on_delete_friend)
-        network_client.on_add_friend(callback=self.on_add_friend)
-        network_client.on_change_user_status(callback=self.on_change_user_status)
-        network_client.on_friend_request(callback=self.update_friend_requests)
+        # Подключаем обработчики событий сообщества.
+        # Виджеты меняются только в основном потоке
+        network_client.on_delete_friend(callback=inbox.wrap(self.on_delete_friend))
+        network_client.on_add_friend(callback=inbox.wrap(self.on_add_friend))
+        network_client.on_change_user_status(
+            callback=inbox.wrap(self.on_change_user_status)
+        )
+        # Новый список запросов заменяет еще не отображенный
+        network_client.on_friend_request(
+            callback=inbox.wrap(
+                self.update_friend_requests,
+                key=lambda friend_requests: self.update_friend_requests,
+            )
+        )
 
-        # Обновляем список друзей и запросов в отдельном потоке
+        # Список друзей и запросов загружается по ответу сервера
         self.network_client.get_social(callback=self.load_social)
 
+    def create_friend_widget(self, list_view: ListView, user: User) -> FriendWidget:
+        """
+        Создает строку списка друзей.
+        :param list_view: Список друзей.
+        :param user: Пользователь.
+        :return: Виджет друга.
+        """
+        widget = FriendWidget(self, user=user)
+        list_view.add(widget)
+        widget.drop_menu = FriendDropMenu(
+            widget,
+            f"{widget.user.username}-DropMenu",
+            can_invite=lambda: self.network_client.room is not ...,
+        )
+        return widget
+
     def on_delete_friend(self, user: User) -> None:
         """
         Удаление друга.
         :param user: Пользователь.
         """
-        # Получаем виджет друга
-        widget = [friend for friend in self.friends if friend.user.uid == user.uid][0]
-        # Удаляем виджет друга
-        widget.delete()
-        self.friends.remove(widget)
+        for friend in self.friends.items:
+            if friend.uid == user.uid:
+                self.friends.remove_item(friend)
+                break
 
     def on_add_friend(self, user: User) -> None:
         """
         Добавление друга.
         :param user: Пользователь.
         """
-        widget = FriendWidget(
-            self,
-            y=lambda obj: (
-                self.title.get_global_rect().bottom
-                + 10
-                + (
-                    sum(w.rect.height for w in self.friends[: self.friends.index(obj)])
-                    if obj in self.friends
-                    else 0
-                )
-            ),  # Динамическая координата Y
-            user=user,
-        )
-        self.friends.append(widget)  # Добавляем виджет друга
-        self.add(widget)
-        widget.drop_menu = FriendDropMenu(
-            widget,
-            f"{widget.user.username}-DropMenu",
-            can_invite=lambda: self.network_client.room is not ...,
-        )
+        self.friends.append_item(user)
 
     def on_change_user_status(self, user: User) -> None:
         """
@@ -565,17 +608,20 @@ class Social(WidgetsGroup):
         :param user: Пользователь.
         """
         if user.uid == self.network_client.user.uid:  # Если это текущий пользователь
-            widget = self.user_widget
-        else:
-            # Получаем виджеты пользователь по uid
-            widget = [friend for friend in self.friends if friend.user.uid == user.uid]
-            if not len(widget):
-                return
-            widget = widget[0]
-        try:
-            widget.set_status(user.status)
-        except pg.error:
-            pass
+            try:
+                self.user_widget.set_status(user.status)
+            except pg.error:
+                pass
+            return
+
+        # Виджет друга обновится, если он сейчас отображается
+        for index, friend in enumerate(self.friends.items):
+            if friend.uid == user.uid:
+                try:
+                    self.friends.set_item(index, user)
+                except pg.error:
+                    pass
+                break
 
     def load_social(self, friends: list[User], friend_requests: list[User]) -> None:
         self.user_widget.status.text = self.network_client.user.status.text
@@ -588,67 +634,11 @@ class Social(WidgetsGroup):
         logger.opt(colors=True).trace(
             f"Обновление списка друзей: <y>{self.network_client.user.friends}</y>"
         )
-
-        # Удаляем старые виджеты
-        for friend in self.friends:
-            friend.delete()
-        self.friends.clear()
-
-        # Добавляем новые виджеты
-
-        self.friends = [
-            FriendWidget(
-                self,
-                y=lambda obj: (
-                    self.title.get_global_rect().bottom
-                    + 10
-                    + (
-                        sum(
-                            w.rect.height
-                            for w in self.friends[: self.friends.index(obj)]
-                        )
-                        if obj in self.friends
-                        else 0
-                    )
-                ),  # Динамическая координата Y
-                user=user,
-            )
-            for user in friends
-        ]
-        self.add(*self.friends)
-
-        for widget in self.friends:
-            widget.drop_menu = FriendDropMenu(
-                widget,
-                f"{widget.user.username}-DropMenu",
-                can_invite=lambda: self.network_client.room is not ...,
-            )
+        self.friends.set_items(friends)
 
     def update_friend_requests(self, friend_requests: list[User]) -> None:
         logger.opt(colors=True).trace(
             "Обновление списка запросов в друзья: "
             f"<y>{self.network_client.user.friend_requests}</y>"
         )
-
-        # Удаляем старые виджеты
-        for user in self.friend_requests.friend_requests:
-            self.friend_requests.remove(user)
-        self.friend_requests.friend_requests.clear()
-
-        # Добавляем новые виджеты
-        y = self.friend_requests.title.rect.bottom + 20
-        x = 0
-        for i, user in enumerate(friend_requests):
-            self.friend_requests.friend_requests.append(
-                FriendRequestWidget(
-                    self.friend_requests,
-                    x=x,
-                    y=y,
-                    user=user,
-                    callback=self.friend_requests.manage_friend_request,
-                ),
-            )
-            x += self.friend_requests.friend_requests[-1].rect.width
-            if (i + 1) % 3 == 0:
-                x = 0
-                y += self.friend_requests.friend_requests[-1].rect.height
+        self.friend_requests.friend_requests.set_items(friend_requests)
@@ -22,7 +22,8 @@ import socketio.exceptions  # noqa
 from loguru import logger
 
 import hashing
-from base import Thread, Label, Group, Text, Anchor
+from base import Thread, Label, Group, Text, Anchor, FrameClock
+from base.fonts import get_font
 from utils import FinishStatus, load_image
 
 if ty.TYPE_CHECKING:
@@ -43,6 +44,9 @@ class StartAppScreen(Group):
         self.screen = pg.display.set_mode(self.SIZE, pg.NOFRAME)
         pg.display.set_caption("DOM")
 
+        self._background = pg.Surface(self.SIZE)  # Фон окна
+        self._background.fill("black")
+
         self.label = Label(
             self,
             f"{self.name}-DOMLabel",
@@ -51,7 +55,7 @@ class StartAppScreen(Group):
             text="DOM",
             padding=6,
             color=pg.Color("red"),
-            font=pg.font.Font(None, 60),
+            font=get_font(None, 60),
             border_color=pg.Color("red"),
             border_width=2,
         )
@@ -64,12 +68,13 @@ class StartAppScreen(Group):
             width=self.SIZE[0] - 40,
             text="Запуск клиента",
             color=pg.Color("red"),
-            font=pg.font.Font(None, 30),
+            font=get_font(None, 30),
             anchor=Anchor.center,
             soft_split=True,
         )
 
         self.running = True
+        self.clock = FrameClock()
         self.finish_status: str = FinishStatus.close
 
     def exec(self) -> str:
@@ -82,10 +87,10 @@ class StartAppScreen(Group):
         Thread(self.worker).run()
 
         while self.running:  # Цикл окна
-            for event in pg.event.get():
+            for event in self.clock.events():
                 if event.type == pg.QUIT:
                     self.terminate()
-            self.render()
+            self.clock.tick(self.render())
         return self.finish_status
 
     def worker(self) -> None:
@@ -211,13 +216,14 @@ class StartAppScreen(Group):
 
         self.check_files()
 
-    def render(self) -> None:
+    def render(self) -> list[pg.Rect]:
         """
         Отображает интерфейс.
+        :return: Перерисованные области экрана.
         """
-        self.screen.fill("black")
-        self.draw(self.screen)
-        pg.display.flip()
+        rects = self.draw(self.screen, self._background)
+        pg.display.update(rects)
+        return rects
 
     def terminate(self) -> None:
         """
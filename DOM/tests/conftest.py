@@ -0,0 +1,10 @@
+import os
+import sys
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame as pg  # noqa: E402
+
+pg.init()
+pg.display.set_mode((1, 1))
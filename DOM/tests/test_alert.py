@@ -0,0 +1,49 @@
+"""
+
+Проверка того, что скрытое диалоговое окно не пересчитывает раскладку
+вложенных в него виджетов.
+
+"""
+
+from __future__ import annotations
+
+import pygame as pg
+import pytest
+
+from base import Alert, Label, WidgetsGroup
+from base.widget import BaseWidget
+
+
+@pytest.fixture
+def renders(monkeypatch: pytest.MonkeyPatch) -> list[BaseWidget]:
+    """
+    :return: Виджеты, изображение которых было нарисовано заново.
+    """
+    rendered = []
+    for cls in (WidgetsGroup, Label):
+        method = cls.__dict__["_render"]
+
+        def wrapper(self, method=method):
+            rendered.append(self)
+            return method(self)
+
+        monkeypatch.setattr(cls, "_render", wrapper)
+    return rendered
+
+
+def test_hidden_alert_skips_nested_layout(renders: list[BaseWidget]) -> None:
+    screen = WidgetsGroup(None, x=0, y=0, width=800, height=600)
+    alert = Alert(screen, parent_size=(800, 600), padding=10)
+    group = WidgetsGroup(alert, x=0, y=0)
+    label = Label(group, x=0, y=0, text="...")
+    other = Label(None, x=0, y=30, text="...")
+    renders.clear()
+
+    label.text = "Новый текст"
+    label.x = 20
+    group.add(other)
+    assert renders == []
+
+    alert.show()
+    assert label in renders and group in renders and alert in renders
+    assert label.get_global_rect().x == alert.get_global_rect().x + 10 + 20
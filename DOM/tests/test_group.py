@@ -0,0 +1,99 @@
+"""
+
+Проверка того, что массовое добавление объектов в группу
+требует работы с разметкой, линейной по количеству объектов.
+
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+
+import pygame as pg
+import pytest
+
+from base.group import Group
+from base.widget import BaseWidget
+from base.widgets import WidgetsGroup
+
+SIZES = range(50, 401, 50)
+
+# Количество вызовов update, _get_rect, сравнений и чтений положения виджетов
+calls = Counter()
+
+
+class Cell(BaseWidget):
+    def __init__(self, parent: Group | None, index: int):
+        self.index = index
+        BaseWidget.__init__(self, parent)
+
+    def _get_rect(self) -> pg.Rect:
+        return pg.Rect(self.index * 10, 0, 10, 10)
+
+    def _render(self) -> pg.Surface:
+        return pg.Surface((10, 10))
+
+    @property
+    def rect(self) -> pg.Rect:
+        # Группа вычисляет свои размеры по положениям всех вложенных виджетов
+        calls["rect"] += 1
+        return self._rect
+
+    @rect.setter
+    def rect(self, value: pg.Rect):
+        self._rect = value
+
+    def __eq__(self, other: ...) -> True | False:
+        # Проверка, есть ли объект в группе
+        calls["__eq__"] += 1
+        return self is other
+
+    __hash__ = BaseWidget.__hash__
+
+
+@pytest.fixture(autouse=True)
+def counted(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Подсчитывает вызовы update и _get_rect всех виджетов и групп.
+    """
+
+    def wrap(cls: type, name: str) -> None:
+        method = cls.__dict__[name]
+
+        def wrapper(self, *args, **kwargs):
+            calls[name] += 1
+            return method(self, *args, **kwargs)
+
+        monkeypatch.setattr(cls, name, wrapper)
+
+    for cls in (Cell, WidgetsGroup, BaseWidget, Group):
+        for name in ("update", "_get_rect"):
+            if name in cls.__dict__:
+                wrap(cls, name)
+
+
+def _bulk_add(size: int) -> int:
+    """
+    Добавляет в группу size объектов одним вызовом Group.add.
+    :param size: Количество объектов.
+    :return: Количество вызовов во время добавления.
+    """
+    root = WidgetsGroup(None, x=0, y=0)
+    group = WidgetsGroup(root, x=0, y=0)
+    root.add(group)
+    cells = [Cell(None, i) for i in range(size)]
+
+    calls.clear()
+    group.add(*cells)
+    assert group.objects == cells
+    return sum(calls.values())
+
+
+def test_bulk_add_is_linear() -> None:
+    counts = [_bulk_add(size) for size in SIZES]
+
+    # Каждый следующий шаг добавляет одинаковое количество вызовов
+    steps = {b - a for a, b in zip(counts, counts[1:])}
+    assert len(steps) == 1, counts
+    # Не больше нескольких вызовов на объект
+    assert counts[-1] <= 10 * SIZES[-1], counts
@@ -0,0 +1,49 @@
+"""
+
+Проверка того, что функции координат вычисляются повторно,
+только если изменились прочитанные ими положения или атрибуты виджета.
+
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+
+import pygame as pg
+
+from base import Label, WidgetsGroup
+
+
+def test_evaluate_reuses_values_between_passes() -> None:
+    calls = Counter()
+
+    def below_title(obj: Label) -> int:
+        calls["y"] += 1
+        return title.rect.bottom + 5
+
+    def sprite_width(obj: Label) -> int:
+        calls["width"] += 1
+        return obj.sprite.get_width()
+
+    screen = WidgetsGroup(None, x=0, y=0)
+    title = Label(screen, x=0, y=0, text="Заголовок")
+    icon = Label(
+        screen, x=0, y=below_title, width=sprite_width, sprite=pg.Surface((10, 10))
+    )
+    screen.update()
+    calls.clear()
+
+    # Ничего не изменилось - значения берутся из прошлых проходов
+    screen.update()
+    screen.update()
+    assert calls == {}
+
+    # Изменилось положение, которое прочитала функция
+    title.y = 20
+    assert calls["y"] == 1 and calls["width"] == 0
+    assert icon.rect.top == title.rect.bottom + 5
+
+    # Функция читает атрибут самого виджета
+    icon.sprite = pg.Surface((30, 10))
+    assert calls["width"] == 1
+    assert icon.rect.width == 30
@@ -0,0 +1,37 @@
+"""
+
+Проверка того, что пул переиспользует поверхности только в основном потоке.
+
+"""
+
+from __future__ import annotations
+
+import threading
+
+from base.surface_pool import SurfacePool
+
+
+def _in_thread(func, *args):
+    result = []
+    thread = threading.Thread(target=lambda: result.append(func(*args)))
+    thread.start()
+    thread.join()
+    return result[0]
+
+
+def test_release_in_main_thread() -> None:
+    pool = SurfacePool()
+    surface = pool.acquire((10, 10))
+    pool.release(surface)
+    assert pool.acquire((10, 10)) is surface
+
+
+def test_no_reuse_outside_main_thread() -> None:
+    pool = SurfacePool()
+    surface = pool.acquire((10, 10))
+    _in_thread(pool.release, surface)
+    assert pool.stats()["size"] == 0
+
+    pool.release(surface)
+    assert _in_thread(pool.acquire, (10, 10)) is not surface
+    assert pool.stats()["size"] == 1
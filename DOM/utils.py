@@ -14,6 +14,8 @@ import pygame as pg
 from loguru import logger
 
 from base import Alert, Text, Button, WidgetsGroup, Anchor
+from base.fonts import get_font
+from base.image_cache import image_cache
 from base.text_filters import LengthTextFilter, AlphabetTextFilter
 from database.field_types import Resolution
 
@@ -131,26 +133,45 @@ def load_image(
         _images_cash[path] = image = pg.image.load(path).convert_alpha()
 
     if size is not None:
-        if not save_ratio:
-            image = pg.transform.scale(image, size)
-        else:
-            # Масштабирование с сохранением пропорций
-            base_size = image.get_size()  # Изначальный размер изображения
-            # Изменение ширины
-            delta_w = abs(size[0] - base_size[0]) if size[0] is not None else 0
-            # Изменение высоты
-            delta_h = abs(size[1] - base_size[1]) if size[1] is not None else 0
-            if delta_w > delta_h:
-                # Высчитываем подходящее значение высоты
-                size = (size[0], (size[0] * base_size[1]) / base_size[0])
-            else:
-                # Высчитываем подходящее значение ширины
-                size = ((size[1] * base_size[0]) / base_size[1], size[1])
-            image = pg.transform.scale(image, size)
+        # Масштабированные изображения кэшируются до изменения разрешения
+        image = image_cache.get(
+            (path, tuple(size), save_ratio),
+            lambda: _scale_image(image, size, save_ratio),
+        )
 
     return image
 
 
+def _scale_image(
+    image: pg.Surface,
+    size: tuple[int | None, int | None],
+    save_ratio: True | False,
+) -> pg.Surface:
+    """
+    Масштабирование изображения.
+    :param image: Исходное изображение.
+    :param size: Размер изображения. Описан в load_image.
+    :param save_ratio: True - Сохраняет пропорции при масштабировании.
+    :return: Новое изображение.
+    """
+    if not save_ratio:
+        return pg.transform.scale(image, size)
+
+    # Масштабирование с сохранением пропорций
+    base_size = image.get_size()  # Изначальный размер изображения
+    # Изменение ширины
+    delta_w = abs(size[0] - base_size[0]) if size[0] is not None else 0
+    # Изменение высоты
+    delta_h = abs(size[1] - base_size[1]) if size[1] is not None else 0
+    if delta_w > delta_h:
+        # Высчитываем подходящее значение высоты
+        size = (size[0], (size[0] * base_size[1]) / base_size[0])
+    else:
+        # Высчитываем подходящее значение ширины
+        size = ((size[1] * base_size[0]) / base_size[1], size[1])
+    return pg.transform.scale(image, size)
+
+
 class LoadingAlert(Alert):
     def __init__(
         self,
@@ -189,7 +210,7 @@ class LoadingAlert(Alert):
             y=0,
             width=self.rect.width - self.padding * 2 - self.border_width * 2,
             text="...",
-            font=pg.font.Font(font, font_size),
+            font=get_font(font, font_size),
             anchor=Anchor.center,
             soft_split=True,
         )
@@ -241,13 +262,15 @@ class InfoAlert(LoadingAlert):
             text="ок",
             padding=5,
             active_background=pg.Color(222, 222, 222, 100),
-            font=pg.font.Font(font, font_size),
+            font=get_font(font, font_size),
             border_width=2,
             callback=lambda event: self.hide(),
         )
 
 
 class DropMenu(WidgetsGroup):
+    event_types = frozenset({pg.MOUSEBUTTONDOWN})
+
     def __init__(
         self,
         parent: WidgetsGroup,
@@ -304,7 +327,11 @@ class DropMenu(WidgetsGroup):
             if event.type == pg.MOUSEBUTTONDOWN:
                 if event.button == pg.BUTTON_RIGHT:
                     # Открываем виджет
-                    if self._widget.get_global_rect().collidepoint(event.pos):
+                    # Скрытая строка списка ожидает повторного использования
+                    if (
+                        not self._widget.hidden
+                        and self._widget.get_global_rect().collidepoint(event.pos)
+                    ):
                         self.open(event.pos)
                         return
                 # Скрываем виджет
@@ -366,7 +393,7 @@ class LoadingScreen(Alert):
             y=0,
             width=self.rect.width - self.padding * 2,
             text="...",
-            font=pg.font.Font(font, font_size),
+            font=get_font(font, font_size),
             anchor=Anchor.center,
             soft_split=True,
         )